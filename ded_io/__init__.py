@@ -20,6 +20,7 @@ from .pipeline import Pipeline, PipelineBuilder, ConditionalPipeline
 from .footage_ingest import (
     FootageIngestPipeline,
     ingest_shot,
+    ingest_batch,
     quick_ingest,
     create_ingest_pipeline
 )
@@ -43,6 +44,7 @@ __all__ = [
     # Footage Ingest
     'FootageIngestPipeline',
     'ingest_shot',
+    'ingest_batch',
     'quick_ingest',
     'create_ingest_pipeline',
 ]
@@ -5,9 +5,12 @@ Contains all constants and settings used across the pipeline.
 Updated to follow standard VFX naming convention:
 {shot}_{task}_{element}_v{version}_{rep}_{colorspace}.####.ext
 """
+import atexit
 import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class PipelineConfig:
@@ -29,6 +32,9 @@ class PipelineConfig:
     OUTPUT_FORMAT = "exr"
     OUTPUT_COMPRESSION = "dwaa:15"  # DWAA compression with quality 15
     OUTPUT_BIT_DEPTH = "half"  # 16-bit float
+    # Tile edge for output EXRs (0 = scanline); tiles help tools that read
+    # regions, while full-frame readers like Nuke are faster on scanline
+    OUTPUT_TILE_SIZE = int(os.getenv("DED_PIPE_EXR_TILE_SIZE", "0"))
     
     # Anamorphic and resolution settings
     ANAMORPHIC_SQUEEZE = 2.0
@@ -42,6 +48,21 @@ class PipelineConfig:
     PROXY_COLORSPACE = "sRGB"
     PROXY_CRF = 18  # Quality setting for H.264
     PROXY_PRESET = "medium"
+    PROXY_OCIO_COLORSPACE = "sRGB"  # OCIO target when decoding EXRs in Python
+    
+    # Apply the source-to-target color conversion through a 3D LUT baked
+    # once with OCIO instead of evaluating the OCIO transform per pixel
+    # (needs PyOpenColorIO; the LUT is an approximation of the transform)
+    BAKE_COLOR_LUT = bool(os.getenv("DED_PIPE_BAKE_COLOR_LUT"))
+    COLOR_LUT_SIZE = 65
+    COLOR_LUT_CACHE_DIR = Path(os.getenv(
+        "DED_PIPE_LUT_CACHE",
+        str(Path.home() / ".cache" / "ded-pipe" / "luts")
+    ))
+    
+    # Check frame existence and copy sequences with batched io_uring calls
+    # (needs liburing, Linux 5.6+)
+    USE_IO_URING = bool(os.getenv("DED_PIPE_USE_IO_URING"))
     
     # Asset management
     ASSET_TYPE = "plate"
@@ -90,7 +111,34 @@ class PipelineConfig:
     #         Files: {shot}_{task}_{element}_v{version}_{rep}_{colorspace}.####.ext
     #       Proxy: {shot}_{task}_{element}_v{version}_{rep}_{colorspace}.mov (at version level)
     
-    SHOT_TREE_ROOT = Path("/mnt/c/shottree_test")
+    SHOT_TREE_ROOT = Path(os.getenv("DED_PIPE_SHOT_TREE_ROOT", "/mnt/c/shottree_test"))
+    
+    # Scratch space shared by every stage in this run (see get_temp_root)
+    TEMP_ROOT: Optional[Path] = None
+    KEEP_TEMP_ROOT = bool(os.getenv("DED_PIPE_KEEP_TEMP"))
+    
+    @classmethod
+    def get_temp_root(cls) -> Path:
+        """
+        Get the scratch directory for this run, creating it on first use.
+        
+        Stages put per-shot working directories under this root instead of
+        calling mkdtemp() each time; the whole tree is removed in one go at
+        interpreter exit unless KEEP_TEMP_ROOT is set.
+        
+        Returns:
+            Path to the temp root (e.g. "/tmp/ded_pipe_abc123")
+        """
+        if cls.TEMP_ROOT is None:
+            cls.TEMP_ROOT = Path(tempfile.mkdtemp(prefix="ded_pipe_"))
+            atexit.register(cls._remove_temp_root)
+        return cls.TEMP_ROOT
+    
+    @classmethod
+    def _remove_temp_root(cls):
+        """Remove the run's temp root unless asked to keep it."""
+        if cls.TEMP_ROOT is not None and not cls.KEEP_TEMP_ROOT:
+            shutil.rmtree(cls.TEMP_ROOT, ignore_errors=True)
     
     @classmethod
     def format_shot_name(cls, sequence: str, shot: str) -> str:
@@ -298,3 +346,20 @@ class KitsuConfig:
     # Timeouts
     CONNECTION_TIMEOUT = 30
     READ_TIMEOUT = 120
+    
+    # Cached auth token, reused across runs instead of logging in every time
+    TOKEN_CACHE_FILE = Path(os.getenv(
+        "KITSU_TOKEN_CACHE",
+        str(Path.home() / ".cache" / "ded-pipe" / "kitsu.token")
+    ))
+    
+    # Local record of published previews, so re-runs skip duplicate uploads
+    UPLOAD_LEDGER_FILE = Path(os.getenv(
+        "KITSU_UPLOAD_LEDGER",
+        str(Path.home() / ".cache" / "ded-pipe" / "uploads.sqlite")
+    ))
+    
+    # Adaptive concurrency for preview uploads (AIMD)
+    UPLOAD_INITIAL_CONCURRENCY = 2
+    UPLOAD_MAX_CONCURRENCY = 8
+    UPLOAD_TARGET_LATENCY = 60.0  # seconds
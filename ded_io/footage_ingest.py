@@ -20,7 +20,9 @@ from .stages import (
 
 
 def create_ingest_pipeline(
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    max_parallel: int = 2,
+    fuse_conversion: bool = False
 ) -> Pipeline:
     """
     Create the standard footage ingest pipeline.
@@ -35,15 +37,20 @@ def create_ingest_pipeline(
     
     Args:
         logger: Optional logger instance
+        max_parallel: Sony conversions run at once when ingesting a batch
+        fuse_conversion: Run stages 1 and 2 as one RawToEXRFusedStage, which
+                         transforms DPX frames as they are written and
+                         deletes them afterwards (shots then convert one
+                         tool session each rather than batched)
         
     Returns:
         Configured Pipeline object
     """
-    builder = PipelineBuilder("FootageIngest")
+    builder = PipelineBuilder("FootageIngest", fuse_conversion=fuse_conversion)
     
     # Stage 1: Convert Sony raw to DPX
     builder.add_stage(
-        SonyRawConversionStage(logger=logger)
+        SonyRawConversionStage(logger=logger, max_parallel=max_parallel)
     )
     
     # Stage 2: Apply color transform and scale to EXR
@@ -74,6 +81,42 @@ def create_ingest_pipeline(
     return builder.build()
 
 
+def _build_shot_info(
+    project: str,
+    sequence: str,
+    shot: str,
+    source_file: Path,
+    in_point: int,
+    out_point: int,
+    source_fps: float = 24.0,
+    task_type: str = "pla",
+    element_name: str = "rawPlate",
+    version: int = 1
+) -> ShotInfo:
+    """Create the ShotInfo (with editorial info) for one shot to ingest."""
+    # Create editorial info
+    editorial_info = EditorialCutInfo(
+        sequence=sequence,
+        shot=shot,
+        source_file=Path(source_file),
+        in_point=in_point,
+        out_point=out_point,
+        source_fps=source_fps
+    )
+    
+    # Create shot info with naming convention fields
+    return ShotInfo(
+        project=project,
+        sequence=sequence,
+        shot=shot,
+        editorial_info=editorial_info,
+        source_raw_path=Path(source_file),
+        task_type=task_type,
+        element_name=element_name,
+        version=version
+    )
+
+
 def ingest_shot(
     project: str,
     sequence: str,
@@ -110,26 +153,9 @@ def ingest_shot(
     Returns:
         Pipeline execution summary
     """
-    # Create editorial info
-    editorial_info = EditorialCutInfo(
-        sequence=sequence,
-        shot=shot,
-        source_file=Path(source_file),
-        in_point=in_point,
-        out_point=out_point,
-        source_fps=source_fps
-    )
-    
-    # Create shot info with naming convention fields
-    shot_info = ShotInfo(
-        project=project,
-        sequence=sequence,
-        shot=shot,
-        editorial_info=editorial_info,
-        source_raw_path=Path(source_file),
-        task_type=task_type,
-        element_name=element_name,
-        version=version
+    shot_info = _build_shot_info(
+        project, sequence, shot, source_file, in_point, out_point,
+        source_fps, task_type, element_name, version
     )
     
     # Create pipeline
@@ -145,6 +171,38 @@ def ingest_shot(
     return summary
 
 
+def ingest_batch(
+    project: str,
+    shots_data: list,
+    project_id: Optional[str] = None,
+    max_parallel: int = 2,
+    logger: Optional[logging.Logger] = None
+) -> list:
+    """
+    Ingest a list of shots through one pipeline.
+    
+    Module-level counterpart of FootageIngestPipeline.ingest_batch(), and
+    picklable, so a batch can be split across worker processes.
+    
+    Args:
+        project: Project name
+        shots_data: List of shot dictionaries (see FootageIngestPipeline.ingest_batch)
+        project_id: Kitsu project ID (optional)
+        max_parallel: Sony conversions run at once
+        logger: Optional logger instance
+        
+    Returns:
+        Pipeline execution summary per shot, in input order
+    """
+    pipeline = FootageIngestPipeline(
+        project=project,
+        project_id=project_id,
+        logger=logger,
+        max_parallel=max_parallel
+    )
+    return pipeline.ingest_batch(shots_data)
+
+
 class FootageIngestPipeline:
     """
     High-level interface for footage ingest operations.
@@ -156,7 +214,8 @@ class FootageIngestPipeline:
         self,
         project: str,
         project_id: Optional[str] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        max_parallel: int = 2
     ):
         """
         Initialize footage ingest pipeline.
@@ -165,11 +224,12 @@ class FootageIngestPipeline:
             project: Project name
             project_id: Kitsu project ID
             logger: Optional logger instance
+            max_parallel: Sony conversions run at once in ingest_batch()
         """
         self.project = project
         self.project_id = project_id
         self.logger = logger or self._create_logger()
-        self.pipeline = create_ingest_pipeline(logger=self.logger)
+        self.pipeline = create_ingest_pipeline(logger=self.logger, max_parallel=max_parallel)
         self.processed_shots = []
     
     def _create_logger(self) -> logging.Logger:
@@ -249,17 +309,27 @@ class FootageIngestPipeline:
         """
         Ingest multiple shots from a list of shot data.
         
+        Shots go through the pipeline together, stage by stage, so stages
+        with batch support (e.g. one Sony tool session for all clips) only
+        pay their startup cost once.
+        
         Args:
             shots_data: List of dictionaries with shot information
                        Each dict should contain: sequence, shot, source_file,
                        in_point, out_point, source_fps (optional)
                        Optional: task_type, element_name, version
+        
+        Returns:
+            Pipeline execution summary per shot, in input order
         """
-        results = []
+        results = [None] * len(shots_data)
+        shot_infos = []
+        indices = []
         
-        for shot_data in shots_data:
+        for i, shot_data in enumerate(shots_data):
             try:
-                result = self.ingest_shot(
+                shot_infos.append(_build_shot_info(
+                    project=self.project,
                     sequence=shot_data['sequence'],
                     shot=shot_data['shot'],
                     source_file=Path(shot_data['source_file']),
@@ -269,18 +339,28 @@ class FootageIngestPipeline:
                     task_type=shot_data.get('task_type', 'pla'),
                     element_name=shot_data.get('element_name', 'rawPlate'),
                     version=shot_data.get('version', 1)
-                )
-                results.append(result)
+                ))
+                indices.append(i)
                 
             except Exception as e:
                 self.logger.error(
                     f"Failed to process shot {shot_data.get('shot')}: {str(e)}"
                 )
-                results.append({
+                results[i] = {
                     'shot': shot_data.get('shot'),
                     'success': False,
                     'error': str(e)
-                })
+                }
+        
+        if shot_infos:
+            summaries = self.pipeline.execute_many(
+                shot_infos,
+                stop_on_error=True,
+                project_id=self.project_id
+            )
+            for i, summary in zip(indices, summaries):
+                results[i] = summary
+            self.processed_shots.extend(summaries)
         
         return results
     
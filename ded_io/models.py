@@ -2,13 +2,38 @@
 Data models for the footage ingest pipeline.
 Defines the structure of data passed between pipeline stages.
 """
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+; older
+# interpreters get regular dataclasses
+_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+def _handle_consts():
+    """
+    Get the digital start frame and handle lengths from the config.
+    
+    Read on every call (not cached), so frame ranges always agree with the
+    stages, which read PipelineConfig directly.
+    
+    Returns:
+        Tuple of (DIGITAL_START_FRAME, HEAD_HANDLE_FRAMES, TAIL_HANDLE_FRAMES)
+    """
+    from .config import PipelineConfig
+    return (
+        PipelineConfig.DIGITAL_START_FRAME,
+        PipelineConfig.HEAD_HANDLE_FRAMES,
+        PipelineConfig.TAIL_HANDLE_FRAMES
+    )
+
+
+@_dataclass
 class EditorialCutInfo:
     """Represents editorial cut information for a shot."""
     sequence: str
@@ -20,6 +45,13 @@ class EditorialCutInfo:
     source_fps: float = 24.0
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Derived in __post_init__
+    _source_file_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Cache the string form of the source path for to_dict()."""
+        self._source_file_str = str(self.source_file)
+    
     @property
     def duration_frames(self) -> int:
         """Calculate duration in frames."""
@@ -30,7 +62,7 @@ class EditorialCutInfo:
         return {
             'sequence': self.sequence,
             'shot': self.shot,
-            'source_file': str(self.source_file),
+            'source_file': self._source_file_str,
             'in_point': self.in_point,
             'out_point': self.out_point,
             'source_timecode_start': self.source_timecode_start,
@@ -40,7 +72,7 @@ class EditorialCutInfo:
         }
 
 
-@dataclass
+@_dataclass
 class ShotInfo:
     """Complete shot information including editorial and processing details."""
     project: str
@@ -64,19 +96,25 @@ class ShotInfo:
     output_sequence_path: Optional[Path] = None  # Path to colorspace directory
     output_proxy_path: Optional[Path] = None  # Path to proxy file
     version_container_path: Optional[Path] = None  # Path to version container
+    output_plates_path: Optional[Path] = None  # Path to transformed plates (before publish)
     
     # Status
     processing_status: str = "pending"
     created_at: datetime = field(default_factory=datetime.now)
     
+    # Derived in __post_init__ (the output paths are filled in by stages, so
+    # only the source path is cached)
+    _source_raw_path_str: Optional[str] = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Calculate frame ranges after initialization."""
+        self._source_raw_path_str = str(self.source_raw_path) if self.source_raw_path else None
+        
         if self.last_frame is None:
             # Calculate based on editorial info and handles
-            from .config import PipelineConfig
+            _, head, tail = _handle_consts()
             duration = self.editorial_info.duration_frames
-            handles = PipelineConfig.HEAD_HANDLE_FRAMES + PipelineConfig.TAIL_HANDLE_FRAMES
-            self.total_frames = duration + handles
+            self.total_frames = duration + head + tail
             self.last_frame = self.first_frame + self.total_frames - 1
     
     @property
@@ -177,7 +215,7 @@ class ShotInfo:
             'last_frame': self.last_frame,
             'total_frames': self.total_frames,
             'frame_range': self.frame_range,
-            'source_raw_path': str(self.source_raw_path) if self.source_raw_path else None,
+            'source_raw_path': self._source_raw_path_str,
             'output_sequence_path': str(self.output_sequence_path) if self.output_sequence_path else None,
             'output_proxy_path': str(self.output_proxy_path) if self.output_proxy_path else None,
             'version_container_path': str(self.version_container_path) if self.version_container_path else None,
@@ -187,7 +225,7 @@ class ShotInfo:
         }
 
 
-@dataclass
+@_dataclass
 class ProcessingResult:
     """Result of a pipeline processing stage."""
     stage_name: str
@@ -220,7 +258,7 @@ class ProcessingResult:
         }
 
 
-@dataclass
+@_dataclass
 class ImageSequence:
     """Represents an image sequence."""
     directory: Path
@@ -230,33 +268,123 @@ class ImageSequence:
     last_frame: int
     frame_padding: int = 4
     
+    # Derived in __post_init__
+    _total: int = field(init=False, repr=False, compare=False)
+    _pattern: str = field(init=False, repr=False, compare=False)
+    _full_pattern: Path = field(init=False, repr=False, compare=False)
+    _name_tmpl: str = field(init=False, repr=False, compare=False)
+    _joined_tmpl: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Build the pattern strings once rather than on every access."""
+        self._total = self.last_frame - self.first_frame + 1
+        self._pattern = f"{self.base_name}.%0{self.frame_padding}d.{self.extension}"
+        self._full_pattern = self.directory / self._pattern
+        self._name_tmpl = f"{self.base_name}.{{:0{self.frame_padding}d}}.{self.extension}"
+        self._joined_tmpl = os.path.join(
+            str(self.directory), f"{self.base_name}.%0{self.frame_padding}d.{self.extension}"
+        )
+    
     @property
     def total_frames(self) -> int:
         """Get total number of frames."""
-        return self.last_frame - self.first_frame + 1
+        return self._total
     
     @property
     def pattern(self) -> str:
         """Get the sequence pattern (e.g., 'shot.%04d.exr')."""
-        return f"{self.base_name}.%0{self.frame_padding}d.{self.extension}"
+        return self._pattern
     
     @property
     def full_pattern(self) -> Path:
         """Get full path pattern."""
-        return self.directory / self.pattern
+        return self._full_pattern
+    
+    def get_frame_name(self, frame: int) -> str:
+        """Get the file name (without directory) for a specific frame."""
+        return self._name_tmpl.format(frame)
+    
+    def get_frame_str(self, frame: int) -> str:
+        """Get path for a specific frame as a plain string (no Path object)."""
+        return self._joined_tmpl % (frame,)
     
     def get_frame_path(self, frame: int) -> Path:
         """Get path for a specific frame."""
-        frame_str = str(frame).zfill(self.frame_padding)
-        return self.directory / f"{self.base_name}.{frame_str}.{self.extension}"
+        return Path(self._joined_tmpl % (frame,))
+    
+    def _files_on_disk(self) -> set:
+        """Names of the files in the sequence directory, from one directory read."""
+        try:
+            with os.scandir(self.directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+    
+    def _frames_on_disk(self) -> set:
+        """
+        Frame numbers of this sequence's files on disk, from one directory read.
+        
+        Names are parsed back to numbers (prefix, digits, suffix), so
+        checking a frame range is integer set membership rather than
+        formatting a file name per frame.
+        """
+        prefix = f"{self.base_name}."
+        suffix = f".{self.extension}"
+        start, padding = len(prefix), self.frame_padding
+        frames = set()
+        for name in self._files_on_disk():
+            if not (name.startswith(prefix) and name.endswith(suffix)):
+                continue
+            digits = name[start:len(name) - len(suffix)]
+            # Same digits get_frame_name() would produce for that number
+            if digits.isdigit() and (
+                len(digits) == padding or (len(digits) > padding and digits[0] != '0')
+            ):
+                frames.add(int(digits))
+        return frames
+    
+    def missing_frames(self) -> List[int]:
+        """
+        Find frames of the sequence that are not on disk.
+        
+        Reads the directory once and compares frame numbers in memory,
+        instead of a stat() per frame.
+        """
+        present = self._frames_on_disk()
+        return [
+            frame for frame in range(self.first_frame, self.last_frame + 1)
+            if frame not in present
+        ]
     
     def verify_exists(self) -> List[int]:
-        """Verify which frames exist on disk."""
-        existing_frames = []
-        for frame in range(self.first_frame, self.last_frame + 1):
-            if self.get_frame_path(frame).exists():
-                existing_frames.append(frame)
-        return existing_frames
+        """Verify which frames exist on disk (one directory read)."""
+        from .config import PipelineConfig
+        if PipelineConfig.USE_IO_URING:
+            existing = self.verify_exists_uring()
+            if existing is not None:
+                return existing
+        
+        present = self._frames_on_disk()
+        if not present:
+            return []
+        return [
+            frame for frame in range(self.first_frame, self.last_frame + 1)
+            if frame in present
+        ]
+    
+    def verify_exists_uring(self) -> Optional[List[int]]:
+        """
+        Verify which frames exist with batched io_uring statx calls.
+        
+        Returns:
+            Existing frames, or None if io_uring isn't available
+        """
+        from .util import uring
+        frames = range(self.first_frame, self.last_frame + 1)
+        exists = uring.stat_exists([self.get_frame_str(frame) for frame in frames])
+        if exists is None:
+            return None
+        return [frame for frame, found in zip(frames, exists) if found]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
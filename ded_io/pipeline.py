@@ -8,8 +8,12 @@ from pathlib import Path
 import json
 from datetime import datetime
 
+from .config import PipelineConfig
 from .models import ShotInfo, ProcessingResult
 from .stages.base import PipelineStage
+from .stages.sony_conversion import SonyRawConversionStage
+from .stages.oiio_transform import OIIOColorTransformStage
+from .stages.fused_conversion import RawToEXRFusedStage
 
 
 class Pipeline:
@@ -98,18 +102,7 @@ class Pipeline:
             self.results.append(result)
             
             # Accumulate data from this stage for next stages
-            if result.data:
-                # Map known outputs to expected inputs for next stages
-                if 'dpx_sequence' in result.data:
-                    pipeline_data['input_sequence'] = result.data['dpx_sequence']
-                if 'output_sequence' in result.data:
-                    pipeline_data['input_sequence'] = result.data['output_sequence']
-                    # Also set plates_sequence for ShotTreeOrganizationStage
-                    pipeline_data['plates_sequence'] = result.data['output_sequence']
-                if 'proxy_file' in result.data:
-                    pipeline_data['proxy_file'] = result.data['proxy_file']
-                # Also store all data under stage name for explicit access
-                pipeline_data[f'{stage.name}_output'] = result.data
+            self._accumulate_stage_data(pipeline_data, stage, result)
             
             # Check for errors
             if not result.success:
@@ -140,19 +133,145 @@ class Pipeline:
         
         return summary
     
-    def _build_summary(self, shot_info: ShotInfo, duration: float) -> Dict[str, Any]:
+    def execute_many(
+        self,
+        shot_infos: List[ShotInfo],
+        stop_on_error: bool = True,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the pipeline for several shots, one stage at a time.
+        
+        Each stage receives all shots still in flight through
+        execute_batch(), so stages that can share work across shots
+        (one tool session, concurrent encodes or uploads) get to do so.
+        Data flows between stages per shot exactly as in execute().
+        
+        Args:
+            shot_infos: Shot information objects
+            stop_on_error: Drop a shot from later stages once one of its stages fails
+            **kwargs: Additional arguments passed to all stages
+            
+        Returns:
+            Execution summary per shot, in input order
+        """
+        self.logger.info(f"Starting pipeline: {self.name} for {len(shot_infos)} shots")
+        self.results = []
+        
+        start_time = datetime.now()
+        pipeline_data = [dict(kwargs) for _ in shot_infos]
+        shot_results: List[List[ProcessingResult]] = [[] for _ in shot_infos]
+        active = list(range(len(shot_infos)))
+        
+        for shot_info in shot_infos:
+            shot_info.processing_status = "processing"
+        
+        for i, stage in enumerate(self.stages):
+            if not active:
+                break
+            
+            self.logger.info(
+                f"Executing stage {i+1}/{len(self.stages)}: {stage.name} ({len(active)} shots)"
+            )
+            
+            results = stage.execute_batch(
+                [shot_infos[j] for j in active],
+                kwargs_list=[pipeline_data[j] for j in active]
+            )
+            
+            still_active = []
+            for j, result in zip(active, results):
+                shot_results[j].append(result)
+                self.results.append(result)
+                self._accumulate_stage_data(pipeline_data[j], stage, result)
+                
+                if not result.success:
+                    shot_infos[j].processing_status = "error"
+                    if stop_on_error:
+                        self.logger.error(
+                            f"{shot_infos[j].shot_name}: stopped due to error in stage: {stage.name}"
+                        )
+                        continue
+                    self.logger.warning(
+                        f"{shot_infos[j].shot_name}: stage {stage.name} failed but continuing"
+                    )
+                still_active.append(j)
+            active = still_active
+        
+        duration = (datetime.now() - start_time).total_seconds()
+        
+        summaries = []
+        for shot_info, results in zip(shot_infos, shot_results):
+            if shot_info.processing_status != "error":
+                shot_info.processing_status = "complete"
+            summaries.append(self._build_summary(shot_info, duration, results))
+        
+        succeeded = sum(1 for s in summaries if s['overall_success'])
+        self.logger.info(f"Pipeline {self.name} completed in {duration:.2f} seconds")
+        self.logger.info(f"Shots succeeded: {succeeded}/{len(shot_infos)}")
+        
+        return summaries
+    
+    @staticmethod
+    def _accumulate_stage_data(
+        pipeline_data: Dict[str, Any],
+        stage: PipelineStage,
+        result: ProcessingResult
+    ):
+        """
+        Feed a stage's outputs into the arguments of the following stages.
+        
+        Args:
+            pipeline_data: Accumulated arguments for one shot (updated in place)
+            stage: Stage that produced the result
+            result: Stage result
+        """
+        if not result.data:
+            return
+        
+        # Map known outputs to expected inputs for next stages
+        if 'dpx_sequence' in result.data:
+            pipeline_data['input_sequence'] = result.data['dpx_sequence']
+        if 'output_sequence' in result.data:
+            pipeline_data['input_sequence'] = result.data['output_sequence']
+            # Also set plates_sequence for ShotTreeOrganizationStage
+            pipeline_data['plates_sequence'] = result.data['output_sequence']
+        if 'proxy_file' in result.data:
+            pipeline_data['proxy_file'] = result.data['proxy_file']
+        # Also store all data under stage name for explicit access
+        pipeline_data[f'{stage.name}_output'] = result.data
+    
+    def _build_summary(
+        self,
+        shot_info: ShotInfo,
+        duration: float,
+        results: Optional[List[ProcessingResult]] = None
+    ) -> Dict[str, Any]:
         """
         Build execution summary.
         
         Args:
             shot_info: Shot information
             duration: Total execution time in seconds
+            results: Stage results for this shot (defaults to self.results)
             
         Returns:
             Summary dictionary
         """
+        if results is None:
+            results = self.results
+        
+        if shot_info.processing_status == "error" and not PipelineConfig.KEEP_TEMP_ROOT:
+            # The shot may have stopped before CleanupStage; keep its
+            # intermediates instead of letting the exit handler remove them
+            PipelineConfig.KEEP_TEMP_ROOT = True
+            if PipelineConfig.TEMP_ROOT is not None:
+                self.logger.info(
+                    f"Keeping temp files for debugging: {PipelineConfig.TEMP_ROOT}"
+                )
+        
         total_stages = len(self.stages)
-        successful_stages = sum(1 for r in self.results if r.success)
+        successful_stages = sum(1 for r in results if r.success)
         failed_stages = total_stages - successful_stages
         
         return {
@@ -163,7 +282,7 @@ class Pipeline:
             'successful_stages': successful_stages,
             'failed_stages': failed_stages,
             'overall_success': shot_info.processing_status == "complete",
-            'stage_results': [r.to_dict() for r in self.results]
+            'stage_results': [r.to_dict() for r in results]
         }
     
     def save_report(self, output_path: Path):
@@ -200,14 +319,19 @@ class PipelineBuilder:
     Provides a fluent interface for building pipelines.
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, fuse_conversion: bool = False):
         """
         Initialize builder.
         
         Args:
             name: Pipeline name
+            fuse_conversion: Replace a Sony conversion stage directly followed
+                             by an OIIO transform stage with one
+                             RawToEXRFusedStage, so frames are transformed
+                             while the raw conversion is still running
         """
         self.pipeline = Pipeline(name)
+        self.fuse_conversion = fuse_conversion
     
     def add_stage(self, stage: PipelineStage) -> 'PipelineBuilder':
         """
@@ -229,7 +353,36 @@ class PipelineBuilder:
         Returns:
             Constructed pipeline
         """
+        if self.fuse_conversion:
+            self.pipeline.stages = self._fuse_conversion_stages(self.pipeline.stages)
         return self.pipeline
+    
+    @staticmethod
+    def _fuse_conversion_stages(stages: List[PipelineStage]) -> List[PipelineStage]:
+        """
+        Merge adjacent Sony conversion and OIIO transform stages.
+        
+        Only the stock stage classes are merged; subclasses may override
+        behavior the fused stage doesn't know about.
+        """
+        fused = []
+        i = 0
+        while i < len(stages):
+            stage = stages[i]
+            following = stages[i + 1] if i + 1 < len(stages) else None
+            if (type(stage) is SonyRawConversionStage
+                    and type(following) is OIIOColorTransformStage):
+                fused.append(RawToEXRFusedStage(
+                    sony_tool_path=stage.sony_tool_path,
+                    oiio_tool_path=following.oiio_tool_path,
+                    bake_colorspace=stage.bake_colorspace,
+                    logger=stage.logger
+                ))
+                i += 2
+            else:
+                fused.append(stage)
+                i += 1
+        return fused
 
 
 class ConditionalPipeline(Pipeline):
@@ -6,6 +6,7 @@ Exports all available processing stages.
 from .base import PipelineStage, ValidationStage
 from .sony_conversion import SonyRawConversionStage
 from .oiio_transform import OIIOColorTransformStage
+from .fused_conversion import RawToEXRFusedStage
 from .proxy_generation import ProxyGenerationStage, BurnInProxyStage
 from .kitsu_integration import KitsuIntegrationStage, KitsuQueryStage
 from .file_operations import FileCopyStage, ShotTreeOrganizationStage, CleanupStage
@@ -15,6 +16,7 @@ __all__ = [
     'ValidationStage',
     'SonyRawConversionStage',
     'OIIOColorTransformStage',
+    'RawToEXRFusedStage',
     'ProxyGenerationStage',
     'BurnInProxyStage',
     'KitsuIntegrationStage',
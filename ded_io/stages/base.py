@@ -3,9 +3,10 @@ Base stage class for pipeline operations.
 All processing stages inherit from this base class.
 """
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 from ..models import ProcessingResult, ShotInfo
@@ -68,15 +69,7 @@ class PipelineStage(ABC):
         try:
             # Call the stage-specific processing
             self.process(shot_info, result, **kwargs)
-            
-            if result.success:
-                result.message = f"Stage {self.name} completed successfully"
-                self.logger.info(result.message)
-            else:
-                result.message = f"Stage {self.name} completed with errors"
-                self.logger.error(result.message)
-                for error in result.errors:
-                    self.logger.error(f"  - {error}")
+            self._report_outcome(result)
         
         except Exception as e:
             result.success = False
@@ -98,6 +91,96 @@ class PipelineStage(ABC):
         
         return result
     
+    def execute_batch(
+        self,
+        shot_infos: List[ShotInfo],
+        kwargs_list: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> List[ProcessingResult]:
+        """
+        Execute the stage for several shots at once.
+        
+        Stages that can amortize work across shots (shared lookups,
+        concurrent I/O) override process_batch(); the default runs
+        process() for each shot in turn.
+        
+        Args:
+            shot_infos: Shot information objects
+            kwargs_list: Optional per-shot arguments, merged over **kwargs
+            **kwargs: Arguments shared by every shot
+            
+        Returns:
+            One ProcessingResult per shot, in input order
+        """
+        self.logger.info(f"Starting stage: {self.name} for {len(shot_infos)} shots")
+        self._start_time = time.time()
+        
+        results = [
+            ProcessingResult(stage_name=self.name, success=True, message="")
+            for _ in shot_infos
+        ]
+        per_shot_kwargs = [
+            {**kwargs, **(kwargs_list[i] if kwargs_list else {})}
+            for i in range(len(shot_infos))
+        ]
+        
+        try:
+            self.process_batch(shot_infos, results, per_shot_kwargs)
+            for result in results:
+                self._report_outcome(result)
+        
+        except Exception as e:
+            error_msg = f"Stage {self.name} failed with exception: {str(e)}"
+            self.logger.exception(error_msg)
+            for result in results:
+                result.add_error(error_msg)
+                result.message = error_msg
+        
+        finally:
+            self._end_time = time.time()
+            duration = self._end_time - self._start_time
+            for result in results:
+                result.duration_seconds = duration
+                for warning in result.warnings:
+                    self.logger.warning(f"  - {warning}")
+            self.logger.info(
+                f"Stage {self.name} completed {len(shot_infos)} shots in {duration:.2f} seconds"
+            )
+        
+        return results
+    
+    def process_batch(
+        self,
+        shot_infos: List[ShotInfo],
+        results: List[ProcessingResult],
+        kwargs_list: List[Dict[str, Any]]
+    ):
+        """
+        Batch processing logic. Defaults to calling process() per shot.
+        
+        Args:
+            shot_infos: Shot information objects
+            results: ProcessingResult objects to populate (one per shot)
+            kwargs_list: Per-shot stage-specific arguments
+        """
+        for shot_info, result, shot_kwargs in zip(shot_infos, results, kwargs_list):
+            try:
+                self.process(shot_info, result, **shot_kwargs)
+            except Exception as e:
+                result.add_error(f"Stage {self.name} failed with exception: {str(e)}")
+                self.logger.exception(f"{shot_info.shot_name}: {e}")
+    
+    def _report_outcome(self, result: ProcessingResult):
+        """Set the result message and log the stage outcome."""
+        if result.success:
+            result.message = f"Stage {self.name} completed successfully"
+            self.logger.info(result.message)
+        else:
+            result.message = f"Stage {self.name} completed with errors"
+            self.logger.error(result.message)
+            for error in result.errors:
+                self.logger.error(f"  - {error}")
+    
     @abstractmethod
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -149,6 +232,34 @@ class PipelineStage(ABC):
             result.add_error(f"Failed to create directory {path}: {str(e)}")
             return False
     
+    def create_directories(self, paths: List[Path], result: ProcessingResult) -> bool:
+        """
+        Create several directories, one mkdir pass per leaf.
+        
+        Paths that are parents of another requested path are created by
+        that path's makedirs, so nested trees are walked once.
+        
+        Args:
+            paths: Directory paths to create
+            result: ProcessingResult object to add errors to
+            
+        Returns:
+            True if all were created (or already existed), False otherwise
+        """
+        unique = {Path(path) for path in paths}
+        parents = {parent for path in unique for parent in path.parents}
+        leaves = sorted(unique - parents, key=lambda path: len(path.parts))
+        
+        for path in leaves:
+            try:
+                os.makedirs(path, exist_ok=True)
+            except Exception as e:
+                result.add_error(f"Failed to create directory {path}: {str(e)}")
+                return False
+        
+        self.logger.debug(f"Created {len(unique)} directories ({len(leaves)} leaves)")
+        return True
+    
     def verify_file_exists(self, path: Path, result: ProcessingResult) -> bool:
         """
         Verify that a file exists.
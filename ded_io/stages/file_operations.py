@@ -2,9 +2,20 @@
 Stage for file operations like copying, moving, and organizing.
 Handles copying sequences and files to shot tree locations.
 """
+import ctypes
+import errno
+import hashlib
+import mmap
+import queue
 import shutil
+import stat
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 import os
 
 from .base import PipelineStage
@@ -12,6 +23,410 @@ from ..models import ProcessingResult, ShotInfo, ImageSequence
 from ..config import PipelineConfig
 
 
+# errno values meaning "this copy call isn't supported here", as opposed to
+# a real I/O failure
+_COPY_UNSUPPORTED = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+    getattr(errno, 'EOPNOTSUPP', errno.EINVAL),
+    getattr(errno, 'ENOTSUP', errno.EINVAL)
+}
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+
+def _fadvise(fd: int, advice_name: str):
+    """Give the kernel a page-cache hint for a whole file, where supported."""
+    advice = getattr(os, advice_name, None)
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _kernel_copy(source_file: Path, dest_file: Path, drop_cache: bool = True) -> Tuple[int, int]:
+    """
+    Copy a file's contents, inside the kernel where the platform allows.
+    
+    Tries copy_file_range (Linux 4.5+), then sendfile, then falls back to a
+    buffered userspace copy. The permission bits are copied like
+    shutil.copy does.
+    
+    Each file is read front to back exactly once, so the source is marked
+    sequential (larger readahead) and, with drop_cache, both files' pages
+    are released afterwards instead of pushing out other cached data.
+    
+    Args:
+        source_file: File to copy
+        dest_file: Destination file (created or truncated)
+        drop_cache: Drop the copied data from the page cache when done
+        
+    Returns:
+        (source size, destination size), both from fstat on the open files,
+        so verifying the copy needs no further stat calls
+    """
+    src_fd = os.open(source_file, os.O_RDONLY | _O_BINARY)
+    try:
+        src_st = os.fstat(src_fd)
+        source_size = src_st.st_size
+        _fadvise(src_fd, 'POSIX_FADV_SEQUENTIAL')
+        dst_fd = _open_copy_dest(dest_file, src_st)
+        try:
+            _copy_fd(src_fd, dst_fd, source_size)
+            dest_size = os.fstat(dst_fd).st_size
+            if drop_cache:
+                _fadvise(src_fd, 'POSIX_FADV_DONTNEED')
+                _fadvise(dst_fd, 'POSIX_FADV_DONTNEED')
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    _copy_mode(source_file, dest_file)
+    return source_size, dest_size
+
+
+# Chunk size and alignment for O_DIRECT copies
+_DIRECT_CHUNK = 1 << 20
+_DIRECT_ALIGN = 4096
+
+
+class _BufferPool:
+    """
+    Reusable 1 MiB buffers for the copy and hash loops.
+    
+    Buffers are anonymous mmaps, so they are page-aligned and usable for
+    O_DIRECT as well as ordinary readinto(). Borrowing reuses a free buffer
+    (most recently returned first) and only allocates when none is free, so
+    copying a sequence doesn't allocate a fresh buffer per frame.
+    """
+    
+    def __init__(self, size: int = _DIRECT_CHUNK, max_free: int = 16):
+        self.size = size
+        self._free = queue.LifoQueue(maxsize=max_free)
+    
+    @contextmanager
+    def borrow(self):
+        """Borrow a buffer for the duration of a with block."""
+        try:
+            buffer = self._free.get_nowait()
+        except queue.Empty:
+            buffer = mmap.mmap(-1, self.size)
+        try:
+            yield buffer
+        finally:
+            try:
+                self._free.put_nowait(buffer)
+            except queue.Full:
+                buffer.close()
+
+
+_buffers = _BufferPool()
+
+
+def _direct_copy(source_file: Path, dest_file: Path, min_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Copy a large file with O_DIRECT, bypassing the page cache.
+    
+    Data moves through a page-aligned 1 MiB buffer in aligned chunks; the
+    last chunk is written padded to the alignment and the file truncated
+    back to its real size.
+    
+    Args:
+        source_file: File to copy
+        dest_file: Destination file (created or truncated)
+        min_size: Files smaller than this aren't worth it (returns None)
+        
+    Returns:
+        (source size, destination size) like _kernel_copy, or None if the
+        file is too small or the filesystem doesn't support O_DIRECT
+    """
+    if not hasattr(os, 'O_DIRECT'):
+        return None
+    
+    try:
+        src_fd = os.open(source_file, os.O_RDONLY | os.O_DIRECT)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return None
+        raise
+    
+    try:
+        src_st = os.fstat(src_fd)
+        source_size = src_st.st_size
+        if source_size < min_size:
+            return None
+        
+        try:
+            dst_fd = _open_copy_dest(dest_file, src_st, os.O_DIRECT)
+        except OSError as e:
+            if e.errno == errno.EINVAL:
+                return None
+            raise
+        
+        try:
+            # Pooled buffers are page-aligned, as O_DIRECT needs
+            with _buffers.borrow() as buffer:
+                view = memoryview(buffer)
+                try:
+                    offset = 0
+                    while offset < source_size:
+                        n = os.preadv(src_fd, [buffer], offset)
+                        if n == 0:
+                            break
+                        aligned = -(-n // _DIRECT_ALIGN) * _DIRECT_ALIGN
+                        os.pwritev(dst_fd, [view[:aligned]], offset)
+                        offset += n
+                finally:
+                    view.release()
+            os.ftruncate(dst_fd, offset)
+            dest_size = os.fstat(dst_fd).st_size
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    _copy_mode(source_file, dest_file)
+    return source_size, dest_size
+
+
+def _copy_mode(source_file: Path, dest_file: Path):
+    """
+    Copy permission bits, if the destination filesystem allows it.
+    
+    chmod on a Windows drive mounted in WSL (drvfs, e.g. the /mnt/c shot
+    tree) can fail with EPERM; the data is already copied by then, so
+    that must not fail the copy.
+    """
+    try:
+        shutil.copymode(source_file, dest_file)
+    except OSError:
+        pass
+
+
+def _open_copy_dest(dest_file: Path, src_st: os.stat_result, extra_flags: int = 0) -> int:
+    """
+    Open a copy destination for writing, empty.
+    
+    If dest_file is a hard link to the source (e.g. left by
+    hardlink_when_possible), truncating it would wipe the source too, so
+    the link is replaced with a new file instead.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | _O_BINARY | extra_flags
+    dst_fd = os.open(dest_file, flags, 0o666)
+    dst_st = os.fstat(dst_fd)
+    if (dst_st.st_dev, dst_st.st_ino) != (src_st.st_dev, src_st.st_ino):
+        os.ftruncate(dst_fd, 0)
+        return dst_fd
+    
+    os.close(dst_fd)
+    os.unlink(dest_file)
+    return os.open(dest_file, flags | os.O_EXCL, 0o666)
+
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> int:
+    """Copy size bytes between open file descriptors; returns bytes copied."""
+    if hasattr(os, 'copy_file_range'):
+        copied = 0
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+            return copied
+        except OSError as e:
+            if copied or e.errno not in _COPY_UNSUPPORTED:
+                raise
+    
+    if hasattr(os, 'sendfile'):
+        copied = 0
+        try:
+            while copied < size:
+                n = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                if n == 0:
+                    break
+                copied += n
+            return copied
+        except OSError as e:
+            if copied or e.errno not in _COPY_UNSUPPORTED:
+                raise
+    
+    with open(src_fd, 'rb', buffering=0, closefd=False) as fsrc, \
+            open(dst_fd, 'wb', closefd=False) as fdst, \
+            _buffers.borrow() as buffer:
+        view = memoryview(buffer)
+        try:
+            copied = 0
+            while True:
+                n = fsrc.readinto(view)
+                if not n:
+                    break
+                fdst.write(view[:n])
+                copied += n
+        finally:
+            view.release()
+        return copied
+
+
+def _sha256_file(path: Path) -> bytes:
+    """SHA-256 digest of a file, read in 1 MiB chunks into a pooled buffer."""
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').digest()
+        
+        digest = hashlib.sha256()
+        with _buffers.borrow() as buffer:
+            view = memoryview(buffer)
+            try:
+                while True:
+                    n = f.readinto(view)
+                    if not n:
+                        break
+                    digest.update(view[:n])
+            finally:
+                view.release()
+        return digest.digest()
+
+
+def _hashes_match(source_file: Path, dest_file: Path) -> bool:
+    """Compare SHA-256 digests of two files, hashing both at once."""
+    digests = {}
+    
+    def hash_source():
+        digests['source'] = _sha256_file(source_file)
+    
+    thread = threading.Thread(target=hash_source)
+    thread.start()
+    try:
+        dest_digest = _sha256_file(dest_file)
+    finally:
+        thread.join()
+    return digests.get('source') == dest_digest
+
+
+def _same_device(path_a: Path, path_b: Path) -> bool:
+    """Check whether two existing paths are on the same filesystem."""
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
+
+def _link_file(source_file: Path, dest_file: Path) -> bool:
+    """
+    Hard-link dest_file to source_file, replacing an existing dest_file.
+    
+    Returns:
+        True if linked, False if the files can't be linked (e.g. different
+        filesystems, or links unsupported) and should be copied instead
+    """
+    try:
+        os.link(source_file, dest_file)
+        return True
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    
+    try:
+        os.unlink(dest_file)
+        os.link(source_file, dest_file)
+        return True
+    except OSError:
+        return False
+
+
+def _load_syncfs() -> Optional[Callable[[int], int]]:
+    """Get libc's syncfs() (Linux 2.6.39+), or None where it isn't available."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syncfs
+    except (OSError, AttributeError):
+        return None
+
+
+_syncfs = _load_syncfs()
+
+
+def _sync_files(paths: List[Path], directory: Path):
+    """
+    Flush copied files and their directory entries to stable storage.
+    
+    Uses one syncfs() on the destination filesystem where available, and
+    otherwise an fdatasync per file plus one fsync of the directory.
+    
+    Raises:
+        OSError: If syncing fails
+    """
+    if _syncfs is not None:
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            if _syncfs(dir_fd) == 0:
+                return
+        finally:
+            os.close(dir_fd)
+    
+    datasync = getattr(os, 'fdatasync', os.fsync)
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY | _O_BINARY)
+        try:
+            datasync(fd)
+        finally:
+            os.close(fd)
+    
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Directories can't be opened on Windows; nothing more to do there
+        return
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class _GroupSync:
+    """
+    Flush copied files to disk in groups rather than one fsync per file.
+    
+    Files are queued as they are copied; once sync_every_bytes have been
+    written since the last flush, the queued files are synced together, so
+    the device flush is paid once per group.
+    """
+    
+    def __init__(self, directory: Path, sync_every_bytes: int):
+        self.directory = directory
+        self.sync_every_bytes = sync_every_bytes
+        self._pending: List[Path] = []
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+    
+    def add(self, path: Path, size: int):
+        """Queue a copied file, syncing the group once enough data has built up."""
+        with self._lock:
+            self._pending.append(path)
+            self._pending_bytes += size
+            if self._pending_bytes < self.sync_every_bytes:
+                return
+            batch = self._take()
+        _sync_files(batch, self.directory)
+    
+    def flush(self):
+        """Sync whatever is still queued."""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            _sync_files(batch, self.directory)
+    
+    def _take(self) -> List[Path]:
+        batch = self._pending
+        self._pending = []
+        self._pending_bytes = 0
+        return batch
+
+
 class FileCopyStage(PipelineStage):
     """
     Copy files or sequences to destination locations.
@@ -20,15 +435,54 @@ class FileCopyStage(PipelineStage):
     permissions.
     """
     
-    def __init__(self, verify_copy: bool = True, **kwargs):
+    def __init__(
+        self,
+        verify_copy: bool = True,
+        copy_workers: int = 8,
+        use_io_uring: Optional[bool] = None,
+        hardlink_when_possible: bool = False,
+        verify_mode: str = "size",
+        direct_io: bool = False,
+        direct_io_threshold: int = 100 * 1024 * 1024,
+        durable: bool = False,
+        sync_every_bytes: int = 256 * 1024 * 1024,
+        **kwargs
+    ):
         """
         Initialize file copy stage.
         
         Args:
             verify_copy: Verify file sizes after copy
+            copy_workers: Sequence frames copied at once
+            use_io_uring: Copy sequences with batched io_uring reads/writes
+                          (needs liburing, Linux 5.6+); None follows
+                          PipelineConfig.USE_IO_URING
+            hardlink_when_possible: Hard-link instead of copying when source and
+                                    destination share a filesystem (the copy then
+                                    shares the source's data, so only use this
+                                    for sources that won't be modified in place)
+            verify_mode: "size" compares sizes; "sha256" also compares content
+                         hashes (reads both files again)
+            direct_io: Copy files of at least direct_io_threshold bytes with
+                       O_DIRECT, so large plates don't evict the page cache
+                       other processes are using (Linux)
+            direct_io_threshold: Smallest file size copied with O_DIRECT
+            durable: Flush copies to stable storage before reporting success
+            sync_every_bytes: With durable, sequence frames are flushed in
+                              groups of about this much data
         """
+        if verify_mode not in ("size", "sha256"):
+            raise ValueError(f"Unknown verify_mode: {verify_mode}")
         super().__init__(**kwargs)
         self.verify_copy = verify_copy
+        self.copy_workers = max(1, copy_workers)
+        self.use_io_uring = use_io_uring
+        self.hardlink_when_possible = hardlink_when_possible
+        self.verify_mode = verify_mode
+        self.direct_io = direct_io
+        self.direct_io_threshold = direct_io_threshold
+        self.durable = durable
+        self.sync_every_bytes = sync_every_bytes
     
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -112,14 +566,21 @@ class FileCopyStage(PipelineStage):
         dest_file = destination_dir / source_file.name
         
         try:
+            if self.hardlink_when_possible and _link_file(source_file, dest_file):
+                self.logger.debug(f"Linked {source_file} to {dest_file}")
+                return dest_file
+            
             self.logger.debug(f"Copying {source_file} to {dest_file}")
-            shutil.copy(source_file, dest_file)
+            source_size, dest_size = self._copy_data(source_file, dest_file)
             
             # Verify copy
             if self.verify_copy:
-                if not self._verify_file_copy(source_file, dest_file, result):
+                if not self._verify_file_copy(source_file, dest_file, source_size, dest_size, result):
                     return None
             
+            if self.durable:
+                _sync_files([dest_file], destination_dir)
+            
             return dest_file
             
         except Exception as e:
@@ -141,30 +602,64 @@ class FileCopyStage(PipelineStage):
         if isinstance(source_sequence, dict):
             source_sequence = ImageSequence(**source_sequence)
         
-        copied_files = []
-        errors = []
+        frames = range(source_sequence.first_frame, source_sequence.last_frame + 1)
+        outcomes = {}
         
-        for frame in range(source_sequence.first_frame, source_sequence.last_frame + 1):
-            source_file = source_sequence.get_frame_path(frame)
-            
-            if not source_file.exists():
-                errors.append(f"Frame {frame} does not exist: {source_file}")
-                continue
-            
-            dest_file = destination_dir / source_file.name
-            
+        # One directory read instead of an exists() stat per frame
+        present = source_sequence._files_on_disk()
+        for frame in frames:
+            if source_sequence.get_frame_name(frame) not in present:
+                outcomes[frame] = (
+                    None,
+                    f"Frame {frame} does not exist: {source_sequence.get_frame_path(frame)}"
+                )
+        
+        group_sync = _GroupSync(destination_dir, self.sync_every_bytes) if self.durable else None
+        
+        # Device check once per sequence rather than a failed link per frame
+        link = self.hardlink_when_possible and _same_device(
+            source_sequence.directory, destination_dir
+        )
+        
+        use_io_uring = self.use_io_uring
+        if use_io_uring is None:
+            use_io_uring = PipelineConfig.USE_IO_URING
+        if use_io_uring and self.direct_io:
+            # io_uring copies go through the page cache; keep O_DIRECT as asked
+            self.logger.info("direct_io is set, copying without io_uring")
+            use_io_uring = False
+        if use_io_uring and not link:
+            outcomes.update(self._copy_frames_uring(
+                source_sequence,
+                [frame for frame in frames if frame not in outcomes],
+                destination_dir,
+                result,
+                group_sync
+            ))
+        
+        # Frames are independent and the copy is I/O bound, so run several
+        # at once (anything io_uring didn't copy, or all frames without it)
+        pending = [frame for frame in frames if frame not in outcomes]
+        if pending:
+            workers = min(self.copy_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                copied = executor.map(
+                    lambda frame: self._copy_frame(
+                        source_sequence, frame, destination_dir, result, link, group_sync
+                    ),
+                    pending
+                )
+                outcomes.update(zip(pending, copied))
+        
+        if group_sync is not None:
             try:
-                shutil.copy(source_file, dest_file)
-                
-                if self.verify_copy:
-                    if not self._verify_file_copy(source_file, dest_file, result):
-                        errors.append(f"Verification failed for frame {frame}")
-                        continue
-                
-                copied_files.append(dest_file)
-                
-            except Exception as e:
-                errors.append(f"Failed to copy frame {frame}: {str(e)}")
+                group_sync.flush()
+            except OSError as e:
+                result.add_error(f"Failed to sync copied frames to disk: {str(e)}")
+        
+        ordered = [outcomes[frame] for frame in frames]
+        copied_files = [dest_file for dest_file, _ in ordered if dest_file]
+        errors = [error for _, error in ordered if error]
         
         # Report results
         self.logger.info(
@@ -177,25 +672,192 @@ class FileCopyStage(PipelineStage):
         
         return copied_files
     
+    def _copy_frames_uring(
+        self,
+        source_sequence: ImageSequence,
+        frames: List[int],
+        destination_dir: Path,
+        result: ProcessingResult,
+        group_sync: Optional[_GroupSync] = None
+    ) -> dict:
+        """
+        Copy sequence frames with batched io_uring submissions.
+        
+        Copied frames are verified like any other copy (a full write already
+        means the sizes match, so this only matters for sha256).
+        
+        Returns:
+            {frame: (destination path, None)} for the frames that were fully
+            copied and verified, {frame: (None, error)} for frames that failed
+            verification; missing or failed frames are left out for the
+            regular path
+        """
+        from ..util import uring
+        
+        dest_root = str(destination_dir)
+        pairs = [
+            (
+                source_sequence.get_frame_str(frame),
+                os.path.join(dest_root, source_sequence.get_frame_name(frame))
+            )
+            for frame in frames
+        ]
+        written = uring.copy_files(pairs)
+        if written is None:
+            return {}
+        
+        # copy_files only reports a frame once the full source size was written
+        outcomes = {}
+        for frame, (source, dest), size in zip(frames, pairs, written):
+            if size < 0:
+                continue
+            if self.verify_copy and not self._verify_file_copy(
+                Path(source), Path(dest), size, size, result
+            ):
+                outcomes[frame] = (None, f"Verification failed for frame {frame}")
+                continue
+            if group_sync is not None:
+                group_sync.add(Path(dest), size)
+            outcomes[frame] = (Path(dest), None)
+        return outcomes
+    
+    def _copy_frame(
+        self,
+        source_sequence: ImageSequence,
+        frame: int,
+        destination_dir: Path,
+        result: ProcessingResult,
+        link: bool = False,
+        group_sync: Optional[_GroupSync] = None
+    ) -> Tuple[Optional[Path], Optional[str]]:
+        """
+        Copy one frame of a sequence (already known to exist).
+        
+        Args:
+            link: Try a hard link first (source and destination share a filesystem)
+            group_sync: Queue the copy here to be flushed to disk with others
+        
+        Returns:
+            (destination path, None) if copied, (None, error message) otherwise
+        """
+        source_file = source_sequence.get_frame_path(frame)
+        return self.copy_to(
+            source_file, destination_dir / source_file.name, result,
+            link=link, group_sync=group_sync, label=f"frame {frame}"
+        )
+    
+    def copy_to(
+        self,
+        source_file: Path,
+        dest_file: Path,
+        result: ProcessingResult,
+        link: bool = False,
+        group_sync: Optional[_GroupSync] = None,
+        label: Optional[str] = None
+    ) -> Tuple[Optional[Path], Optional[str]]:
+        """
+        Copy one existing file to an explicit destination path.
+        
+        Args:
+            source_file: File to copy
+            dest_file: Destination file path (its directory must exist)
+            result: Result object (verification messages)
+            link: Try a hard link first (source and destination share a filesystem)
+            group_sync: Queue the copy here to be flushed to disk with others
+            label: How the file is named in error messages (default: source name)
+        
+        Returns:
+            (destination path, None) if copied, (None, error message) otherwise
+        """
+        label = label or source_file.name
+        
+        # Same inode, so there's nothing to verify
+        if link and _link_file(source_file, dest_file):
+            return dest_file, None
+        
+        try:
+            source_size, dest_size = self._copy_data(source_file, dest_file)
+            
+            if self.verify_copy:
+                if not self._verify_file_copy(source_file, dest_file, source_size, dest_size, result):
+                    return None, f"Verification failed for {label}"
+            
+            if group_sync is not None:
+                group_sync.add(dest_file, dest_size)
+            
+            return dest_file, None
+            
+        except Exception as e:
+            return None, f"Failed to copy {label}: {str(e)}"
+    
+    def copy_files(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        result: ProcessingResult
+    ) -> List[Tuple[Optional[Path], Optional[str]]]:
+        """
+        Copy (source, destination) file pairs on the copy thread pool.
+        
+        Sources must exist and all destinations must share one directory,
+        which must exist. Hard links are used when enabled and possible.
+        
+        Args:
+            pairs: (source file, destination file) pairs
+            result: Result object
+            
+        Returns:
+            copy_to outcome for each pair, in order
+        """
+        if not pairs:
+            return []
+        
+        link = self.hardlink_when_possible and _same_device(
+            pairs[0][0].parent, pairs[0][1].parent
+        )
+        workers = min(self.copy_workers, len(pairs))
+        if workers <= 1:
+            return [self.copy_to(src, dst, result, link=link) for src, dst in pairs]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda pair: self.copy_to(pair[0], pair[1], result, link=link),
+                pairs
+            ))
+    
+    def _copy_data(self, source_file: Path, dest_file: Path) -> Tuple[int, int]:
+        """
+        Copy one file's contents with the configured method.
+        
+        Returns:
+            (source size, destination size)
+        """
+        if self.direct_io:
+            sizes = _direct_copy(source_file, dest_file, self.direct_io_threshold)
+            if sizes is not None:
+                return sizes
+        # sha256 verification reads both files straight back, so keep them cached
+        return _kernel_copy(source_file, dest_file, drop_cache=self.verify_mode != "sha256")
+    
     def _verify_file_copy(
         self,
         source_file: Path,
         dest_file: Path,
+        source_size: int,
+        dest_size: int,
         result: ProcessingResult
     ) -> bool:
         """
         Verify that file was copied correctly.
         
+        Args:
+            source_file: Source file path (for messages)
+            dest_file: Destination file path (for messages)
+            source_size: Source size from the copy
+            dest_size: Destination size from the copy
+            
         Returns:
             True if verification passed, False otherwise
         """
-        if not dest_file.exists():
-            result.add_error(f"Destination file does not exist: {dest_file}")
-            return False
-        
-        source_size = source_file.stat().st_size
-        dest_size = dest_file.stat().st_size
-        
         if source_size != dest_size:
             result.add_error(
                 f"File size mismatch: {source_file} ({source_size}) vs "
@@ -203,6 +865,10 @@ class FileCopyStage(PipelineStage):
             )
             return False
         
+        if self.verify_mode == "sha256" and not _hashes_match(source_file, dest_file):
+            result.add_error(f"Checksum mismatch: {source_file} vs {dest_file}")
+            return False
+        
         return True
 
 
@@ -217,8 +883,33 @@ class ShotTreeOrganizationStage(PipelineStage):
           {rep}_{colorspace}/
             {shot}_{task}_{element}_v{version}_{rep}_{colorspace}.####.ext
           {shot}_{task}_{element}_v{version}_{rep}_{colorspace}.mov
+    
+    Files are copied with FileCopyStage's copy path (thread pool, kernel
+    copy, and optionally hard links when source and tree share a filesystem).
     """
     
+    def __init__(
+        self,
+        copy_workers: int = 8,
+        hardlink_when_possible: bool = False,
+        **kwargs
+    ):
+        """
+        Initialize shot tree organization stage.
+        
+        Args:
+            copy_workers: Number of frames copied concurrently
+            hardlink_when_possible: Hard-link files into the tree instead of
+                                    copying when on the same filesystem
+        """
+        super().__init__(**kwargs)
+        self.copier = FileCopyStage(
+            verify_copy=False,
+            copy_workers=copy_workers,
+            hardlink_when_possible=hardlink_when_possible,
+            logger=self.logger
+        )
+    
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
         Organize files into shot tree with new naming convention.
@@ -270,14 +961,11 @@ class ShotTreeOrganizationStage(PipelineStage):
         self.logger.info(f"  Version container: {version_dir}")
         self.logger.info(f"  Colorspace dir: {colorspace_dir}")
         
-        # Create all directories
-        directories_created = []
-        for directory in [shot_root, task_dir, version_dir, colorspace_dir]:
-            if self.create_directory(directory, result):
-                directories_created.append(str(directory))
-            else:
-                result.add_error(f"Failed to create directory: {directory}")
-                return
+        # Create all directories (nested, so one makedirs covers the tree)
+        directories = [shot_root, task_dir, version_dir, colorspace_dir]
+        if not self.create_directories(directories, result):
+            return
+        directories_created = [str(directory) for directory in directories]
         
         result.data['directories_created'] = directories_created
         
@@ -355,29 +1043,27 @@ class ShotTreeOrganizationStage(PipelineStage):
         organized_files = []
         errors = []
         
+        present = source_sequence._files_on_disk()
+        pairs = []
         for frame in range(source_sequence.first_frame, source_sequence.last_frame + 1):
-            try:
-                source_file = source_sequence.get_frame_path(frame)
-                
-                if not source_file.exists():
-                    errors.append(f"Source frame does not exist: {source_file}")
-                    continue
-                
-                # Generate new filename using naming convention
-                new_filename = shot_info.get_sequence_filename(
-                    frame,
-                    colorspace,
-                    source_sequence.extension
-                )
-                
-                dest_file = dest_dir / new_filename
-                
-                # Copy file
-                shutil.copy(source_file, dest_file)
+            source_file = source_sequence.get_frame_path(frame)
+            if source_file.name not in present:
+                errors.append(f"Source frame does not exist: {source_file}")
+                continue
+            
+            # Generate new filename using naming convention
+            new_filename = shot_info.get_sequence_filename(
+                frame,
+                colorspace,
+                source_sequence.extension
+            )
+            pairs.append((source_file, dest_dir / new_filename))
+        
+        for dest_file, error in self.copier.copy_files(pairs, result):
+            if error:
+                errors.append(error)
+            else:
                 organized_files.append(dest_file)
-                
-            except Exception as e:
-                errors.append(f"Failed to organize frame {frame}: {str(e)}")
         
         # Report results
         self.logger.info(
@@ -421,19 +1107,22 @@ class ShotTreeOrganizationStage(PipelineStage):
         
         dest_file = dest_dir / proxy_filename
         
-        try:
-            # Use binary read/write to avoid any permission/metadata issues
-            # when copying between Linux and Windows filesystems (WSL)
-            with open(source_proxy, 'rb') as src:
-                with open(dest_file, 'wb') as dst:
-                    dst.write(src.read())
-            self.logger.info(f"Organized proxy: {dest_file}")
-            return dest_file
-            
-        except Exception as e:
-            result.add_error(f"Failed to organize proxy: {str(e)}")
+        # The copy path carries no metadata other than permission bits, and
+        # skips those where chmod isn't allowed (Windows filesystems in WSL)
+        organized, error = self.copier.copy_to(
+            source_proxy,
+            dest_file,
+            result,
+            link=self.copier.hardlink_when_possible and _same_device(source_proxy, dest_dir),
+            label="proxy"
+        )
+        if error:
+            result.add_error(error)
             return None
         
+        self.logger.info(f"Organized proxy: {organized}")
+        return organized
+        
         result.data['shot_tree_root'] = str(shot_root)
         result.data['directories_created'] = directories_created
         result.data['plates_path'] = str(shot_info.output_plates_path) if shot_info.output_plates_path else None
@@ -442,6 +1131,24 @@ class ShotTreeOrganizationStage(PipelineStage):
         self.logger.info(f"Shot tree organized at: {shot_root}")
 
 
+def _stat_kind(path: Path) -> Optional[str]:
+    """
+    Classify a path with a single lstat (symlinks are not followed).
+    
+    Returns:
+        'dir', 'file', 'other' (symlinks, devices, ...), or None if missing
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if stat.S_ISDIR(mode):
+        return 'dir'
+    if stat.S_ISREG(mode):
+        return 'file'
+    return 'other'
+
+
 class CleanupStage(PipelineStage):
     """
     Clean up temporary files and directories.
@@ -449,15 +1156,36 @@ class CleanupStage(PipelineStage):
     Removes intermediate processing files after successful completion.
     """
     
-    def __init__(self, remove_temp_dirs: bool = True, **kwargs):
+    # Directory deletions still running in the background
+    _pending_deletes: List[threading.Thread] = []
+    _pending_lock = threading.Lock()
+    
+    def __init__(self, remove_temp_dirs: bool = True, background_delete: bool = True, **kwargs):
         """
         Initialize cleanup stage.
         
         Args:
             remove_temp_dirs: Remove temporary directories
+            background_delete: Rename temporary directories out of the way and
+                               delete them on a background thread, so the
+                               pipeline doesn't wait for large trees
         """
         super().__init__(**kwargs)
         self.remove_temp_dirs = remove_temp_dirs
+        self.background_delete = background_delete
+    
+    @classmethod
+    def wait_for_pending_deletes(cls, timeout: Optional[float] = None):
+        """
+        Wait for background directory deletions to finish.
+        
+        Args:
+            timeout: Seconds to wait per deletion (None waits indefinitely)
+        """
+        with cls._pending_lock:
+            pending = list(cls._pending_deletes)
+        for thread in pending:
+            thread.join(timeout)
     
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -477,6 +1205,7 @@ class CleanupStage(PipelineStage):
         if keep_on_error and shot_info.processing_status == 'error':
             self.logger.info("Skipping cleanup due to processing errors")
             result.add_warning("Cleanup skipped - preserving files for debugging")
+            PipelineConfig.KEEP_TEMP_ROOT = True
             return
         
         removed_items = []
@@ -487,9 +1216,12 @@ class CleanupStage(PipelineStage):
         if self.remove_temp_dirs:
             for temp_dir in temp_dirs:
                 temp_dir = Path(temp_dir)
-                if temp_dir.exists() and temp_dir.is_dir():
+                if _stat_kind(temp_dir) == 'dir':
                     try:
-                        shutil.rmtree(temp_dir)
+                        if self.background_delete:
+                            self._remove_dir_in_background(temp_dir)
+                        else:
+                            shutil.rmtree(temp_dir)
                         removed_items.append(str(temp_dir))
                         self.logger.info(f"Removed temporary directory: {temp_dir}")
                     except Exception as e:
@@ -499,7 +1231,8 @@ class CleanupStage(PipelineStage):
         temp_files = kwargs.get('temp_files', [])
         for temp_file in temp_files:
             temp_file = Path(temp_file)
-            if temp_file.exists() and temp_file.is_file():
+            # Symlinks are unlinked too (their target is left alone)
+            if _stat_kind(temp_file) in ('file', 'other'):
                 try:
                     temp_file.unlink()
                     removed_items.append(str(temp_file))
@@ -513,3 +1246,44 @@ class CleanupStage(PipelineStage):
         if errors:
             for error in errors:
                 result.add_warning(error)
+    
+    def _remove_dir_in_background(self, temp_dir: Path):
+        """
+        Move a directory out of the way, then delete it on a background thread.
+        
+        The rename is a single metadata operation, so the directory is gone
+        from its original path immediately. The deletion threads are not
+        daemons, so the interpreter finishes them before exiting.
+        
+        Args:
+            temp_dir: Directory to remove
+        """
+        staged = temp_dir.with_name(
+            f"{temp_dir.name}.deleting.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+        )
+        try:
+            os.rename(temp_dir, staged)
+        except OSError:
+            # Can't rename (e.g. permissions); delete in place instead
+            shutil.rmtree(temp_dir)
+            return
+        
+        thread = threading.Thread(
+            target=self._delete_tree,
+            args=(staged,),
+            name=f"cleanup-{temp_dir.name}"
+        )
+        with CleanupStage._pending_lock:
+            CleanupStage._pending_deletes = [
+                t for t in CleanupStage._pending_deletes if t.is_alive()
+            ]
+            CleanupStage._pending_deletes.append(thread)
+        thread.start()
+    
+    def _delete_tree(self, path: Path):
+        """Delete a staged directory tree (runs on a background thread)."""
+        shutil.rmtree(path, ignore_errors=True)
+        if path.exists():
+            self.logger.warning(f"Could not fully remove temporary directory: {path}")
+        else:
+            self.logger.debug(f"Removed temporary directory: {path}")
@@ -0,0 +1,254 @@
+"""
+Stage that runs Sony raw conversion and the OIIO color transform together.
+Frames are transformed to EXR while rawexporter is still writing the rest.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from .base import PipelineStage
+from .sony_conversion import SonyRawConversionStage
+from .oiio_transform import OIIOColorTransformStage
+from ..models import ProcessingResult, ShotInfo, ImageSequence
+from ..config import PipelineConfig
+
+
+class RawToEXRFusedStage(PipelineStage):
+    """
+    Convert Sony raw footage straight to ACES EXR plates.
+    
+    Replaces SonyRawConversionStage followed by OIIOColorTransformStage.
+    rawexporter can only write frame files (no stdout, and a Windows tool
+    can't open Linux FIFOs through WSL), so the DPX intermediate can't be
+    skipped entirely. Instead rawexporter runs on a producer thread while
+    finished DPX frames are handed to oiiotool workers as soon as they
+    land, and each DPX is deleted once its EXR is written. Conversion and
+    transform overlap, and the DPX intermediate never piles up on disk.
+    
+    If matching DPX output is already on disk (see SonyRawConversionStage
+    caching), the transform simply runs over it.
+    """
+    
+    # Seconds between scans of the DPX directory for new frames
+    POLL_INTERVAL = 0.5
+    
+    def __init__(
+        self,
+        sony_tool_path: Optional[str] = None,
+        oiio_tool_path: Optional[str] = None,
+        bake_colorspace: str = "SGAMUT3_LINEAR",
+        transform_workers: int = 4,
+        keep_dpx: bool = False,
+        **kwargs
+    ):
+        """
+        Initialize the fused conversion stage.
+        
+        Args:
+            sony_tool_path: Path to Sony conversion tool (Windows path)
+            oiio_tool_path: Path to oiiotool (uses config default if None)
+            bake_colorspace: Output colorspace for rawexporter's bake mode
+            transform_workers: oiiotool processes run at once
+            keep_dpx: Keep the intermediate DPX frames instead of deleting them
+        """
+        super().__init__(**kwargs)
+        self.sony = SonyRawConversionStage(
+            sony_tool_path=sony_tool_path,
+            bake_colorspace=bake_colorspace,
+            logger=self.logger
+        )
+        self.oiio = OIIOColorTransformStage(oiio_tool_path=oiio_tool_path, logger=self.logger)
+        self.transform_workers = max(1, transform_workers)
+        self.keep_dpx = keep_dpx
+    
+    def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
+        """
+        Convert and transform one shot.
+        
+        Args:
+            shot_info: Shot information
+            result: Result object to populate
+            **kwargs: Additional arguments
+                - dpx_dir: Directory for intermediate DPX frames
+                - output_dir: Override EXR output directory
+                - dpx_bit_depth: Bit depth for DPX (default: 16)
+        """
+        dpx_dir = kwargs.get('dpx_dir')
+        if dpx_dir is None:
+            dpx_dir = PipelineConfig.get_temp_root() / f"{shot_info.shot_name}_dpx"
+        
+        job = self.sony._prepare_job(
+            shot_info, result,
+            output_dir=dpx_dir,
+            dpx_bit_depth=kwargs.get('dpx_bit_depth', 16)
+        )
+        if job is None:
+            return
+        
+        output_dir = kwargs.get('output_dir')
+        if output_dir is None:
+            output_dir = PipelineConfig.get_temp_root() / f"{shot_info.shot_name}_oiio"
+        
+        output_dir = Path(output_dir)
+        if not self.create_directory(output_dir, result):
+            return
+        
+        dpx_sequence = job['dpx_sequence']
+        output_sequence = ImageSequence(
+            directory=output_dir,
+            base_name=shot_info.get_base_filename(PipelineConfig.COLORSPACE_ACESCG),
+            extension=PipelineConfig.OUTPUT_FORMAT,
+            first_frame=dpx_sequence.first_frame,
+            last_frame=dpx_sequence.last_frame,
+            frame_padding=PipelineConfig.FRAME_PADDING
+        )
+        
+        self.logger.info(f"Fused conversion: {job['source_file']} -> {output_sequence.full_pattern}")
+        
+        # Producer: rawexporter writes DPX frames in order
+        conversion_done = threading.Event()
+        conversion_ok = [True]
+        
+        def convert():
+            try:
+                conversion_ok[0] = self.sony._run_sony_conversion(
+                    source_file=job['source_file'],
+                    output_pattern=job['output_pattern'],
+                    in_frame=job['in_frame'],
+                    out_frame=job['out_frame'],
+                    bit_depth=job['bit_depth'],
+                    result=result,
+                    start_index=job['start_index']
+                )
+            except Exception as e:
+                result.add_error(f"Sony conversion failed: {str(e)}")
+                conversion_ok[0] = False
+            finally:
+                conversion_done.set()
+        
+        if job['cached']:
+            conversion_done.set()
+        else:
+            threading.Thread(target=convert, daemon=True).start()
+        
+        # Consumer: transform each frame once it's complete
+        failed_frames = self._transform_as_ready(
+            dpx_sequence, output_sequence, conversion_done, result
+        )
+        
+        if not conversion_ok[0]:
+            return
+        
+        missing = output_sequence.missing_frames()
+        if failed_frames or missing:
+            result.add_error(
+                f"Only {output_sequence.total_frames - len(missing)} of "
+                f"{output_sequence.total_frames} frames were created"
+            )
+            return
+        
+        if self.keep_dpx and not job['cached']:
+            # Let a re-run skip straight to the transform
+            self.sony._write_manifest(job)
+        
+        result.data['output_sequence'] = output_sequence.to_dict()
+        result.data['frames_processed'] = output_sequence.total_frames
+        result.data['conversion_cached'] = job['cached']
+        result.data['frame_mapping'] = {
+            'source_in': job['in_frame'],
+            'source_out': job['out_frame'],
+            'output_first': job['start_index'],
+            'output_last': job['last_frame']
+        }
+        
+        # Update shot_info
+        shot_info.output_plates_path = output_dir
+    
+    def _transform_as_ready(
+        self,
+        dpx_sequence: ImageSequence,
+        output_sequence: ImageSequence,
+        conversion_done: threading.Event,
+        result: ProcessingResult
+    ) -> int:
+        """
+        Feed DPX frames to oiiotool workers as rawexporter finishes them.
+        
+        rawexporter writes frames in order, so a frame is complete once the
+        next one appears or the tool has exited.
+        
+        Returns:
+            Number of frames whose transform failed
+        """
+        geometry = None
+        next_frame = dpx_sequence.first_frame
+        futures = []
+        
+        with ThreadPoolExecutor(max_workers=self.transform_workers) as executor:
+            while next_frame <= dpx_sequence.last_frame:
+                finished = conversion_done.is_set()
+                try:
+                    with os.scandir(dpx_sequence.directory) as entries:
+                        present = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    present = set()
+                
+                ready = []
+                while next_frame <= dpx_sequence.last_frame:
+                    name = dpx_sequence.get_frame_name(next_frame)
+                    if name not in present:
+                        break
+                    if not finished and dpx_sequence.get_frame_name(next_frame + 1) not in present:
+                        break
+                    ready.append(next_frame)
+                    next_frame += 1
+                
+                if ready and geometry is None:
+                    width, height = self.oiio._get_input_dimensions(dpx_sequence, result)
+                    if width is None:
+                        result.add_error(
+                            f"Could not read the dimensions of {dpx_sequence.full_pattern}; "
+                            f"no frames were transformed"
+                        )
+                        # Don't leave rawexporter writing DPX frames behind us
+                        conversion_done.wait()
+                        break
+                    geometry = self.oiio._compute_geometry(width, height)
+                
+                for frame in ready:
+                    futures.append(executor.submit(
+                        self._transform_frame, dpx_sequence, output_sequence, frame, geometry, result
+                    ))
+                
+                if finished and not ready:
+                    # Tool exited and no more frames will appear
+                    break
+                if not ready:
+                    conversion_done.wait(self.POLL_INTERVAL)
+        
+        return sum(1 for future in futures if not future.result())
+    
+    def _transform_frame(
+        self,
+        dpx_sequence: ImageSequence,
+        output_sequence: ImageSequence,
+        frame: int,
+        geometry: dict,
+        result: ProcessingResult
+    ) -> bool:
+        """Transform one frame and drop its DPX once the EXR is written."""
+        input_file = dpx_sequence.get_frame_path(frame)
+        ok = self.oiio._process_single_frame(
+            input_file=input_file,
+            output_file=output_sequence.get_frame_path(frame),
+            result=result,
+            **geometry
+        )
+        if ok and not self.keep_dpx:
+            try:
+                input_file.unlink()
+            except OSError:
+                pass
+        return ok
@@ -2,15 +2,802 @@
 Stage for integrating with Kitsu asset management system.
 Creates shots, uploads proxies, and updates metadata.
 """
+import base64
+import functools
+import hashlib
+import json
+import logging
+import os
+import mimetypes
+import operator
+import sqlite3
+from email.utils import parsedate_to_datetime
+import random
 import gazu
-from typing import Optional, Dict, Any, List
+import requests
+from gazu.exception import (
+    NotAuthenticatedException,
+    RouteNotFoundException,
+    ServerErrorException
+)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from pathlib import Path
+import threading
 import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .base import PipelineStage
 from ..models import ProcessingResult, ShotInfo
 from ..config import KitsuConfig, PipelineConfig
 
+# Optional: stream preview uploads instead of buffering the whole file
+try:
+    from requests_toolbelt import MultipartEncoder
+    HAS_TOOLBELT = True
+except ImportError:
+    HAS_TOOLBELT = False
+
+# Optional: faster JSON decoding of responses read outside gazu
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+logger = logging.getLogger("pipeline.kitsu")
+
+# Statuses gazu passes through without raising, but which mean "try again later"
+RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+
+
+class _RateLimitTracker:
+    """
+    Track the server's rate-limit headers and throttle before hitting them.
+    
+    Fed by a response hook on gazu's HTTP session. When fewer than
+    THRESHOLD of the advertised requests remain in the current window, or
+    a 429 asked us to back off, wait_if_throttled() sleeps until the
+    window resets.
+    """
+    
+    THRESHOLD = 0.1
+    # Pause used when the server doesn't say when the window resets
+    DEFAULT_PAUSE = 1.0
+    # Longest single pause, whatever the server's headers say
+    MAX_PAUSE = 60.0
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.blocked_until = 0.0
+    
+    def update(self, response: requests.Response):
+        """Record rate-limit headers from a response."""
+        headers = response.headers
+        with self._lock:
+            try:
+                if 'X-RateLimit-Limit' in headers:
+                    self.limit = int(headers['X-RateLimit-Limit'])
+                if 'X-RateLimit-Remaining' in headers:
+                    self.remaining = int(headers['X-RateLimit-Remaining'])
+                if 'X-RateLimit-Reset' in headers:
+                    reset = float(headers['X-RateLimit-Reset'])
+                    # Either an epoch timestamp or seconds until reset
+                    self.reset_at = reset if reset > 1e9 else time.time() + reset
+            except ValueError:
+                pass
+            
+            if response.status_code == 429:
+                retry_after = _parse_retry_after(response)
+                if retry_after is not None:
+                    self.blocked_until = max(self.blocked_until, time.time() + retry_after)
+    
+    def wait_if_throttled(self):
+        """Sleep if the server told us to back off or the window is nearly spent."""
+        with self._lock:
+            now = time.time()
+            delay = self.blocked_until - now
+            if (
+                self.limit and self.remaining is not None
+                and self.remaining < self.limit * self.THRESHOLD
+            ):
+                window_delay = self.reset_at - now if self.reset_at else self.DEFAULT_PAUSE
+                delay = max(delay, window_delay)
+                # Assume the window resets after we've waited for it
+                self.remaining = None
+        
+        delay = min(delay, self.MAX_PAUSE)
+        if delay > 0:
+            logger.info("Kitsu rate limit nearly reached, waiting %.1fs", delay)
+            time.sleep(delay)
+
+
+_rate_limits = _RateLimitTracker()
+
+
+def _parse_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """
+    Read a Retry-After header as a delay in seconds.
+    
+    Args:
+        response: HTTP response (may be None)
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or unparseable
+    """
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _track_rate_limit(response: requests.Response, *args, **kwargs):
+    """requests response hook feeding the rate-limit tracker."""
+    _rate_limits.update(response)
+
+
+def _raise_for_retryable_status(response: requests.Response, *args, **kwargs):
+    """requests response hook turning throttled/unavailable responses into HTTPError."""
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        raise requests.HTTPError(
+            f"{response.status_code} {response.reason} for url: {response.url}",
+            response=response
+        )
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Decide whether a failed Kitsu call is worth retrying.
+    
+    Server errors, throttling and network failures are transient; any
+    other 4xx (bad parameters, missing route, permissions) fails fast.
+    """
+    if isinstance(error, (ServerErrorException, requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return False
+
+
+def kitsu_retry(
+    max_attempts: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5
+) -> Callable:
+    """
+    Decorator retrying transient Kitsu failures with exponential backoff.
+    
+    A Retry-After header on the failed response overrides the computed
+    backoff (still limited to `cap`), and every attempt first waits out
+    any rate-limit window.
+    
+    Args:
+        max_attempts: Total number of attempts, including the first one
+        base: Delay before the first retry, in seconds
+        cap: Maximum delay between attempts, in seconds
+        jitter: Random fraction added to each delay to spread out retries
+        
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            attempt = 0
+            relogged = False
+            while True:
+                _rate_limits.wait_if_throttled()
+                try:
+                    return func(*args, **kwargs)
+                except NotAuthenticatedException:
+                    # A cached token the server no longer accepts: log in
+                    # again once, then give up
+                    if relogged or not _KitsuSession.renew_cached_logins():
+                        raise
+                    relogged = True
+                except Exception as e:
+                    attempt += 1
+                    if attempt >= max_attempts or not _is_retryable(e):
+                        raise
+                    delay = _parse_retry_after(getattr(e, 'response', None))
+                    if delay is None:
+                        delay = base * 2 ** (attempt - 1) * (1 + random.uniform(0, jitter))
+                    delay = min(cap, delay)
+                    logger.warning(
+                        "%s failed (%s), retrying in %.1fs (attempt %d/%d)",
+                        func.__name__, e, delay, attempt + 1, max_attempts
+                    )
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+class AdmissionController:
+    """
+    AIMD concurrency limit for Kitsu uploads.
+    
+    Like TCP congestion control: every upload that succeeds within the
+    target latency raises the limit by `alpha`; every transient failure
+    (throttling, server error, network) multiplies it by `beta`. Callers
+    wrap each upload in `with controller.admit():`.
+    """
+    
+    def __init__(
+        self,
+        initial: float = KitsuConfig.UPLOAD_INITIAL_CONCURRENCY,
+        max_concurrency: float = KitsuConfig.UPLOAD_MAX_CONCURRENCY,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        target_latency: float = KitsuConfig.UPLOAD_TARGET_LATENCY
+    ):
+        """
+        Initialize the controller.
+        
+        Args:
+            initial: Starting concurrency limit
+            max_concurrency: Upper bound for the limit
+            alpha: Additive increase per fast success
+            beta: Multiplicative decrease factor on failure
+            target_latency: Successes slower than this (seconds) don't grow the limit
+        """
+        self.concurrency = float(initial)
+        self.max_concurrency = float(max_concurrency)
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self._in_flight = 0
+        self._condition = threading.Condition()
+    
+    @contextmanager
+    def admit(self):
+        """Block until a slot is free, then run the wrapped call in it."""
+        with self._condition:
+            while self._in_flight >= max(1, int(self.concurrency)):
+                self._condition.wait()
+            self._in_flight += 1
+        
+        start = time.monotonic()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            latency = time.monotonic() - start
+            with self._condition:
+                self._in_flight -= 1
+                if error is None:
+                    if latency <= self.target_latency:
+                        self.concurrency = min(self.max_concurrency, self.concurrency + self.alpha)
+                elif isinstance(error, Exception) and _is_retryable(error):
+                    self.concurrency = max(1.0, self.concurrency * self.beta)
+                    logger.info("Kitsu upload concurrency reduced to %d", int(self.concurrency))
+                self._condition.notify_all()
+
+
+_upload_admission = AdmissionController()
+
+
+def _idempotency_key(shot_id: str, proxy_path: Path) -> str:
+    """
+    Key identifying one upload of one proxy file to one shot.
+    
+    The key changes whenever the proxy is re-rendered (mtime or size), so a
+    new render is always uploaded while a retry or re-run of the same file
+    is recognised as a duplicate.
+    """
+    stat = proxy_path.stat()
+    return hashlib.sha256(
+        f"{shot_id}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+    ).hexdigest()
+
+
+class _UploadLedger:
+    """
+    Local record of completed preview uploads, keyed by idempotency key.
+    
+    Lets a re-run of the same shot skip the upload after a cheap check that
+    the preview still exists on the server.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "key TEXT PRIMARY KEY, preview_id TEXT NOT NULL, "
+                "comment_id TEXT, created REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded upload for key, or None."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT preview_id, comment_id FROM uploads WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug("Upload ledger unavailable: %s", e)
+            return None
+        if row is None:
+            return None
+        return {'preview_id': row[0], 'comment_id': row[1]}
+    
+    def put(self, key: str, preview_id: str, comment_id: Optional[str] = None):
+        """Record a completed upload."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?)",
+                    (key, preview_id, comment_id, time.time())
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug("Could not record upload in ledger: %s", e)
+    
+    def discard(self, key: str):
+        """Forget a recorded upload (e.g. the preview was deleted on the server)."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM uploads WHERE key = ?", (key,))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug("Could not update upload ledger: %s", e)
+
+
+_upload_ledger = _UploadLedger(KitsuConfig.UPLOAD_LEDGER_FILE)
+
+
+# ShotInfo fields read by _update_metadata, fetched in one call per shot
+_METADATA_FIELDS = operator.attrgetter(
+    'shot_name', 'output_plates_path', 'output_proxy_path', 'source_raw_path',
+    'first_frame', 'last_frame', 'total_frames', 'frame_range', 'editorial_info'
+)
+
+# Dropdown/hardcoded metadata columns, the same for every shot
+_STATIC_METADATA = {
+    'bit_depth': "16 Bit (Half Float)",
+    'working_colorspace': "ACEScg",
+    'source_colorspace': "SLog3",
+    'resolution': "3840x2160",
+    'fps': 23.976,
+}
+
+# Retrying wrappers around the gazu calls made on every shot
+_get_project_by_name = kitsu_retry()(gazu.project.get_project_by_name)
+_get_task_status_by_short_name = kitsu_retry()(gazu.task.get_task_status_by_short_name)
+_all_tasks_for_shot = kitsu_retry()(gazu.task.all_tasks_for_shot)
+_all_shots_for_project = kitsu_retry()(gazu.shot.all_shots_for_project)
+_upload_preview_file = kitsu_retry()(gazu.task.upload_preview_file)
+_get_preview_file = kitsu_retry()(gazu.files.get_preview_file)
+
+
+@kitsu_retry()
+def _upload_file_streaming(
+    path: str,
+    file_path: str,
+    idempotency_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Upload a file to a Kitsu route as a streamed multipart body.
+    
+    Equivalent to gazu.client.upload(), but the file is read in chunks by
+    MultipartEncoder while it's sent, so memory use doesn't grow with
+    the file size.
+    
+    Args:
+        path: API route (e.g. "pictures/preview-files/<id>")
+        file_path: File to upload
+        idempotency_key: Sent as X-Idempotency-Key so a server that honours
+            it can drop a duplicate of an upload that was retried
+        
+    Returns:
+        Decoded JSON response
+    """
+    http_session = gazu.client.default_client.session
+    content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    
+    # A second pass is only needed when gazu refreshed an expired token
+    for _ in range(2):
+        with open(file_path, 'rb') as f:
+            encoder = MultipartEncoder(
+                fields={'file': (Path(file_path).name, f, content_type)}
+            )
+            headers = gazu.client.make_auth_header()
+            headers['Content-Type'] = encoder.content_type
+            if idempotency_key:
+                headers['X-Idempotency-Key'] = idempotency_key
+            response = http_session.post(
+                gazu.client.get_full_url(path),
+                data=encoder,
+                headers=headers
+            )
+        _, retry = gazu.client.check_status(response, path)
+        if not retry:
+            if HAS_ORJSON:
+                return orjson.loads(response.content)
+            return response.json()
+    raise NotAuthenticatedException(path)
+
+
+def _publish_preview_streaming(
+    task: Dict[str, Any],
+    task_status: Any,
+    comment: str,
+    preview_file_path: str,
+    idempotency_key: Optional[str] = None
+):
+    """
+    Streaming version of gazu.task.publish_preview().
+    
+    Creates the comment and preview records, then uploads the file with
+    _upload_file_streaming(). Only the upload itself is retried, so a
+    transient failure never posts the comment twice.
+    
+    Returns:
+        Tuple of (comment, preview file) dicts
+    """
+    new_comment = gazu.task.add_comment(task, task_status, comment=comment)
+    preview_file = gazu.task.create_preview(task, new_comment)
+    preview_file = _upload_file_streaming(
+        f"pictures/preview-files/{preview_file['id']}",
+        preview_file_path,
+        idempotency_key=idempotency_key
+    )
+    return new_comment, preview_file
+
+
+def _publish_preview(
+    task: Dict[str, Any],
+    task_status: Any,
+    comment: str,
+    preview_file_path: str
+):
+    """
+    gazu.task.publish_preview() with only the file upload retried.
+    
+    publish_preview() posts the comment and creates the preview record
+    before uploading, so retrying it as a whole would leave a duplicate
+    comment and preview revision behind each failed upload.
+    
+    Returns:
+        Tuple of (comment, preview file) dicts
+    """
+    new_comment = gazu.task.add_comment(task, task_status, comment=comment)
+    preview_file = gazu.task.create_preview(task, new_comment)
+    preview_file = _upload_preview_file(preview_file, preview_file_path)
+    return new_comment, preview_file
+
+
+def _token_expiry(token: Optional[str]) -> Optional[float]:
+    """
+    Read the expiry time from a JWT access token without verifying it.
+    
+    Returns:
+        Expiry as a Unix timestamp, or None if the token can't be decoded
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class _KitsuSession:
+    """
+    Process-wide Kitsu authentication state and lookup caches.
+    
+    Shared by every Kitsu stage talking to the same host with the same
+    login, so constructing a stage per shot does not log in again or
+    re-fetch task types, output types and statuses.
+    """
+    
+    _instances: Dict[tuple, "_KitsuSession"] = {}
+    _lock = threading.Lock()
+    
+    # Connection pool size for gazu's shared requests.Session
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
+    
+    def __init__(self, host: str, email: str):
+        self.host = host
+        self.email = email
+        self.authenticated = False
+        self.project = None
+        self.task_type_map: Optional[Dict[str, Any]] = None
+        self.output_type_map: Optional[Dict[str, Any]] = None
+        self.todo_status: Optional[Dict[str, Any]] = None
+        self._projects: Dict[str, Dict[str, Any]] = {}
+        self._task_statuses: Dict[str, Dict[str, Any]] = {}
+        # Shots by (sequence name, shot name), per project ID
+        self._shots: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        self._shots_lock = threading.Lock()
+        # Serializes sequence/shot creation between concurrent workers
+        self.create_lock = threading.Lock()
+        self._login_lock = threading.Lock()
+        self._password: Optional[str] = None
+        # True while running on a token from the cache the server hasn't
+        # been asked about yet
+        self._unverified_token = False
+    
+    @classmethod
+    def get(cls, host: str, email: str) -> "_KitsuSession":
+        """
+        Get the shared session for a host/login pair, creating it if needed.
+        
+        Args:
+            host: Kitsu API host URL
+            email: Login email
+            
+        Returns:
+            Shared session object
+        """
+        key = (host, email)
+        with cls._lock:
+            session = cls._instances.get(key)
+            if session is None:
+                session = cls(host, email)
+                cls._instances[key] = session
+            return session
+    
+    def log_in(self, password: str):
+        """
+        Log in to Kitsu unless this session is already authenticated.
+        
+        Args:
+            password: Login password
+        """
+        with self._login_lock:
+            if self.authenticated:
+                return
+            gazu.set_host(self.host)
+            self._configure_http_session()
+            self._password = password
+            if self._restore_tokens():
+                logger.debug("Reusing cached Kitsu token")
+            else:
+                gazu.log_in(self.email, password)
+                self._save_tokens()
+            self.authenticated = True
+    
+    @classmethod
+    def renew_cached_logins(cls) -> bool:
+        """
+        Log in again for sessions still running on an unverified cached token.
+        
+        Returns:
+            True if any session logged in again
+        """
+        with cls._lock:
+            sessions = [s for s in cls._instances.values() if s._unverified_token]
+        
+        renewed = False
+        for session in sessions:
+            with session._login_lock:
+                if not session._unverified_token:
+                    continue
+                logger.info("Cached Kitsu token rejected, logging in again")
+                gazu.log_in(session.email, session._password)
+                session._save_tokens()
+                session._unverified_token = False
+                renewed = True
+        return renewed
+    
+    # Trust a cached token without asking the server if it has at least
+    # this many seconds left
+    TOKEN_EXPIRY_MARGIN = 60
+    
+    def _restore_tokens(self) -> bool:
+        """
+        Reuse the token saved by a previous run, if it is still valid.
+        
+        A token with more than TOKEN_EXPIRY_MARGIN seconds left is used as
+        is; otherwise one cheap authenticated call checks it first (gazu
+        refreshes an expired access token on its own).
+        
+        Returns:
+            True if the cached token can be used
+        """
+        token_file = KitsuConfig.TOKEN_CACHE_FILE
+        try:
+            cached = json.loads(token_file.read_text())
+        except (OSError, ValueError):
+            return False
+        
+        if cached.get('host') != self.host or cached.get('email') != self.email:
+            return False
+        
+        gazu.client.set_tokens({
+            'access_token': cached.get('access_token'),
+            'refresh_token': cached.get('refresh_token'),
+        })
+        
+        expires = cached.get('exp')
+        if expires is not None and expires - time.time() > self.TOKEN_EXPIRY_MARGIN:
+            self._unverified_token = True
+            return True
+        
+        try:
+            # Cheap authenticated call to check the token
+            gazu.client.get_current_user()
+            return True
+        except Exception as e:
+            logger.debug("Cached Kitsu token rejected: %s", e)
+            return False
+    
+    def _save_tokens(self):
+        """Write the current tokens to the cache file, readable only by the user."""
+        token_file = KitsuConfig.TOKEN_CACHE_FILE
+        tokens = gazu.client.default_client.tokens or {}
+        cached = {
+            'host': self.host,
+            'email': self.email,
+            'access_token': tokens.get('access_token'),
+            'refresh_token': tokens.get('refresh_token'),
+            'exp': _token_expiry(tokens.get('access_token')),
+        }
+        # Write a private temp file and rename it over the cache, so a
+        # concurrent run never reads a half-written file
+        tmp_file = token_file.with_name(f"{token_file.name}.{os.getpid()}.tmp")
+        try:
+            token_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(str(tmp_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cached, f)
+            os.chmod(tmp_file, 0o600)
+            os.replace(tmp_file, token_file)
+        except OSError as e:
+            logger.warning("Could not cache Kitsu token: %s", e)
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+    
+    def _configure_http_session(self):
+        """
+        Mount a keep-alive connection pool on gazu's requests.Session.
+        
+        Every gazu call goes through the default client's session, so a
+        pooled adapter lets successive calls reuse the same TCP/TLS
+        connection instead of reconnecting.
+        """
+        http_session = gazu.client.default_client.session
+        # Transport-level retries only cover failed connects and dropped
+        # keep-alive connections on idempotent requests; status codes are
+        # left to kitsu_retry
+        retries = Retry(
+            total=3,
+            connect=3,
+            read=2,
+            status=0,
+            backoff_factor=0.5,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retries
+        )
+        http_session.mount("https://", adapter)
+        http_session.mount("http://", adapter)
+        
+        response_hooks = http_session.hooks.setdefault("response", [])
+        for hook in (_track_rate_limit, _raise_for_retryable_status):
+            if hook not in response_hooks:
+                response_hooks.append(hook)
+    
+    def get_task_type_map(self) -> Dict[str, Any]:
+        """Get all task types indexed by name (fetched once)."""
+        if self.task_type_map is None:
+            self.task_type_map = {tt['name']: tt for tt in gazu.task.all_task_types()}
+        return self.task_type_map
+    
+    def get_output_type_map(self) -> Dict[str, Any]:
+        """Get all output types indexed by name (fetched once)."""
+        if self.output_type_map is None:
+            self.output_type_map = {ot['name']: ot for ot in gazu.files.all_output_types()}
+        return self.output_type_map
+    
+    def get_project(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a project by name, fetching it from Kitsu only the first time.
+        
+        Args:
+            project_name: Kitsu project name
+            
+        Returns:
+            Project dict, or None if it doesn't exist
+        """
+        project = self._projects.get(project_name)
+        if project is None:
+            project = _get_project_by_name(project_name)
+            if project:
+                self._projects[project_name] = project
+        return project
+    
+    def get_shots(self, project: Dict[str, Any]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Get every shot of a project, fetched with one request.
+        
+        Shot names are only unique within a sequence, so shots are indexed
+        by (sequence name, shot name).
+        
+        Args:
+            project: Project dict
+            
+        Returns:
+            Dict mapping (sequence name, shot name) to shot dict (shared; don't modify)
+        """
+        with self._shots_lock:
+            shots = self._shots.get(project['id'])
+            if shots is None:
+                shots = {
+                    (shot.get('sequence_name'), shot['name']): shot
+                    for shot in _all_shots_for_project(project)
+                }
+                self._shots[project['id']] = shots
+            return shots
+    
+    def add_shot(self, project: Dict[str, Any], sequence_name: str, shot: Dict[str, Any]):
+        """
+        Record a newly created shot in the project's shot cache.
+        
+        Args:
+            project: Project dict
+            sequence_name: Name of the shot's sequence
+            shot: Shot dict returned by Kitsu
+        """
+        with self._shots_lock:
+            shots = self._shots.get(project['id'])
+            if shots is not None:
+                shots[(sequence_name, shot['name'])] = shot
+    
+    def get_task_status(self, short_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a task status by short name (e.g. "wfa"), cached per session.
+        
+        Args:
+            short_name: Task status short name
+            
+        Returns:
+            Task status dict, or None if it doesn't exist
+        """
+        status = self._task_statuses.get(short_name)
+        if status is None:
+            status = _get_task_status_by_short_name(short_name)
+            if status:
+                self._task_statuses[short_name] = status
+        return status
+
 
 class KitsuIntegrationStage(PipelineStage):
     """
@@ -33,12 +820,16 @@ class KitsuIntegrationStage(PipelineStage):
         "Final Compositing"
     ]
     
+    # Output file metadata viewer (localhost for now - change this when deployed)
+    VIEWER_BASE_URL = "http://localhost:5000"
+    
     def __init__(
         self,
         kitsu_host: Optional[str] = None,
         email: Optional[str] = None,
         password: Optional[str] = None,
         project_name: Optional[str] = None,
+        max_workers: int = 8,
         **kwargs
     ):
         """
@@ -49,14 +840,37 @@ class KitsuIntegrationStage(PipelineStage):
             email: Login email
             password: Login password
             project_name: Kitsu project name (e.g., "DRIVER ED")
+            max_workers: Shots registered concurrently in process_batch()
         """
         super().__init__(**kwargs)
         self.kitsu_host = kitsu_host or KitsuConfig.KITSU_HOST
         self.email = email or KitsuConfig.KITSU_EMAIL
         self.password = password or KitsuConfig.KITSU_PASSWORD
         self.project_name = project_name or KitsuConfig.KITSU_PROJECT
-        self.authenticated = False
-        self.project = None
+        self.max_workers = max(1, min(max_workers, _KitsuSession.POOL_MAXSIZE))
+        self._session = _KitsuSession.get(self.kitsu_host, self.email)
+        
+        # URL templates are invariant per host; build them once
+        kitsu_web_base = (self.kitsu_host or '').replace('/api', '')
+        self._shot_url_tmpl = f"{kitsu_web_base}/productions/{{project_id}}/shots/{{id}}/"
+        self._episode_shot_url_tmpl = (
+            f"{kitsu_web_base}/productions/{{project_id}}/episodes/{{episode_id}}/shots/{{id}}/"
+        )
+        self._viewer_url_tmpl = f"{self.VIEWER_BASE_URL}/output-file/{{id}}"
+    
+    @property
+    def authenticated(self) -> bool:
+        """Whether the shared Kitsu session is logged in."""
+        return self._session.authenticated
+    
+    @property
+    def project(self) -> Optional[Dict[str, Any]]:
+        """Project cached on the shared Kitsu session."""
+        return self._session.project
+    
+    @project.setter
+    def project(self, value: Optional[Dict[str, Any]]):
+        self._session.project = value
     
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -75,6 +889,8 @@ class KitsuIntegrationStage(PipelineStage):
                 - upload_proxy: Whether to upload proxy (default: True)
                 - create_tasks: Whether to create pipeline tasks (default: True)
                 - create_output_files: Whether to create output file records (default: True)
+                - prefetched_shot: Shot dict from KitsuQueryStage.bulk_query_shots();
+                  skips the shot lookup when given
         """
         if not self.validate_inputs(shot_info, result):
             return
@@ -93,7 +909,7 @@ class KitsuIntegrationStage(PipelineStage):
         self.logger.info(f"Processing Kitsu integration for shot: {shot_info.shot_name}")
         
         # Get or create shot
-        shot = self._get_or_create_shot(
+        shot = kwargs.get('prefetched_shot') or self._get_or_create_shot(
             project_name=project_name,
             shot_info=shot_info,
             result=result
@@ -113,9 +929,9 @@ class KitsuIntegrationStage(PipelineStage):
         output_files = {}
         if create_output_files:
             output_files = self._create_output_files(shot, shot_info, upload_task_name, result)
-            self.logger.info(f"🔍 DEBUG: output_files after creation: {list(output_files.keys())}")
+            self.logger.debug("output_files after creation: %s", list(output_files))
             for key, of in output_files.items():
-                self.logger.info(f"🔍 DEBUG: {key} output file ID: {of.get('id')}")
+                self.logger.debug("%s output file ID: %s", key, of.get('id'))
         
         # Upload proxy with links to output files in comment
         if upload_proxy and shot_info.output_proxy_path:
@@ -126,6 +942,46 @@ class KitsuIntegrationStage(PipelineStage):
         result.data['kitsu_shot_name'] = shot['name']
         self.logger.info(f"Successfully registered in Kitsu: {shot_info.shot_name}")
     
+    def process_batch(
+        self,
+        shot_infos: List[ShotInfo],
+        results: List[ProcessingResult],
+        kwargs_list: List[Dict[str, Any]]
+    ):
+        """
+        Register several shots in Kitsu concurrently.
+        
+        Each shot's Kitsu work is a chain of independent HTTP round-trips,
+        so shots are spread over a thread pool sharing gazu's pooled
+        session; proxy uploads still go through the upload admission limit.
+        
+        Args:
+            shot_infos: Shot information objects
+            results: Result objects to populate (one per shot)
+            kwargs_list: Per-shot arguments (see process())
+        """
+        if not results:
+            return
+        
+        # Log in once up front rather than racing from every worker
+        if not self._authenticate(results[0]):
+            for result in results[1:]:
+                result.add_error("Kitsu authentication failed")
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.process, shot_info, result, **shot_kwargs): (shot_info, result)
+                for shot_info, result, shot_kwargs in zip(shot_infos, results, kwargs_list)
+            }
+            for future in as_completed(futures):
+                shot_info, result = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    result.add_error(f"Stage {self.name} failed with exception: {str(e)}")
+                    self.logger.exception(f"{shot_info.shot_name}: {e}")
+    
     def _authenticate(self, result: ProcessingResult) -> bool:
         """
         Authenticate with Kitsu API using Gazu.
@@ -141,9 +997,7 @@ class KitsuIntegrationStage(PipelineStage):
             return False
         
         try:
-            gazu.set_host(self.kitsu_host)
-            gazu.log_in(self.email, self.password)
-            self.authenticated = True
+            self._session.log_in(self.password)
             self.logger.info("Authenticated with Kitsu")
             return True
             
@@ -170,43 +1024,49 @@ class KitsuIntegrationStage(PipelineStage):
             Shot dict if successful, None otherwise
         """
         try:
-            # Get project (cache it)
+            # Get project (cached on the shared session)
             if not self.project or self.project['name'] != project_name:
-                self.project = gazu.project.get_project_by_name(project_name)
+                self.project = self._session.get_project(project_name)
                 self.logger.info(f"Found project: {project_name}")
             
-            # Try to get existing shot
-            try:
-                shot = gazu.shot.get_shot_by_name(self.project, shot_info.shot_name)
+            # Look the shot up in the project's shot list (one request per
+            # project, shared by every shot of the run)
+            shot_key = (shot_info.sequence, shot_info.shot_name)
+            shot = self._session.get_shots(self.project).get(shot_key)
+            if shot:
                 self.logger.info(f"Found existing shot: {shot_info.shot_name}")
                 return shot
-            except:
-                # Shot doesn't exist, we'll create it
-                pass
             
-            # Get or create sequence
-            sequence_name = shot_info.sequence
-            try:
-                sequence = gazu.shot.get_sequence_by_name(self.project, sequence_name)
-                self.logger.info(f"Found existing sequence: {sequence_name}")
-            except:
-                sequence = gazu.shot.new_sequence(self.project, sequence_name)
-                self.logger.info(f"Created new sequence: {sequence_name}")
-            
-            # Create shot
-            shot = gazu.shot.new_shot(
-                self.project,
-                sequence,
-                shot_info.shot_name
-            )
-            self.logger.info(f"Created new shot: {shot_info.shot_name}")
-            return shot
+            # Creation is serialized so concurrent shots of a new sequence
+            # don't each create it
+            with self._session.create_lock:
+                shot = self._session.get_shots(self.project).get(shot_key)
+                if shot:
+                    return shot
+                
+                # Get or create sequence
+                sequence_name = shot_info.sequence
+                try:
+                    sequence = gazu.shot.get_sequence_by_name(self.project, sequence_name)
+                    self.logger.info(f"Found existing sequence: {sequence_name}")
+                except:
+                    sequence = gazu.shot.new_sequence(self.project, sequence_name)
+                    self.logger.info(f"Created new sequence: {sequence_name}")
+                
+                # Create shot
+                shot = gazu.shot.new_shot(
+                    self.project,
+                    sequence,
+                    shot_info.shot_name
+                )
+                self._session.add_shot(self.project, sequence_name, shot)
+                self.logger.info(f"Created new shot: {shot_info.shot_name}")
+                return shot
             
         except Exception as e:
             result.add_error(f"Failed to get/create shot in Kitsu: {str(e)}")
             self.logger.error(f"Shot creation failed: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.debug("Traceback:", exc_info=True)
             return None
     
     def _create_pipeline_tasks(
@@ -226,25 +1086,26 @@ class KitsuIntegrationStage(PipelineStage):
         """
         try:
             # Get all task types (these are global templates)
-            all_task_types = gazu.task.all_task_types()
-            task_type_map = {tt['name']: tt for tt in all_task_types}
+            task_type_map = self._session.get_task_type_map()
             
             # Get "To Do" status
-            todo_status = None
-            try:
-                todo_status = gazu.task.get_task_status_by_short_name("todo")
-            except:
+            todo_status = self._session.todo_status
+            if todo_status is None:
                 try:
-                    statuses = gazu.task.all_task_statuses()
-                    todo_status = next((s for s in statuses if s['name'].lower() == 'to do'), None)
+                    todo_status = gazu.task.get_task_status_by_short_name("todo")
                 except:
-                    pass
+                    try:
+                        statuses = gazu.task.all_task_statuses()
+                        todo_status = next((s for s in statuses if s['name'].lower() == 'to do'), None)
+                    except:
+                        pass
+                self._session.todo_status = todo_status
             
             if not todo_status:
                 self.logger.warning("'To Do' status not found, tasks will use default status")
             
             # Get existing tasks for this shot
-            existing_tasks = gazu.task.all_tasks_for_shot(shot)
+            existing_tasks = _all_tasks_for_shot(shot)
             existing_task_names = {t['task_type_name'] for t in existing_tasks}
             
             tasks_created = 0
@@ -294,8 +1155,7 @@ class KitsuIntegrationStage(PipelineStage):
         except Exception as e:
             result.add_warning(f"Failed to create pipeline tasks: {str(e)}")
             self.logger.warning(f"Task creation failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self.logger.debug("Traceback:", exc_info=True)
     
     def _update_metadata(
         self,
@@ -328,64 +1188,40 @@ class KitsuIntegrationStage(PipelineStage):
         """
         try:
             metadata = {}
+            (
+                shot_name, plates_path, proxy_path, source_raw_path,
+                first_frame, last_frame, total_frames, frame_range, editorial_info
+            ) = _METADATA_FIELDS(shot_info)
+            
+            # Final organized paths under the shot tree
+            version_root = (
+                f"{PipelineConfig.SHOT_TREE_ROOT}/{shot_name}/pla/"
+                f"{shot_name}_pla_rawPlate_v001"
+            )
+            element_name = f"{shot_name}_pla_rawPlate_v001_main_ACEScg"
             
             # EXR File Path - build the final organized path
-            if shot_info.output_plates_path:
-                # Build the expected final organized path
-                shot_root = PipelineConfig.SHOT_TREE_ROOT
-                shot_name = shot_info.shot_name
-                
-                final_path = (
-                    f"{shot_root}/{shot_name}/pla/"
-                    f"{shot_name}_pla_rawPlate_v001/main_ACEScg/"
-                    f"{shot_name}_pla_rawPlate_v001_main_ACEScg.####.exr"
-                )
-                
+            if plates_path:
+                final_path = f"{version_root}/main_ACEScg/{element_name}.####.exr"
                 metadata['exr_file_path'] = final_path
                 self.logger.debug(f"Setting EXR path: {final_path}")
             
-            # Original Clip Location - source camera file (full path)
-            if shot_info.source_raw_path:
-                metadata['original_clip_location'] = str(shot_info.source_raw_path)
-                self.logger.debug(f"Setting original clip: {shot_info.source_raw_path}")
-            
-            # Original Clip Name - just the filename (not full path)
-            if shot_info.source_raw_path:
-                original_filename = Path(shot_info.source_raw_path).name
+            # Original Clip Location (full path) and Name (just the filename)
+            if source_raw_path:
+                metadata['original_clip_location'] = str(source_raw_path)
+                self.logger.debug(f"Setting original clip: {source_raw_path}")
+                original_filename = Path(source_raw_path).name
                 metadata['original_clip_name'] = original_filename
                 self.logger.debug(f"Setting original clip name: {original_filename}")
             
             # Proxy Movie File Path
-            if shot_info.output_proxy_path:
-                # Build the final proxy path
-                shot_root = PipelineConfig.SHOT_TREE_ROOT
-                shot_name = shot_info.shot_name
-                
-                proxy_path = (
-                    f"{shot_root}/{shot_name}/pla/"
-                    f"{shot_name}_pla_rawPlate_v001/"
-                    f"{shot_name}_pla_rawPlate_v001_proxy_sRGB.mp4"
-                )
-                
-                metadata['proxy_movie_file_path'] = proxy_path
-                self.logger.debug(f"Setting proxy path: {proxy_path}")
+            if proxy_path:
+                final_proxy_path = f"{version_root}/{shot_name}_pla_rawPlate_v001_proxy_sRGB.mp4"
+                metadata['proxy_movie_file_path'] = final_proxy_path
+                self.logger.debug(f"Setting proxy path: {final_proxy_path}")
             
-            # Bit Depth - dropdown (static value)
-            metadata['bit_depth'] = "16 Bit (Half Float)"
-            
-            # Working Colorspace - dropdown (static value)
-            metadata['working_colorspace'] = "ACEScg"
-            
-            # Source Colorspace - dropdown (static value)
-            metadata['source_colorspace'] = "SLog3"
-            
-            # Resolution - hardcoded value
-            metadata['resolution'] = "3840x2160"
-            self.logger.debug("Setting resolution: 3840x2160")
-            
-            # FPS - hardcoded value
-            metadata['fps'] = 23.976
-            self.logger.debug("Setting FPS: 23.976")
+            # Bit depth, colorspaces, resolution and FPS are fixed values
+            metadata.update(_STATIC_METADATA)
             
             # Turnover Date - set to today's date
             from datetime import datetime
@@ -394,22 +1230,13 @@ class KitsuIntegrationStage(PipelineStage):
             self.logger.debug(f"Setting turnover date: {today}")
             
             # Element Name - the processed EXR filename pattern
-            shot_name = shot_info.shot_name
-            element_name = f"{shot_name}_pla_rawPlate_v001_main_ACEScg"
             metadata['element_name'] = element_name
             self.logger.debug(f"Setting element name: {element_name}")
             
             # EXR Folder Size - calculate total size of all EXR files
-            if shot_info.output_plates_path:
+            if plates_path:
                 try:
-                    # Build path to the EXR folder
-                    shot_root = PipelineConfig.SHOT_TREE_ROOT
-                    shot_name = shot_info.shot_name
-                    
-                    exr_folder = Path(
-                        f"{shot_root}/{shot_name}/pla/"
-                        f"{shot_name}_pla_rawPlate_v001/main_ACEScg/"
-                    )
+                    exr_folder = Path(f"{version_root}/main_ACEScg/")
                     
                     # Calculate total size of all EXR files
                     if exr_folder.exists():
@@ -436,26 +1263,26 @@ class KitsuIntegrationStage(PipelineStage):
                     metadata['exr_folder_size'] = "Unknown"
             
             # Frame range information
-            if shot_info.first_frame is not None:
-                metadata['frame_in'] = shot_info.first_frame
+            if first_frame is not None:
+                metadata['frame_in'] = first_frame
             
-            if shot_info.last_frame is not None:
-                metadata['frame_out'] = shot_info.last_frame
+            if last_frame is not None:
+                metadata['frame_out'] = last_frame
             
-            if shot_info.total_frames is not None:
-                metadata['frame_count'] = shot_info.total_frames
+            if total_frames is not None:
+                metadata['frame_count'] = total_frames
             
             # Frame range string (e.g., "993-1059")
-            if shot_info.frame_range:
-                metadata['frame_range'] = shot_info.frame_range
+            if frame_range:
+                metadata['frame_range'] = frame_range
             
             # Editorial/Timecode information
-            if hasattr(shot_info, 'editorial_info') and shot_info.editorial_info:
-                if hasattr(shot_info.editorial_info, 'in_point') and shot_info.editorial_info.in_point:
-                    metadata['source_tc_in'] = shot_info.editorial_info.in_point
+            if editorial_info:
+                if editorial_info.in_point:
+                    metadata['source_tc_in'] = editorial_info.in_point
                 
-                if hasattr(shot_info.editorial_info, 'out_point') and shot_info.editorial_info.out_point:
-                    metadata['source_tc_out'] = shot_info.editorial_info.out_point
+                if editorial_info.out_point:
+                    metadata['source_tc_out'] = editorial_info.out_point
             
             # Update in Kitsu
             if metadata:
@@ -468,8 +1295,7 @@ class KitsuIntegrationStage(PipelineStage):
         except Exception as e:
             result.add_warning(f"Failed to update metadata: {str(e)}")
             self.logger.warning(f"Metadata update failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self.logger.debug("Traceback:", exc_info=True)
     
     def _create_output_files(
         self,
@@ -499,34 +1325,31 @@ class KitsuIntegrationStage(PipelineStage):
         plate_metadata = {}
         
         try:
-            self.logger.info("🔍 Starting output file creation...")
+            self.logger.debug("Starting output file creation")
             
             # Get task
-            all_tasks = gazu.task.all_tasks_for_shot(shot)
-            task = None
-            for t in all_tasks:
-                if t.get('task_type_name') == task_name:
-                    task = t
-                    break
+            all_tasks = _all_tasks_for_shot(shot)
+            tasks_by_name = {t.get('task_type_name'): t for t in all_tasks}
+            task = tasks_by_name.get(task_name)
             
             if not task:
-                self.logger.warning(f"Task '{task_name}' not found, skipping output file creation")
+                self.logger.warning("Task '%s' not found, skipping output file creation", task_name)
                 return output_files
             
             # Get task type
             task_type = gazu.task.get_task_type(task['task_type_id'])
             
             # Get output types
-            output_types = gazu.files.all_output_types()
-            plate_output_type = next((ot for ot in output_types if ot['name'] == 'Plate'), None)
-            proxy_output_type = next((ot for ot in output_types if ot['name'] == 'Proxy'), None)
+            output_type_map = self._session.get_output_type_map()
+            plate_output_type = output_type_map.get('Plate')
+            proxy_output_type = output_type_map.get('Proxy')
             
             if not plate_output_type or not proxy_output_type:
                 self.logger.warning("Output types not found")
                 return output_files
             
-            self.logger.info(f"🔍 Proxy output type ID: {proxy_output_type['id']}")
-            self.logger.info(f"🔍 Plate output type ID: {plate_output_type['id']}")
+            self.logger.debug("Proxy output type ID: %s", proxy_output_type['id'])
+            self.logger.debug("Plate output type ID: %s", plate_output_type['id'])
             
             # Build metadata BEFORE creating files
             if shot_info.output_proxy_path:
@@ -573,37 +1396,37 @@ class KitsuIntegrationStage(PipelineStage):
             
             # Try to create proxy output file (ignore errors)
             if shot_info.output_proxy_path:
-                self.logger.info("🔍 Creating proxy output file...")
+                self.logger.debug("Creating proxy output file")
                 try:
                     gazu.files.new_entity_output_file(
                         shot, proxy_output_type, task_type, "",
                         representation="mov", nb_elements=1
                     )
-                    self.logger.info("✅ Proxy output file create call completed")
+                    self.logger.debug("Proxy output file create call completed")
                 except Exception as e:
-                    self.logger.info(f"⚠️ Proxy creation returned error (file may still be created): {e}")
+                    self.logger.info("Proxy creation returned error (file may still be created): %s", e)
             
             # Try to create plate output file (ignore errors)
             if shot_info.output_plates_path:
-                self.logger.info("🔍 Creating plate output file...")
+                self.logger.debug("Creating plate output file")
                 try:
                     gazu.files.new_entity_output_file(
                         shot, plate_output_type, task_type, "",
                         representation="exr",
                         nb_elements=shot_info.total_frames if shot_info.total_frames else 1
                     )
-                    self.logger.info("✅ Plate output file create call completed")
+                    self.logger.debug("Plate output file create call completed")
                 except Exception as e:
-                    self.logger.info(f"⚠️ Plate creation returned error (file may still be created): {e}")
+                    self.logger.info("Plate creation returned error (file may still be created): %s", e)
             
             # NOW fetch all output files that exist (wait 3 seconds for DB sync)
-            self.logger.info("🔍 Waiting 3 seconds for database sync...")
+            self.logger.debug("Waiting 3 seconds for database sync")
             time.sleep(3)
             
-            self.logger.info("🔍 Fetching all output files for shot...")
+            self.logger.debug("Fetching all output files for shot")
             all_output_files = gazu.files.all_output_files_for_entity(shot)
             
-            self.logger.info(f"🔍 Found {len(all_output_files)} total output files")
+            self.logger.debug("Found %d total output files", len(all_output_files))
             
             # Find proxy and plate files by output_type_id and update metadata
             for of in all_output_files:
@@ -611,7 +1434,7 @@ class KitsuIntegrationStage(PipelineStage):
                 output_type_name = of.get('output_type_name', 'Unknown')
                 file_id = of.get('id', 'no-id')
                 
-                self.logger.info(f"🔍 Found output file: {output_type_name} (type_id: {output_type_id}) - {file_id}")
+                self.logger.debug("Found output file: %s (type_id: %s) - %s", output_type_name, output_type_id, file_id)
                 
                 # Match by output_type_id instead of output_type_name
                 if output_type_id == proxy_output_type['id'] and 'proxy' not in output_files:
@@ -620,11 +1443,11 @@ class KitsuIntegrationStage(PipelineStage):
                         updated_file = gazu.files.update_output_file(of, {"data": proxy_metadata})
                         # Refetch to get the updated data
                         output_files['proxy'] = gazu.files.get_output_file(of['id'])
-                        self.logger.info("✅ Updated and refetched proxy metadata")
+                        self.logger.debug("Updated and refetched proxy metadata")
                     except Exception as e:
                         output_files['proxy'] = of
-                        self.logger.warning(f"Could not update proxy metadata: {e}")
-                    self.logger.info(f"✅ Using proxy output file: {of['id']}")
+                        self.logger.warning("Could not update proxy metadata: %s", e)
+                    self.logger.info("Using proxy output file: %s", of['id'])
                 
                 elif output_type_id == plate_output_type['id'] and 'plate' not in output_files:
                     # Update metadata
@@ -632,18 +1455,17 @@ class KitsuIntegrationStage(PipelineStage):
                         updated_file = gazu.files.update_output_file(of, {"data": plate_metadata})
                         # Refetch to get the updated data
                         output_files['plate'] = gazu.files.get_output_file(of['id'])
-                        self.logger.info("✅ Updated and refetched plate metadata")
+                        self.logger.debug("Updated and refetched plate metadata")
                     except Exception as e:
                         output_files['plate'] = of
-                        self.logger.warning(f"Could not update plate metadata: {e}")
-                    self.logger.info(f"✅ Using plate output file: {of['id']}")
+                        self.logger.warning("Could not update plate metadata: %s", e)
+                    self.logger.info("Using plate output file: %s", of['id'])
             
-            self.logger.info(f"🔍 Final output_files: {list(output_files.keys())}")
+            self.logger.debug("Final output_files: %s", list(output_files))
             
         except Exception as e:
-            self.logger.warning(f"Output file creation failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self.logger.warning("Output file creation failed: %s", e)
+            self.logger.debug("Traceback:", exc_info=True)
         
         return output_files
     
@@ -666,8 +1488,8 @@ class KitsuIntegrationStage(PipelineStage):
             result: Result object
         """
         try:
-            self.logger.info("🔍 Starting proxy upload...")
-            self.logger.info(f"🔍 output_files received: {list(output_files.keys())}")
+            self.logger.debug("Starting proxy upload")
+            self.logger.debug("output_files received: %s", list(output_files))
             
             # Validate proxy path exists
             if not shot_info.output_proxy_path:
@@ -678,103 +1500,129 @@ class KitsuIntegrationStage(PipelineStage):
             
             if not proxy_path.exists():
                 result.add_warning(f"Proxy file not found: {proxy_path}")
-                self.logger.warning(f"Proxy file not found: {proxy_path}")
+                self.logger.warning("Proxy file not found: %s", proxy_path)
                 return
             
-            self.logger.info(f"Uploading proxy: {proxy_path.name}")
-            
-            # Get all tasks for this shot
-            all_tasks = gazu.task.all_tasks_for_shot(shot)
+            self.logger.info("Uploading proxy: %s", proxy_path.name)
             
-            # Find the task by name
-            task = None
-            for t in all_tasks:
-                if t.get('task_type_name') == task_name:
-                    task = t
-                    break
+            # Get all tasks for this shot, indexed by task type name
+            all_tasks = _all_tasks_for_shot(shot)
+            tasks_by_name = {t.get('task_type_name'): t for t in all_tasks}
+            task = tasks_by_name.get(task_name)
             
             if not task:
                 result.add_warning(f"Task '{task_name}' not found for this shot")
-                self.logger.warning(f"Task '{task_name}' not found, skipping proxy upload")
+                self.logger.warning("Task '%s' not found, skipping proxy upload", task_name)
                 return
             
-            self.logger.debug(f"Found task: {task_name}")
+            self.logger.debug("Found task: %s", task_name)
             
-            # Build comment with links to output file viewer
-            comment_text = f"**{shot_info.shot_name}** - Plate v001 processed from camera raw"
+            # Skip the upload if this exact proxy was already published
+            upload_key = _idempotency_key(shot['id'], proxy_path)
+            previous = _upload_ledger.get(upload_key)
+            if previous:
+                try:
+                    _get_preview_file(previous['preview_id'])
+                except RouteNotFoundException:
+                    self.logger.debug("Recorded preview %s is gone, re-uploading", previous['preview_id'])
+                    _upload_ledger.discard(upload_key)
+                except Exception as e:
+                    # Can't tell whether the preview exists; uploading again
+                    # could duplicate it, so leave it for a later run
+                    result.add_warning(
+                        f"Could not check previous upload of {proxy_path.name}, "
+                        f"skipping proxy upload: {str(e)}"
+                    )
+                    self.logger.warning(
+                        "Could not check recorded preview %s: %s", previous['preview_id'], e
+                    )
+                    return
+                else:
+                    self.logger.info("Proxy already uploaded (preview %s), skipping", previous['preview_id'])
+                    result.data['proxy_uploaded'] = True
+                    result.data['proxy_upload_skipped'] = True
+                    result.data['proxy_file'] = str(proxy_path)
+                    result.data['comment_id'] = previous['comment_id']
+                    result.data['preview_id'] = previous['preview_id']
+                    return
             
-            self.logger.info(f"🔍 Building comment... output_files has {len(output_files)} items")
+            # Build comment with links to output file viewer
+            comment_parts = [f"**{shot_info.shot_name}** - Plate v001 processed from camera raw"]
             
-            # Get viewer URL (localhost for now - change this when deployed)
-            viewer_base_url = "http://localhost:5000"
+            self.logger.debug("Building comment, output_files has %d items", len(output_files))
             
             # Add output file links
             if output_files:
-                self.logger.info("🔍 output_files is NOT empty, adding viewer links...")
+                self.logger.debug("Adding viewer links")
                 
-                comment_text += f"\n\n**Output Files:**"
+                comment_parts.append("\n\n**Output Files:**")
                 
                 # Add proxy link
                 if 'proxy' in output_files:
-                    proxy_file = output_files['proxy']
-                    proxy_id = proxy_file['id']
-                    proxy_viewer_url = f"{viewer_base_url}/output-file/{proxy_id}"
-                    comment_text += f"\n• [View Proxy Metadata]({proxy_viewer_url})"
-                    self.logger.info(f"✅ Added proxy viewer link: {proxy_viewer_url}")
+                    proxy_viewer_url = self._viewer_url_tmpl.format_map(output_files['proxy'])
+                    comment_parts.append(f"\n• [View Proxy Metadata]({proxy_viewer_url})")
+                    self.logger.debug("Added proxy viewer link: %s", proxy_viewer_url)
                 
                 # Add plate link
                 if 'plate' in output_files:
                     plate_file = output_files['plate']
-                    plate_id = plate_file['id']
-                    plate_viewer_url = f"{viewer_base_url}/output-file/{plate_id}"
+                    plate_viewer_url = self._viewer_url_tmpl.format_map(plate_file)
                     
                     # Get quick summary from metadata
                     plate_data = plate_file.get('data') or {}
                     size = plate_data.get('total_size', 'Unknown')
                     frames = plate_data.get('frame_range', 'Unknown')
                     
-                    comment_text += f"\n• [View Plate Metadata]({plate_viewer_url}) - {size} | {frames}"
-                    self.logger.info(f"✅ Added plate viewer link: {plate_viewer_url}")
+                    comment_parts.append(f"\n• [View Plate Metadata]({plate_viewer_url}) - {size} | {frames}")
+                    self.logger.debug("Added plate viewer link: %s", plate_viewer_url)
                 
                 # Build correct Kitsu shot URL
-                kitsu_base_url = self.kitsu_host.replace('/api', '')
-                project_id = shot.get('project_id')
-                shot_id = shot.get('id')
-                episode_id = shot.get('episode_id')
-                
-                if episode_id:
-                    shot_url = f"{kitsu_base_url}/productions/{project_id}/episodes/{episode_id}/shots/{shot_id}/"
+                if shot.get('episode_id'):
+                    shot_url = self._episode_shot_url_tmpl.format_map(shot)
                 else:
-                    shot_url = f"{kitsu_base_url}/productions/{project_id}/shots/{shot_id}/"
+                    shot_url = self._shot_url_tmpl.format_map(shot)
                 
-                comment_text += f"\n\n[→ View Shot in Kitsu]({shot_url})"
+                comment_parts.append(f"\n\n[→ View Shot in Kitsu]({shot_url})")
                 
-                self.logger.info(f"✅ Added output file viewer links")
+                self.logger.info("Added output file viewer links")
             else:
-                self.logger.warning("⚠️ output_files is EMPTY!")
+                self.logger.warning("No output files to link in comment")
             
-            self.logger.info(f"🔍 FINAL COMMENT TEXT:\n{comment_text}")
+            comment_text = "".join(comment_parts)
+            self.logger.debug("Final comment text:\n%s", comment_text)
             
             # Get "Waiting for Approval" status
             try:
-                wfa_status = gazu.task.get_task_status_by_short_name("wfa")
+                wfa_status = self._session.get_task_status("wfa")
             except:
                 # If "wfa" doesn't exist, use current task status
                 wfa_status = task.get('task_status_id')
                 self.logger.debug("Using default task status (wfa not found)")
             
             # Publish preview with comment
-            self.logger.info(f"Publishing preview with {proxy_path.stat().st_size / (1024*1024):.2f}MB...")
+            self.logger.info("Publishing preview with %.2fMB...", proxy_path.stat().st_size / (1024*1024))
+            
+            with _upload_admission.admit():
+                if HAS_TOOLBELT:
+                    comment, preview = _publish_preview_streaming(
+                        task,
+                        wfa_status,
+                        comment=comment_text,
+                        preview_file_path=str(proxy_path),
+                        idempotency_key=upload_key
+                    )
+                else:
+                    comment, preview = _publish_preview(
+                        task,
+                        wfa_status,
+                        comment=comment_text,
+                        preview_file_path=str(proxy_path)
+                    )
             
-            comment, preview = gazu.task.publish_preview(
-                task,
-                wfa_status,
-                comment=comment_text,
-                preview_file_path=str(proxy_path)
-            )
+            _upload_ledger.put(upload_key, preview.get('id'), comment.get('id'))
             
-            self.logger.info(f"✅ Preview published! Comment ID: {comment.get('id')}")
-            self.logger.info(f"✅ Uploaded proxy to Kitsu: {proxy_path.name}")
+            self.logger.info("Preview published, comment ID: %s", comment.get('id'))
+            self.logger.info("Uploaded proxy to Kitsu: %s", proxy_path.name)
             result.data['proxy_uploaded'] = True
             result.data['proxy_file'] = str(proxy_path)
             result.data['comment_id'] = comment.get('id')
@@ -782,9 +1630,8 @@ class KitsuIntegrationStage(PipelineStage):
             
         except Exception as e:
             result.add_warning(f"Failed to upload proxy: {str(e)}")
-            self.logger.warning(f"Proxy upload failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self.logger.warning("Proxy upload failed: %s", e)
+            self.logger.debug("Traceback:", exc_info=True)
     
     def validate_inputs(self, shot_info: ShotInfo, result: ProcessingResult) -> bool:
         """Validate inputs before processing."""
@@ -819,13 +1666,29 @@ class KitsuQueryStage(PipelineStage):
         kitsu_host: Optional[str] = None,
         email: Optional[str] = None,
         password: Optional[str] = None,
+        max_workers: int = 8,
         **kwargs
     ):
+        """
+        Initialize Kitsu query stage.
+        
+        Args:
+            kitsu_host: Kitsu API host URL
+            email: Login email
+            password: Login password
+            max_workers: Concurrent queries in process_batch()
+        """
         super().__init__(**kwargs)
         self.kitsu_host = kitsu_host or KitsuConfig.KITSU_HOST
         self.email = email or KitsuConfig.KITSU_EMAIL
         self.password = password or KitsuConfig.KITSU_PASSWORD
-        self.authenticated = False
+        self.max_workers = max(1, min(max_workers, _KitsuSession.POOL_MAXSIZE))
+        self._session = _KitsuSession.get(self.kitsu_host, self.email)
+    
+    @property
+    def authenticated(self) -> bool:
+        """Whether the shared Kitsu session is logged in."""
+        return self._session.authenticated
     
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -837,6 +1700,8 @@ class KitsuQueryStage(PipelineStage):
             **kwargs: Query parameters
                 - query_type: 'project', 'shot', 'output_types'
                 - project_name: Project name to query
+                - prefetched_shot: Shot dict from bulk_query_shots(); skips the
+                  per-shot HTTP lookup when given
         """
         query_type = kwargs.get('query_type', 'shot')
         
@@ -847,19 +1712,61 @@ class KitsuQueryStage(PipelineStage):
         if query_type == 'project':
             self._query_project(kwargs.get('project_name'), result)
         elif query_type == 'shot':
-            self._query_shot(shot_info, kwargs.get('project_name'), result)
+            self._query_shot(
+                shot_info,
+                kwargs.get('project_name'),
+                result,
+                prefetched_shot=kwargs.get('prefetched_shot')
+            )
         elif query_type == 'output_types':
             self._query_output_types(result)
     
+    def process_batch(
+        self,
+        shot_infos: List[ShotInfo],
+        results: List[ProcessingResult],
+        kwargs_list: List[Dict[str, Any]]
+    ):
+        """
+        Run queries for several shots concurrently.
+        
+        Kitsu queries are independent and I/O bound, so they are spread
+        over a thread pool sharing gazu's pooled HTTP session.
+        
+        Args:
+            shot_infos: Shot information objects
+            results: Result objects to populate (one per shot)
+            kwargs_list: Per-shot query parameters (see process())
+        """
+        if not results:
+            return
+        
+        # Log in once up front rather than racing from every worker
+        if not self._authenticate(results[0]):
+            for result in results[1:]:
+                result.add_error("Kitsu authentication failed")
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.process, shot_info, result, **shot_kwargs): (shot_info, result)
+                for shot_info, result, shot_kwargs in zip(shot_infos, results, kwargs_list)
+            }
+            for future in as_completed(futures):
+                shot_info, result = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    result.add_error(f"Kitsu query failed: {str(e)}")
+                    self.logger.warning(f"Query failed for {shot_info.shot_name}: {e}")
+    
     def _authenticate(self, result: ProcessingResult) -> bool:
         """Authenticate with Kitsu."""
         if self.authenticated:
             return True
         
         try:
-            gazu.set_host(self.kitsu_host)
-            gazu.log_in(self.email, self.password)
-            self.authenticated = True
+            self._session.log_in(self.password)
             self.logger.info("Successfully authenticated with Kitsu")
             return True
         except Exception as e:
@@ -869,7 +1776,7 @@ class KitsuQueryStage(PipelineStage):
     def _query_project(self, project_name: str, result: ProcessingResult):
         """Query project information."""
         try:
-            project = gazu.project.get_project_by_name(project_name)
+            project = self._session.get_project(project_name)
             result.data['project_info'] = {
                 'id': project['id'],
                 'name': project['name'],
@@ -881,11 +1788,44 @@ class KitsuQueryStage(PipelineStage):
             result.data['project_info'] = {'exists': False}
             result.add_warning(f"Project not found: {project_name}")
     
-    def _query_shot(self, shot_info: ShotInfo, project_name: str, result: ProcessingResult):
+    def bulk_query_shots(
+        self,
+        project_name: str,
+        shot_keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """
+        Look up many shots of a project with a single request.
+        
+        Fetches every shot of the project once and answers each lookup from
+        memory. Pass the returned dicts to process() as `prefetched_shot`.
+        
+        Args:
+            project_name: Kitsu project name
+            shot_keys: (sequence name, shot name) of the shots to look up
+            
+        Returns:
+            Dict mapping each key to its shot dict (None if not found)
+        """
+        self._session.log_in(self.password)
+        project = self._session.get_project(project_name)
+        shots = self._session.get_shots(project)
+        self.logger.info(f"Fetched {len(shots)} shots for project: {project_name}")
+        return {key: shots.get(key) for key in shot_keys}
+    
+    def _query_shot(
+        self,
+        shot_info: ShotInfo,
+        project_name: str,
+        result: ProcessingResult,
+        prefetched_shot: Optional[Dict[str, Any]] = None
+    ):
         """Query shot information."""
         try:
-            project = gazu.project.get_project_by_name(project_name)
-            shot = gazu.shot.get_shot_by_name(project, shot_info.shot_name)
+            if prefetched_shot is not None:
+                shot = prefetched_shot
+            else:
+                project = self._session.get_project(project_name)
+                shot = self._session.get_shots(project)[(shot_info.sequence, shot_info.shot_name)]
             
             result.data['shot_info'] = {
                 'id': shot['id'],
@@ -902,7 +1842,7 @@ class KitsuQueryStage(PipelineStage):
     def _query_output_types(self, result: ProcessingResult):
         """Query available output types."""
         try:
-            output_types = gazu.files.all_output_types()
+            output_types = list(self._session.get_output_type_map().values())
             result.data['output_types'] = [
                 {'id': ot['id'], 'name': ot['name'], 'short_name': ot['short_name']}
                 for ot in output_types
@@ -2,14 +2,136 @@
 Stage for color conversion and image transformations using OIIO.
 Handles ACES color conversion, anamorphic desqueeze, and letterboxing.
 """
+import hashlib
+import logging
+import math
+import os
 import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
 from .base import PipelineStage
 from ..models import ProcessingResult, ShotInfo, ImageSequence
 from ..config import PipelineConfig
 
+# Optional: read image headers in-process instead of running oiiotool --info
+try:
+    import OpenImageIO as oiio
+    HAS_OIIO = True
+except ImportError:
+    HAS_OIIO = False
+
+# Optional: bake the color conversion into a LUT
+try:
+    import PyOpenColorIO as ocio
+    HAS_OCIO = True
+except ImportError:
+    HAS_OCIO = False
+
+
+def _baked_color_lut(source_space: str, target_space: str, size: int) -> Optional[Path]:
+    """
+    Get a .cube 3D LUT for an OCIO color conversion, baking it on first use.
+    
+    The LUT is cached under PipelineConfig.COLOR_LUT_CACHE_DIR, named after
+    the OCIO config, color spaces and size, so it's built once and reused
+    by later runs. The source space is log-encoded, so a plain 3D LUT over
+    0-1 input covers it without a shaper.
+    
+    Returns:
+        Path to the LUT, or None if OCIO isn't available or baking failed
+    """
+    if not HAS_OCIO:
+        return None
+    
+    config_path = os.getenv("OCIO", "")
+    key = hashlib.sha1(
+        f"{config_path}|{source_space}|{target_space}|{size}".encode()
+    ).hexdigest()[:16]
+    lut_path = PipelineConfig.COLOR_LUT_CACHE_DIR / f"colorconvert_{key}.cube"
+    if lut_path.exists():
+        return lut_path
+    
+    tmp_path = lut_path.with_name(f"{lut_path.name}.{os.getpid()}.tmp")
+    try:
+        lut_path.parent.mkdir(parents=True, exist_ok=True)
+        baker = ocio.Baker()
+        baker.setConfig(ocio.GetCurrentConfig())
+        baker.setFormat("resolve_cube")
+        baker.setInputSpace(source_space)
+        baker.setTargetSpace(target_space)
+        baker.setCubeSize(size)
+        baker.bake(str(tmp_path))
+        os.replace(tmp_path, lut_path)
+        return lut_path
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return None
+
+
+@lru_cache(maxsize=32)
+def _fit_geometry(
+    input_width: int,
+    input_height: int,
+    target_width: int,
+    target_height: int,
+    squeeze: float
+) -> Tuple[int, int, int, int, int, int]:
+    """
+    Desqueeze, fit and center a plate in the target frame.
+    
+    Cached per resolution class, since every shot from the same camera
+    format gets the same answer.
+    
+    Returns:
+        (desqueezed width, desqueezed height, scaled width, scaled height,
+        letterbox offset x, letterbox offset y)
+    """
+    # Calculate desqueezed dimensions
+    desqueezed_width = int(input_width * squeeze)
+    desqueezed_height = input_height
+    
+    # Determine scaling to fit in target with letterboxing
+    scale_factor = min(
+        target_width / desqueezed_width,
+        target_height / desqueezed_height
+    )
+    
+    scaled_width = int(desqueezed_width * scale_factor)
+    scaled_height = int(desqueezed_height * scale_factor)
+    
+    # Calculate letterbox offsets (center the image)
+    offset_x = (target_width - scaled_width) // 2
+    offset_y = (target_height - scaled_height) // 2
+    
+    return desqueezed_width, desqueezed_height, scaled_width, scaled_height, offset_x, offset_y
+
+
+@lru_cache(maxsize=32)
+def _geometry_args(
+    scaled_width: int,
+    scaled_height: int,
+    target_width: int,
+    target_height: int,
+    offset_x: int,
+    offset_y: int
+) -> Tuple[str, ...]:
+    """Preformatted oiiotool resize/letterbox arguments for one geometry."""
+    return (
+        # Desqueeze and scale to fit the target in one resize (the
+        # squeeze is just a different horizontal scale factor)
+        '--resize', f'{scaled_width}x{scaled_height}',
+        # Create canvas with target dimensions
+        '--create', f'{target_width}x{target_height}', '3',
+        # Paste the scaled image onto the canvas
+        '--paste', f'+{offset_x}+{offset_y}',
+    )
+
 
 class OIIOColorTransformStage(PipelineStage):
     """
@@ -22,6 +144,17 @@ class OIIOColorTransformStage(PipelineStage):
     - Output to EXR format
     """
     
+    # (width, height) by first-frame path and modification time, shared by
+    # every instance so a sequence's header is only read once per process
+    _dimension_cache: Dict[Tuple[str, int], Tuple[int, int]] = {}
+    
+    # Per-thread output buffers reused across frames (OIIO Python API path)
+    _canvases = threading.local()
+    
+    # Output tile edge for the in-process transform (3 * 2^6); the source
+    # region behind one tile stays cache-sized
+    TILE_SIZE = 192
+    
     def __init__(self, oiio_tool_path: Optional[str] = None, **kwargs):
         """
         Initialize the OIIO transform stage.
@@ -31,6 +164,30 @@ class OIIOColorTransformStage(PipelineStage):
         """
         super().__init__(**kwargs)
         self.oiio_tool_path = oiio_tool_path or PipelineConfig.OIIO_TOOL
+        
+        # Constant parts of every oiiotool command, built once
+        self._color_lut = None
+        if PipelineConfig.BAKE_COLOR_LUT:
+            self._color_lut = _baked_color_lut(
+                PipelineConfig.SOURCE_COLORSPACE,
+                PipelineConfig.TARGET_COLORSPACE,
+                PipelineConfig.COLOR_LUT_SIZE
+            )
+            if self._color_lut is None:
+                self.logger.warning("Could not bake color LUT, using --colorconvert")
+        if self._color_lut is not None:
+            self._cc_args = ('--ociofiletransform', str(self._color_lut))
+        else:
+            self._cc_args = (
+                '--colorconvert', PipelineConfig.SOURCE_COLORSPACE, PipelineConfig.TARGET_COLORSPACE
+            )
+        self._out_args = (
+            '--compression', PipelineConfig.OUTPUT_COMPRESSION,
+            '-d', PipelineConfig.OUTPUT_BIT_DEPTH
+        )
+        tile = PipelineConfig.OUTPUT_TILE_SIZE
+        if tile:
+            self._out_args += ('--tile', str(tile), str(tile))
     
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -42,16 +199,71 @@ class OIIOColorTransformStage(PipelineStage):
             **kwargs: Additional arguments
                 - input_sequence: ImageSequence object or dict (required)
                 - output_dir: Override output directory
-                - parallel_jobs: Number of parallel processes (default: 4)
+                - parallel_jobs: Frames oiiotool processes at once (default: 4)
         """
-        if not self.validate_inputs(shot_info, result):
+        job = self._prepare_job(shot_info, result, **kwargs)
+        if job is None:
             return
         
+        self._run_jobs([job])
+        self._finalize_job(shot_info, job, result)
+    
+    def process_batch(
+        self,
+        shot_infos: List[ShotInfo],
+        results: List[ProcessingResult],
+        kwargs_list: List[Dict[str, Any]]
+    ):
+        """
+        Transform several shots with as few oiiotool processes as possible.
+        
+        Shots covering the same frame range share one oiiotool invocation
+        (each frame step transforms that frame of every shot), so process
+        startup and the OCIO config load happen once per group rather than
+        once per shot. If a shared run fails, the shots it left incomplete
+        are re-run on their own so one bad shot can't fail the others.
+        
+        Args:
+            shot_infos: Shot information objects
+            results: ProcessingResult objects to populate (one per shot)
+            kwargs_list: Per-shot arguments, as for process()
+        """
+        prepared = []
+        for shot_info, result, shot_kwargs in zip(shot_infos, results, kwargs_list):
+            job = self._prepare_job(shot_info, result, **shot_kwargs)
+            if job is not None:
+                prepared.append((shot_info, job, result))
+        
+        by_range = {}
+        for entry in prepared:
+            sequence = entry[1]['input_sequence']
+            by_range.setdefault((sequence.first_frame, sequence.last_frame), []).append(entry)
+        
+        for entries in by_range.values():
+            jobs = [job for _, job, _ in entries]
+            if not self._run_jobs(jobs) and len(jobs) > 1:
+                for job in jobs:
+                    if job['output_sequence'].missing_frames():
+                        self._run_jobs([job])
+            
+            for shot_info, job, result in entries:
+                self._finalize_job(shot_info, job, result)
+    
+    def _prepare_job(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs) -> Optional[dict]:
+        """
+        Validate inputs, create the output directory and work out the geometry.
+        
+        Returns:
+            Job dict for _run_jobs(), or None if the shot can't be processed
+        """
+        if not self.validate_inputs(shot_info, result):
+            return None
+        
         # Get input sequence
         input_seq_data = kwargs.get('input_sequence')
         if not input_seq_data:
             result.add_error("Input sequence not provided")
-            return
+            return None
         
         # Convert dict to ImageSequence if needed
         if isinstance(input_seq_data, dict):
@@ -69,12 +281,11 @@ class OIIOColorTransformStage(PipelineStage):
         output_dir = kwargs.get('output_dir')
         if output_dir is None:
             # Create temp directory for this stage (will be organized later)
-            from tempfile import mkdtemp
-            output_dir = Path(mkdtemp(prefix=f"{shot_info.shot_name}_oiio_"))
+            output_dir = PipelineConfig.get_temp_root() / f"{shot_info.shot_name}_oiio"
         
         output_dir = Path(output_dir)
         if not self.create_directory(output_dir, result):
-            return
+            return None
         
         # Create output sequence using new naming convention
         # Temporary filenames - will be renamed by ShotTreeOrganizationStage
@@ -91,122 +302,122 @@ class OIIOColorTransformStage(PipelineStage):
         self.logger.info(f"Input: {input_sequence.full_pattern}")
         self.logger.info(f"Output: {output_sequence.full_pattern}")
         
-        # Process frames
-        parallel_jobs = kwargs.get('parallel_jobs', 4)
-        success = self._process_frames(
-            input_sequence=input_sequence,
-            output_sequence=output_sequence,
-            shot_info=shot_info,
-            result=result,
-            parallel_jobs=parallel_jobs
-        )
+        # Get input and output dimensions
+        input_width, input_height = self._get_input_dimensions(input_sequence, result)
+        if input_width is None:
+            return None
         
-        if success:
-            # Verify output
-            existing_frames = output_sequence.verify_exists()
-            expected_frames = output_sequence.total_frames
-            
-            if len(existing_frames) != expected_frames:
-                result.add_error(
-                    f"Only {len(existing_frames)} of {expected_frames} frames were created"
-                )
-            else:
-                result.data['output_sequence'] = output_sequence.to_dict()
-                result.data['frames_processed'] = len(existing_frames)
-                
-                # Update shot_info
-                shot_info.output_plates_path = output_dir
+        return {
+            'input_sequence': input_sequence,
+            'output_sequence': output_sequence,
+            'output_dir': output_dir,
+            'geometry': self._compute_geometry(input_width, input_height),
+            'parallel_jobs': kwargs.get('parallel_jobs', 4),
+        }
     
-    def _process_frames(
-        self,
-        input_sequence: ImageSequence,
-        output_sequence: ImageSequence,
-        shot_info: ShotInfo,
-        result: ProcessingResult,
-        parallel_jobs: int = 4
-    ) -> bool:
+    def _run_jobs(self, jobs: List[dict]) -> bool:
         """
-        Process all frames in the sequence.
+        Run one oiiotool process over every frame of the given jobs.
+        
+        All jobs must cover the same frame range. --frames expands the %0Nd
+        patterns and --parallel-frames spreads frames across threads,
+        instead of starting a process per frame.
         
         Args:
-            input_sequence: Input image sequence
-            output_sequence: Output image sequence
-            shot_info: Shot information
-            result: Result object
-            parallel_jobs: Number of parallel processes
+            jobs: Jobs from _prepare_job()
             
         Returns:
-            True if successful, False otherwise
+            True if oiiotool exited cleanly (outputs are checked separately)
         """
-        # Build oiiotool command
-        # We'll process all frames in a single command for efficiency
+        first_sequence = jobs[0]['input_sequence']
+        cmd = self._command_head(
+            frames=(first_sequence.first_frame, first_sequence.last_frame),
+            parallel_jobs=max(job['parallel_jobs'] for job in jobs)
+        )
+        for i, job in enumerate(jobs):
+            if i:
+                # Drop the previous shot's result from the image stack
+                cmd.append('--pop')
+            cmd += self._transform_args(
+                str(job['input_sequence'].full_pattern),
+                str(job['output_sequence'].full_pattern),
+                **job['geometry']
+            )
+        self.logger.debug(f"OIIO command: {' '.join(cmd)}")
         
-        # Get input and output dimensions
-        input_width, input_height = self._get_input_dimensions(input_sequence, result)
-        if input_width is None:
-            return False
+        try:
+            self._run_oiiotool(cmd)
+            return True
+        except subprocess.CalledProcessError as e:
+            # Frames written before the failure are still picked up
+            self.logger.error(f"OIIO processing failed for {first_sequence.full_pattern}: {e.stderr}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error running oiiotool: {str(e)}")
+        return False
+    
+    def _finalize_job(self, shot_info: ShotInfo, job: dict, result: ProcessingResult):
+        """Check a job's output frames and record them on the result."""
+        output_sequence = job['output_sequence']
+        missing = output_sequence.missing_frames()
+        if missing:
+            for frame in missing:
+                result.add_error(f"Frame {frame} failed")
+            result.add_error(
+                f"Only {output_sequence.total_frames - len(missing)} of "
+                f"{output_sequence.total_frames} frames were created"
+            )
+            return
+        
+        result.data['output_sequence'] = output_sequence.to_dict()
+        result.data['frames_processed'] = output_sequence.total_frames
         
-        # Calculate desqueezed dimensions
-        desqueezed_width = int(input_width * PipelineConfig.ANAMORPHIC_SQUEEZE)
-        desqueezed_height = input_height
+        # Update shot_info
+        shot_info.output_plates_path = job['output_dir']
+    
+    def _compute_geometry(self, input_width: int, input_height: int) -> Dict[str, int]:
+        """
+        Work out the desqueeze, scale and letterbox geometry for a plate size.
         
+        Args:
+            input_width: Source frame width
+            input_height: Source frame height
+            
+        Returns:
+            Keyword arguments for _process_single_frame()
+        """
         # Calculate letterbox dimensions
         target_width = PipelineConfig.TARGET_WIDTH
         target_height = PipelineConfig.TARGET_HEIGHT
         
-        # Determine scaling to fit in target with letterboxing
-        scale_factor = min(
-            target_width / desqueezed_width,
-            target_height / desqueezed_height
+        (
+            desqueezed_width, desqueezed_height,
+            scaled_width, scaled_height,
+            offset_x, offset_y
+        ) = _fit_geometry(
+            input_width, input_height,
+            target_width, target_height,
+            PipelineConfig.ANAMORPHIC_SQUEEZE
         )
         
-        scaled_width = int(desqueezed_width * scale_factor)
-        scaled_height = int(desqueezed_height * scale_factor)
-        
-        # Calculate letterbox offsets (center the image)
-        offset_x = (target_width - scaled_width) // 2
-        offset_y = (target_height - scaled_height) // 2
-        
         self.logger.info(f"Input dimensions: {input_width}x{input_height}")
         self.logger.info(f"Desqueezed dimensions: {desqueezed_width}x{desqueezed_height}")
         self.logger.info(f"Scaled dimensions: {scaled_width}x{scaled_height}")
         self.logger.info(f"Target dimensions: {target_width}x{target_height}")
         self.logger.info(f"Letterbox offset: ({offset_x}, {offset_y})")
         
-        # Process each frame
-        errors = []
-        for frame in range(input_sequence.first_frame, input_sequence.last_frame + 1):
-            input_file = input_sequence.get_frame_path(frame)
-            output_file = output_sequence.get_frame_path(frame)
-            
-            if not self._process_single_frame(
-                input_file=input_file,
-                output_file=output_file,
-                desqueezed_width=desqueezed_width,
-                desqueezed_height=desqueezed_height,
-                scaled_width=scaled_width,
-                scaled_height=scaled_height,
-                target_width=target_width,
-                target_height=target_height,
-                offset_x=offset_x,
-                offset_y=offset_y,
-                result=result
-            ):
-                errors.append(f"Frame {frame} failed")
-        
-        if errors:
-            for error in errors:
-                result.add_error(error)
-            return False
-        
-        return True
+        return {
+            'scaled_width': scaled_width,
+            'scaled_height': scaled_height,
+            'target_width': target_width,
+            'target_height': target_height,
+            'offset_x': offset_x,
+            'offset_y': offset_y,
+        }
     
     def _process_single_frame(
         self,
         input_file: Path,
         output_file: Path,
-        desqueezed_width: int,
-        desqueezed_height: int,
         scaled_width: int,
         scaled_height: int,
         target_width: int,
@@ -218,43 +429,41 @@ class OIIOColorTransformStage(PipelineStage):
         """
         Process a single frame.
         
+        Uses the OpenImageIO Python API when it's installed (no oiiotool
+        process per frame), otherwise runs oiiotool.
+        
         Returns:
             True if successful, False otherwise
         """
-        cmd = [
-            self.oiio_tool_path,
+        if HAS_OIIO:
+            return self._process_single_frame_api(
+                input_file,
+                output_file,
+                scaled_width=scaled_width,
+                scaled_height=scaled_height,
+                target_width=target_width,
+                target_height=target_height,
+                offset_x=offset_x,
+                offset_y=offset_y
+            )
+        
+        cmd = self._build_command(
             str(input_file),
-            # Color space conversion
-            '--colorconvert', PipelineConfig.SOURCE_COLORSPACE, PipelineConfig.TARGET_COLORSPACE,
-            # Desqueeze (resize with aspect ratio correction)
-            '--resize', f'{desqueezed_width}x{desqueezed_height}',
-            # Scale to fit target
-            '--resize', f'{scaled_width}x{scaled_height}',
-            # Create canvas with target dimensions
-            '--create', f'{target_width}x{target_height}', '3',
-            # Paste the scaled image onto the canvas
-            '--paste', f'+{offset_x}+{offset_y}',
-            # Set output format and compression
-            '--compression', PipelineConfig.OUTPUT_COMPRESSION,
-            '-d', PipelineConfig.OUTPUT_BIT_DEPTH,
-            '-o', str(output_file)
-        ]
+            str(output_file),
+            scaled_width=scaled_width,
+            scaled_height=scaled_height,
+            target_width=target_width,
+            target_height=target_height,
+            offset_x=offset_x,
+            offset_y=offset_y
+        )
         
         # Log the command being executed
         self.logger.debug(f"OIIO command: {' '.join(cmd)}")
         
         try:
             # Run the actual oiiotool command
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if process.stdout:
-                self.logger.debug(f"OIIO output: {process.stdout}")
-            
+            self._run_oiiotool(cmd)
             return True
             
         except subprocess.CalledProcessError as e:
@@ -264,6 +473,197 @@ class OIIOColorTransformStage(PipelineStage):
             self.logger.error(f"Unexpected error processing {input_file}: {str(e)}")
             return False
     
+    def _run_oiiotool(self, cmd: List[str]):
+        """
+        Run an oiiotool command, keeping stderr for error reports.
+        
+        stdout is only ever logged at debug level, so unless debug logging
+        is on it goes to /dev/null instead of through a pipe this process
+        has to drain.
+        
+        Raises:
+            subprocess.CalledProcessError: If oiiotool exits with an error
+        """
+        log_output = self.logger.isEnabledFor(logging.DEBUG)
+        process = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE if log_output else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True
+        )
+        if process.stdout:
+            self.logger.debug(f"OIIO output: {process.stdout}")
+    
+    def _process_single_frame_api(
+        self,
+        input_file: Path,
+        output_file: Path,
+        scaled_width: int,
+        scaled_height: int,
+        target_width: int,
+        target_height: int,
+        offset_x: int,
+        offset_y: int
+    ) -> bool:
+        """
+        Transform one frame in-process with ImageBufAlgo.
+        
+        Same operations as the oiiotool command, done one output tile at a
+        time: each tile color converts only the source region it resamples
+        (plus the filter's reach) and resizes it straight into a buffer of
+        the final size, so the full-resolution converted frame is never
+        materialized. The output buffers are kept per thread and reused
+        between frames instead of reallocated.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            source = oiio.ImageBuf(str(input_file))
+            src = source.spec()
+            resized = self._buffer('resized', scaled_width, scaled_height)
+            
+            # Source pixels per output pixel, and the resize filter's reach
+            # in source pixels (lanczos3, the default when downsizing, spans
+            # 3 output pixels either side)
+            scale_x = src.width / scaled_width
+            scale_y = src.height / scaled_height
+            halo_x = int(math.ceil(3 * scale_x)) + 1
+            halo_y = int(math.ceil(3 * scale_y)) + 1
+            
+            tile = self.TILE_SIZE
+            for y0 in range(0, scaled_height, tile):
+                y1 = min(y0 + tile, scaled_height)
+                src_y0 = max(0, int(y0 * scale_y) - halo_y)
+                src_y1 = min(src.height, int(math.ceil(y1 * scale_y)) + halo_y)
+                for x0 in range(0, scaled_width, tile):
+                    x1 = min(x0 + tile, scaled_width)
+                    src_x0 = max(0, int(x0 * scale_x) - halo_x)
+                    src_x1 = min(src.width, int(math.ceil(x1 * scale_x)) + halo_x)
+                    
+                    src_roi = oiio.ROI(
+                        src.x + src_x0, src.x + src_x1,
+                        src.y + src_y0, src.y + src_y1,
+                        0, 1, 0, 3
+                    )
+                    if self._color_lut is not None:
+                        converted = oiio.ImageBufAlgo.ociofiletransform(
+                            source, str(self._color_lut), roi=src_roi
+                        )
+                    else:
+                        converted = oiio.ImageBufAlgo.colorconvert(
+                            source,
+                            PipelineConfig.SOURCE_COLORSPACE,
+                            PipelineConfig.TARGET_COLORSPACE,
+                            roi=src_roi
+                        )
+                    if not oiio.ImageBufAlgo.resize(
+                        resized, converted, roi=oiio.ROI(x0, x1, y0, y1, 0, 1, 0, 3)
+                    ):
+                        self.logger.error(f"OIIO processing failed for {input_file}: {resized.geterror()}")
+                        return False
+            
+            canvas = self._buffer('canvas', target_width, target_height)
+            oiio.ImageBufAlgo.zero(canvas)
+            if not oiio.ImageBufAlgo.paste(canvas, offset_x, offset_y, 0, 0, resized):
+                self.logger.error(f"OIIO processing failed for {input_file}: {canvas.geterror()}")
+                return False
+            
+            canvas.set_write_format(PipelineConfig.OUTPUT_BIT_DEPTH)
+            if PipelineConfig.OUTPUT_TILE_SIZE:
+                tile = PipelineConfig.OUTPUT_TILE_SIZE
+                canvas.set_write_tiles(tile, tile)
+            if not canvas.write(str(output_file)):
+                self.logger.error(f"OIIO processing failed for {input_file}: {canvas.geterror()}")
+                return False
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Unexpected error processing {input_file}: {str(e)}")
+            return False
+    
+    def _buffer(self, name: str, width: int, height: int) -> "oiio.ImageBuf":
+        """Get this thread's named RGB float buffer of the given size, creating it once."""
+        buffer = getattr(self._canvases, name, None)
+        if buffer is None or (buffer.spec().width, buffer.spec().height) != (width, height):
+            spec = oiio.ImageSpec(width, height, 3, "float")
+            spec.attribute("compression", PipelineConfig.OUTPUT_COMPRESSION)
+            buffer = oiio.ImageBuf(spec)
+            setattr(self._canvases, name, buffer)
+        return buffer
+    
+    def _build_command(
+        self,
+        input_path: str,
+        output_path: str,
+        scaled_width: int,
+        scaled_height: int,
+        target_width: int,
+        target_height: int,
+        offset_x: int,
+        offset_y: int,
+        frames: Optional[Tuple[int, int]] = None,
+        parallel_jobs: int = 1
+    ) -> List[str]:
+        """
+        Build the oiiotool command line for one frame or a frame range.
+        
+        Args:
+            input_path: Input file, or %0Nd pattern when frames is given
+            output_path: Output file, or %0Nd pattern when frames is given
+            frames: (first, last) frame range to expand the patterns over
+            parallel_jobs: Frames processed at once for a frame range
+            
+        Returns:
+            Command as an argument list
+        """
+        return self._command_head(frames, parallel_jobs) + self._transform_args(
+            input_path,
+            output_path,
+            scaled_width=scaled_width,
+            scaled_height=scaled_height,
+            target_width=target_width,
+            target_height=target_height,
+            offset_x=offset_x,
+            offset_y=offset_y
+        )
+    
+    def _command_head(
+        self,
+        frames: Optional[Tuple[int, int]] = None,
+        parallel_jobs: int = 1
+    ) -> List[str]:
+        """oiiotool executable plus the frame range options."""
+        cmd = [self.oiio_tool_path]
+        if frames is not None:
+            cmd += ['--frames', f'{frames[0]}-{frames[1]}']
+            if parallel_jobs > 1:
+                cmd += ['--parallel-frames', '--threads', str(parallel_jobs)]
+        return cmd
+    
+    def _transform_args(
+        self,
+        input_path: str,
+        output_path: str,
+        scaled_width: int,
+        scaled_height: int,
+        target_width: int,
+        target_height: int,
+        offset_x: int,
+        offset_y: int
+    ) -> List[str]:
+        """Arguments that read, transform and write one image (or pattern)."""
+        return [
+            input_path,
+            *self._cc_args,
+            *_geometry_args(
+                scaled_width, scaled_height, target_width, target_height, offset_x, offset_y
+            ),
+            *self._out_args,
+            '-o', output_path
+        ]
+    
     def _get_input_dimensions(
         self,
         input_sequence: ImageSequence,
@@ -278,10 +678,29 @@ class OIIOColorTransformStage(PipelineStage):
         # Get first frame
         first_frame_path = input_sequence.get_frame_path(input_sequence.first_frame)
         
-        if not first_frame_path.exists():
+        try:
+            cache_key = (str(first_frame_path), first_frame_path.stat().st_mtime_ns)
+        except OSError:
             result.add_error(f"First frame does not exist: {first_frame_path}")
             return None, None
         
+        cached = self._dimension_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if HAS_OIIO:
+            image = oiio.ImageInput.open(str(first_frame_path))
+            if image is None:
+                result.add_error(f"Failed to get input dimensions: {oiio.geterror()}")
+                return None, None
+            try:
+                spec = image.spec()
+                dimensions = (spec.width, spec.height)
+            finally:
+                image.close()
+            self._dimension_cache[cache_key] = dimensions
+            return dimensions
+        
         # Use oiiotool to get info
         cmd = [self.oiio_tool_path, '--info', str(first_frame_path)]
         
@@ -2,14 +2,70 @@
 Stage for generating proxy movie files using FFmpeg.
 Creates sRGB movie files from EXR sequences.
 """
+import asyncio
+import os
 import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from .base import PipelineStage
 from ..models import ProcessingResult, ShotInfo, ImageSequence
 from ..config import PipelineConfig
 
+# Optional: decode and color-convert EXRs in-process instead of in FFmpeg
+try:
+    import numpy as np
+    import OpenImageIO as oiio
+    HAS_OIIO_PYTHON = True
+except ImportError:
+    HAS_OIIO_PYTHON = False
+
+
+# Hardware H.264 encoders, in order of preference
+HW_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox')
+
+
+@lru_cache(maxsize=None)
+def detect_hw_encoder(ffmpeg_path: str) -> Optional[str]:
+    """
+    Find a working hardware H.264 encoder for this ffmpeg build.
+    
+    An encoder being listed by `ffmpeg -encoders` only means it was compiled
+    in, so each candidate is confirmed with a one-frame test encode. The
+    result is cached per ffmpeg binary.
+    
+    Args:
+        ffmpeg_path: Path to ffmpeg
+        
+    Returns:
+        Encoder name (e.g. 'h264_nvenc'), or None if only software is available
+    """
+    try:
+        listing = subprocess.run(
+            [ffmpeg_path, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=30
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    for encoder in HW_ENCODERS:
+        if encoder not in listing:
+            continue
+        try:
+            probe = subprocess.run(
+                [ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+                 '-frames:v', '1', '-c:v', encoder, '-f', 'null', '-'],
+                capture_output=True, timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if probe.returncode == 0:
+            return encoder
+    return None
+
 
 class ProxyGenerationStage(PipelineStage):
     """
@@ -19,15 +75,34 @@ class ProxyGenerationStage(PipelineStage):
     review and editorial purposes.
     """
     
-    def __init__(self, ffmpeg_path: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        ffmpeg_path: Optional[str] = None,
+        use_hw_encoder: bool = True,
+        decode_in_python: bool = False,
+        **kwargs
+    ):
         """
         Initialize the proxy generation stage.
         
         Args:
             ffmpeg_path: Path to ffmpeg (uses config default if None)
+            use_hw_encoder: Use NVENC/QSV/VideoToolbox when available
+            decode_in_python: Decode and color-convert EXRs with the
+                OpenImageIO Python bindings (multithreaded, OCIO-accurate)
+                and pipe raw frames to FFmpeg. Requires OpenImageIO and numpy.
         """
         super().__init__(**kwargs)
         self.ffmpeg_path = ffmpeg_path or PipelineConfig.FFMPEG_TOOL
+        self.decode_in_python = decode_in_python and HAS_OIIO_PYTHON
+        if decode_in_python and not HAS_OIIO_PYTHON:
+            self.logger.warning("OpenImageIO/numpy not available, decoding EXRs with FFmpeg")
+        self.video_codec = PipelineConfig.PROXY_CODEC
+        if use_hw_encoder:
+            hw_encoder = detect_hw_encoder(self.ffmpeg_path)
+            if hw_encoder:
+                self.video_codec = hw_encoder
+                self.logger.info(f"Using hardware encoder: {hw_encoder}")
     
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -43,14 +118,38 @@ class ProxyGenerationStage(PipelineStage):
                 - resolution: Override resolution (default: 1920x1080)
                 - crf: Quality setting 0-51, lower is better (default: 18)
         """
-        if not self.validate_inputs(shot_info, result):
+        job = self._prepare_job(shot_info, result, **kwargs)
+        if job is None:
             return
         
+        success = self._generate_proxy(result=result, **job)
+        self._finalize_job(shot_info, job['output_file'], success, result)
+    
+    def _prepare_job(
+        self,
+        shot_info: ShotInfo,
+        result: ProcessingResult,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve input sequence, output path and encode settings for a shot.
+        
+        Args:
+            shot_info: Shot information
+            result: Result object to populate
+            **kwargs: Stage arguments (see process())
+            
+        Returns:
+            Keyword arguments for _generate_proxy(), or None on error
+        """
+        if not self.validate_inputs(shot_info, result):
+            return None
+        
         # Get input sequence
         input_seq_data = kwargs.get('input_sequence')
         if not input_seq_data:
             result.add_error("Input sequence not provided")
-            return
+            return None
         
         # Convert dict to ImageSequence if needed
         if isinstance(input_seq_data, dict):
@@ -67,12 +166,11 @@ class ProxyGenerationStage(PipelineStage):
         # Setup output directory - use temp directory (will be organized later)
         output_dir = kwargs.get('output_dir')
         if output_dir is None:
-            from tempfile import mkdtemp
-            output_dir = Path(mkdtemp(prefix=f"{shot_info.shot_name}_proxy_"))
+            output_dir = PipelineConfig.get_temp_root() / f"{shot_info.shot_name}_proxy"
         
         output_dir = Path(output_dir)
         if not self.create_directory(output_dir, result):
-            return
+            return None
         
         # Create output file path using new naming convention
         proxy_filename = shot_info.get_proxy_filename(
@@ -85,20 +183,22 @@ class ProxyGenerationStage(PipelineStage):
         self.logger.info(f"Input: {input_sequence.full_pattern}")
         self.logger.info(f"Output: {output_file}")
         
-        # Generate proxy
-        framerate = kwargs.get('framerate', 24)
-        resolution = kwargs.get('resolution', '1920x1080')
-        crf = kwargs.get('crf', PipelineConfig.PROXY_CRF)
-        
-        success = self._generate_proxy(
-            input_sequence=input_sequence,
-            output_file=output_file,
-            framerate=framerate,
-            resolution=resolution,
-            crf=crf,
-            result=result
-        )
-        
+        return {
+            'input_sequence': input_sequence,
+            'output_file': output_file,
+            'framerate': kwargs.get('framerate', 24),
+            'resolution': kwargs.get('resolution', '1920x1080'),
+            'crf': kwargs.get('crf', PipelineConfig.PROXY_CRF),
+        }
+    
+    def _finalize_job(
+        self,
+        shot_info: ShotInfo,
+        output_file: Path,
+        success: bool,
+        result: ProcessingResult
+    ):
+        """Record the generated proxy on the result and shot info."""
         if success:
             if output_file.exists():
                 file_size_mb = output_file.stat().st_size / (1024 * 1024)
@@ -110,17 +210,96 @@ class ProxyGenerationStage(PipelineStage):
             else:
                 result.add_error(f"Proxy file was not created: {output_file}")
     
-    def _generate_proxy(
+    def process_batch(
+        self,
+        shot_infos: List[ShotInfo],
+        results: List[ProcessingResult],
+        kwargs_list: List[Dict[str, Any]]
+    ):
+        """Generate proxies for several shots with concurrent FFmpeg processes."""
+        if self.decode_in_python:
+            # Frames are decoded in this process; encode one shot at a time
+            super().process_batch(shot_infos, results, kwargs_list)
+            return
+        asyncio.run(self.process_batch_async(shot_infos, results, kwargs_list))
+    
+    async def process_batch_async(
+        self,
+        shot_infos: List[ShotInfo],
+        results: List[ProcessingResult],
+        kwargs_list: List[Dict[str, Any]],
+        max_parallel: Optional[int] = None
+    ):
+        """
+        Generate proxies for several shots, supervising the FFmpeg
+        processes from a single thread.
+        
+        Args:
+            shot_infos: Shot information objects
+            results: Result objects to populate (one per shot)
+            kwargs_list: Per-shot stage arguments (see process())
+            max_parallel: Maximum concurrent encodes (default: CPU count)
+        """
+        cpu_count = os.cpu_count() or 1
+        max_parallel = max_parallel or cpu_count
+        semaphore = asyncio.Semaphore(max_parallel)
+        
+        # Split the cores between concurrent encodes to avoid oversubscription
+        concurrent = max(1, min(max_parallel, len(shot_infos)))
+        threads = max(1, cpu_count // concurrent) if concurrent > 1 else 0
+        
+        async def run_one(shot_info, result, shot_kwargs):
+            job = self._prepare_job(shot_info, result, **shot_kwargs)
+            if job is None:
+                return
+            job['threads'] = threads
+            async with semaphore:
+                success = await self._generate_proxy_async(result=result, **job)
+            self._finalize_job(shot_info, job['output_file'], success, result)
+        
+        outcomes = await asyncio.gather(
+            *[run_one(s, r, k) for s, r, k in zip(shot_infos, results, kwargs_list)],
+            return_exceptions=True
+        )
+        for result, outcome in zip(results, outcomes):
+            if isinstance(outcome, Exception):
+                result.add_error(f"Unexpected error during proxy generation: {str(outcome)}")
+    
+    def _build_video_filter(
+        self,
+        input_sequence: ImageSequence,
+        resolution: str,
+        convert_color: bool = True
+    ) -> str:
+        """
+        Build the FFmpeg -vf filter chain.
+        
+        Args:
+            input_sequence: Input EXR sequence
+            resolution: Output resolution (e.g., '1920x1080')
+            convert_color: Include the colorspace conversion (False when
+                frames were already converted before reaching FFmpeg)
+            
+        Returns:
+            Filter chain string
+        """
+        if not convert_color:
+            return f'scale={resolution}'
+        # Color space conversion from linear to sRGB
+        return f'scale={resolution},colorspace=all=bt709:iall=bt709:fast=1'
+    
+    def _build_command(
         self,
         input_sequence: ImageSequence,
         output_file: Path,
         framerate: int,
         resolution: str,
         crf: int,
-        result: ProcessingResult
-    ) -> bool:
+        threads: int = 0,
+        input_args: Optional[List[str]] = None
+    ) -> List[str]:
         """
-        Generate proxy movie using FFmpeg.
+        Build the FFmpeg command line for a proxy encode.
         
         Args:
             input_sequence: Input EXR sequence
@@ -128,34 +307,114 @@ class ProxyGenerationStage(PipelineStage):
             framerate: Frame rate
             resolution: Output resolution (e.g., '1920x1080')
             crf: Quality setting
-            result: Result object
+            threads: Encoder threads (0 = one per logical core)
+            input_args: Replacement input arguments (e.g. a raw video pipe);
+                frames read this way are assumed to be color converted already
             
         Returns:
-            True if successful, False otherwise
+            Command as an argument list
         """
-        # Build FFmpeg input pattern
-        # FFmpeg uses printf-style formatting
-        input_pattern = str(input_sequence.directory / f"{input_sequence.base_name}.%04d.{input_sequence.extension}")
+        if input_args is None:
+            # Build FFmpeg input pattern
+            # FFmpeg uses printf-style formatting
+            input_pattern = str(input_sequence.directory / f"{input_sequence.base_name}.%04d.{input_sequence.extension}")
+            input_args = [
+                '-start_number', str(input_sequence.first_frame),
+                '-framerate', str(framerate),
+                '-i', input_pattern,
+            ]
+            video_filter = self._build_video_filter(input_sequence, resolution)
+        else:
+            video_filter = self._build_video_filter(input_sequence, resolution, convert_color=False)
+
+        hw_device_args = []
+        if self.video_codec == 'h264_nvenc':
+            # Hand frames to NVENC as CUDA surfaces instead of system memory
+            video_filter += ',format=nv12,hwupload_cuda'
+            hw_device_args = ['-init_hw_device', 'cuda=cuda', '-filter_hw_device', 'cuda']
         
-        # Build FFmpeg command
-        cmd = [
+        return [
             self.ffmpeg_path,
             '-y',  # Overwrite output file
-            '-start_number', str(input_sequence.first_frame),
-            '-framerate', str(framerate),
-            '-i', input_pattern,
+            *hw_device_args,
+            *input_args,
             '-frames:v', str(input_sequence.total_frames),
-            # Color space conversion from linear to sRGB
-            '-vf', f'scale={resolution},colorspace=all=bt709:iall=bt709:fast=1',
-            '-pix_fmt', 'yuv420p',
+            '-vf', video_filter,
             # Encoding settings
-            '-c:v', PipelineConfig.PROXY_CODEC,
-            '-preset', PipelineConfig.PROXY_PRESET,
-            '-crf', str(crf),
+            *self._encoder_args(crf, threads),
             # Metadata
             '-metadata', f'comment=Proxy for {input_sequence.base_name}',
             str(output_file)
         ]
+    
+    def _encoder_args(self, crf: int, threads: int) -> List[str]:
+        """
+        Build the encoder arguments for the selected video codec.
+        
+        Hardware encoders don't take -crf, so the quality setting is mapped
+        onto each encoder's own constant-quality option.
+        
+        Args:
+            crf: Quality setting (libx264 CRF scale)
+            threads: Encoder threads (0 = one per logical core)
+            
+        Returns:
+            Argument list
+        """
+        codec = self.video_codec
+        if codec == 'h264_nvenc':
+            # Pixel format is set by the hwupload_cuda filter tail
+            return ['-c:v', codec,
+                    '-preset', 'p4', '-rc', 'vbr', '-cq', str(crf), '-b:v', '0']
+        if codec == 'h264_qsv':
+            return ['-pix_fmt', 'nv12', '-c:v', codec,
+                    '-preset', PipelineConfig.PROXY_PRESET, '-global_quality', str(crf)]
+        if codec == 'h264_videotoolbox':
+            # VideoToolbox quality runs 1-100, higher is better
+            return ['-pix_fmt', 'yuv420p', '-c:v', codec,
+                    '-q:v', str(max(1, min(100, 100 - 2 * crf)))]
+        
+        args = ['-pix_fmt', 'yuv420p', '-c:v', codec,
+                '-preset', PipelineConfig.PROXY_PRESET,
+                '-crf', str(crf),
+                '-threads', str(threads)]
+        if codec == 'libx264':
+            # Slice threading keeps every core busy on a single encode
+            x264_threads = threads or 'auto'
+            args += ['-x264-params', f'sliced-threads=1:threads={x264_threads}:lookahead-threads=2']
+        return args
+    
+    def _generate_proxy(
+        self,
+        input_sequence: ImageSequence,
+        output_file: Path,
+        framerate: int,
+        resolution: str,
+        crf: int,
+        result: ProcessingResult,
+        threads: int = 0
+    ) -> bool:
+        """
+        Generate proxy movie using FFmpeg.
+        
+        Args:
+            input_sequence: Input EXR sequence
+            output_file: Output movie file
+            framerate: Frame rate
+            resolution: Output resolution (e.g., '1920x1080')
+            crf: Quality setting
+            result: Result object
+            threads: Encoder threads (0 = one per logical core)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.decode_in_python:
+            return self._generate_proxy_piped(
+                input_sequence, output_file, framerate, resolution, crf, result, threads
+            )
+        
+        cmd = self._build_command(input_sequence, output_file, framerate, resolution, crf, threads)
         
         self.logger.debug(f"Running command: {' '.join(cmd)}")
         
@@ -185,6 +444,144 @@ class ProxyGenerationStage(PipelineStage):
             result.add_error(f"Unexpected error during proxy generation: {str(e)}")
             return False
     
+    def _generate_proxy_piped(
+        self,
+        input_sequence: ImageSequence,
+        output_file: Path,
+        framerate: int,
+        resolution: str,
+        crf: int,
+        result: ProcessingResult,
+        threads: int = 0
+    ) -> bool:
+        """
+        Generate proxy by decoding EXRs with OpenImageIO and piping raw
+        planar float frames to FFmpeg's stdin.
+        
+        OpenImageIO's EXR reader is multithreaded and its color conversion
+        goes through OCIO, so FFmpeg only scales and encodes.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        first_path = input_sequence.get_frame_str(input_sequence.first_frame)
+        spec = oiio.ImageBuf(first_path).spec()
+        
+        cmd = self._build_command(
+            input_sequence, output_file, framerate, resolution, crf, threads,
+            input_args=[
+                '-f', 'rawvideo',
+                '-pix_fmt', 'gbrpf32le',
+                '-s', f'{spec.width}x{spec.height}',
+                '-framerate', str(framerate),
+                '-i', 'pipe:0',
+            ]
+        )
+        
+        self.logger.debug(f"Running command: {' '.join(cmd)}")
+        
+        # stderr goes to a file so a chatty FFmpeg can't block our writes
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file
+                )
+            except FileNotFoundError:
+                result.add_error(f"FFmpeg not found at: {self.ffmpeg_path}")
+                return False
+            
+            try:
+                for frame in range(input_sequence.first_frame, input_sequence.last_frame + 1):
+                    buf = oiio.ImageBuf(input_sequence.get_frame_str(frame))
+                    if buf.nchannels > 3:
+                        buf = oiio.ImageBufAlgo.channels(buf, (0, 1, 2))
+                    buf = oiio.ImageBufAlgo.colorconvert(
+                        buf,
+                        PipelineConfig.TARGET_COLORSPACE,
+                        PipelineConfig.PROXY_OCIO_COLORSPACE
+                    )
+                    if buf.has_error:
+                        raise RuntimeError(f"Frame {frame}: {buf.geterror()}")
+                    
+                    pixels = buf.get_pixels(oiio.FLOAT)
+                    np.clip(pixels, 0.0, 1.0, out=pixels)
+                    # Interleaved RGB -> planar G, B, R as gbrpf32le expects
+                    planes = np.ascontiguousarray(pixels.transpose(2, 0, 1)[[1, 2, 0]])
+                    proc.stdin.write(memoryview(planes))
+                
+                proc.stdin.close()
+                returncode = proc.wait(timeout=3600)
+                
+            except BrokenPipeError:
+                # FFmpeg exited early; its stderr explains why
+                returncode = proc.wait()
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                result.add_error("FFmpeg timed out")
+                return False
+            except Exception as e:
+                proc.kill()
+                proc.wait()
+                result.add_error(f"Unexpected error during proxy generation: {str(e)}")
+                return False
+            
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors='replace')
+                result.add_error(f"FFmpeg failed: {stderr}")
+                return False
+        
+        self.logger.info(f"Proxy generated: {output_file}")
+        return True
+    
+    async def _generate_proxy_async(
+        self,
+        input_sequence: ImageSequence,
+        output_file: Path,
+        framerate: int,
+        resolution: str,
+        crf: int,
+        result: ProcessingResult,
+        threads: int = 0
+    ) -> bool:
+        """
+        Asyncio version of _generate_proxy(), for concurrent batch encodes.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        cmd = self._build_command(input_sequence, output_file, framerate, resolution, crf, threads)
+        
+        self.logger.debug(f"Running command: {' '.join(cmd)}")
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            result.add_error(f"FFmpeg not found at: {self.ffmpeg_path}")
+            return False
+        
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=3600)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            result.add_error("FFmpeg timed out")
+            return False
+        
+        if proc.returncode != 0:
+            result.add_error(f"FFmpeg failed: {stderr.decode(errors='replace')}")
+            return False
+        
+        self.logger.info(f"Proxy generated: {output_file}")
+        return True
+    
     def validate_inputs(self, shot_info: ShotInfo, result: ProcessingResult) -> bool:
         """Validate inputs."""
         if not super().validate_inputs(shot_info, result):
@@ -200,72 +597,24 @@ class BurnInProxyStage(ProxyGenerationStage):
     Adds timecode, frame numbers, shot name, etc. to the proxy.
     """
     
-    def _generate_proxy(
+    def _build_video_filter(
         self,
         input_sequence: ImageSequence,
-        output_file: Path,
-        framerate: int,
         resolution: str,
-        crf: int,
-        result: ProcessingResult
-    ) -> bool:
+        convert_color: bool = True
+    ) -> str:
         """
-        Generate proxy with burned-in metadata.
+        Build the filter chain with burned-in metadata.
         
         Adds drawtext filter to overlay information.
         """
-        input_pattern = str(input_sequence.directory / f"{input_sequence.base_name}.%04d.{input_sequence.extension}")
-        
-        # Build text overlay
-        # Format: "SHOT_NAME | Frame: %{frame_num} | TC: HH:MM:SS:FF"
+        # Build text overlay: shot name and frame number on two lines of a
+        # single drawtext, so each frame goes through one text filter
         text_filter = (
-            f"drawtext=text='{input_sequence.base_name}':x=10:y=10:fontsize=24:fontcolor=white:box=1:boxcolor=black@0.5,"
-            f"drawtext=text='Frame\\: %{{frame_num}}':x=10:y=40:fontsize=20:fontcolor=white:box=1:boxcolor=black@0.5"
+            f"drawtext=text='{input_sequence.base_name}\nFrame\\: %{{frame_num}}'"
+            f":x=10:y=10:fontsize=22:line_spacing=8:fontcolor=white:box=1:boxcolor=black@0.5"
         )
         
         # Combine with scale and colorspace filters
-        vf_filter = f'scale={resolution},colorspace=all=bt709:iall=bt709:fast=1,{text_filter}'
-        
-        cmd = [
-            self.ffmpeg_path,
-            '-y',
-            '-start_number', str(input_sequence.first_frame),
-            '-framerate', str(framerate),
-            '-i', input_pattern,
-            '-frames:v', str(input_sequence.total_frames),
-            '-vf', vf_filter,
-            '-pix_fmt', 'yuv420p',
-            '-c:v', PipelineConfig.PROXY_CODEC,
-            '-preset', PipelineConfig.PROXY_PRESET,
-            '-crf', str(crf),
-            '-metadata', f'comment=Proxy for {input_sequence.base_name}',
-            str(output_file)
-        ]
-        
-        self.logger.debug(f"Running command: {' '.join(cmd)}")
-        
-        try:
-            # Run the actual FFmpeg command
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=3600
-            )
-            
-            self.logger.info(f"Burn-in proxy generated: {output_file}")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            result.add_error(f"FFmpeg failed: {e.stderr}")
-            return False
-        except FileNotFoundError:
-            result.add_error(f"FFmpeg not found at: {self.ffmpeg_path}")
-            return False
-        except subprocess.TimeoutExpired:
-            result.add_error("FFmpeg timed out")
-            return False
-        except Exception as e:
-            result.add_error(f"Error during burn-in proxy generation: {str(e)}")
-            return False
\ No newline at end of file
+        base_filter = super()._build_video_filter(input_sequence, resolution, convert_color)
+        return f'{base_filter},{text_filter}'
@@ -2,16 +2,222 @@
 Stage for converting Sony Venice 2 raw footage to DPX.
 Uses WSL interop to call Windows Sony tool from Linux/WSL.
 """
+import atexit
+import hashlib
+import json
 import os
+import queue
+import re
 import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .base import PipelineStage
 from ..models import ProcessingResult, ShotInfo, ImageSequence
 from ..config import PipelineConfig
 
 
+# /mnt/<drive> or /mnt/<drive>/...
+_MNT_RE = re.compile(r'^/mnt/[a-zA-Z](?:/|$)')
+_BACKSLASH = chr(92)
+
+# Distro name used in \\wsl$\<distro> paths
+_WSL_DISTRO = os.environ.get('WSL_DISTRO_NAME', 'Ubuntu')
+
+
+# Marker written after each job of a batched PowerShell run: "JOB_DONE <index> <exit code>"
+_JOB_DONE_RE = re.compile(r'^JOB_DONE (\d+) (-?\d+)\s*$', re.MULTILINE)
+
+
+# Batch runner, written once and run with powershell -File. Jobs come from a
+# JSON manifest ({"jobs": [[arg, ...], ...]}), so nothing is quoted into a
+# command string and PowerShell parses the script only once.
+_BATCH_SCRIPT = """param([string]$Tool, [string]$Manifest)
+$jobs = (Get-Content -Raw -LiteralPath $Manifest | ConvertFrom-Json).jobs
+for ($i = 0; $i -lt $jobs.Count; $i++) {
+    & $Tool @($jobs[$i])
+    Write-Output "JOB_DONE $i $LASTEXITCODE"
+}
+"""
+
+
+def _make_windows_path_translator(distro: str) -> Callable[[str], str]:
+    """
+    Build a memoized Linux-to-Windows path converter for one WSL distro.
+    
+    Prefixes are formatted once up front; the returned function handles
+    /mnt/<drive> paths by slicing and falls back to \\\\wsl$\\<distro> for
+    everything else. Results are cached since the same output directories
+    come up for every frame pattern and job of a batch.
+    """
+    wsl_prefix = f"{_BACKSLASH * 2}wsl${_BACKSLASH}{distro}"
+    
+    @lru_cache(maxsize=1024)
+    def translate(path_str: str) -> str:
+        if _MNT_RE.match(path_str):
+            # /mnt/c/... -> C:\...
+            return f"{path_str[5].upper()}:{_BACKSLASH}{path_str[7:].replace('/', _BACKSLASH)}"
+        # WSL internal path -> \\wsl$\<distro>\...
+        return wsl_prefix + path_str.replace('/', _BACKSLASH)
+    
+    return translate
+
+
+# One translator (and cache) per distro, shared by all stage instances
+_to_win_for_distro = lru_cache(maxsize=None)(_make_windows_path_translator)
+
+
+# C:\<rest> (either slash) -> drive letter and remainder
+_WIN_DRIVE_RE = re.compile(r'^([a-zA-Z]):[\\/]?(.*)$')
+
+
+def _windows_to_wsl_path(win_path: str) -> str:
+    """
+    Convert a Windows drive path to its WSL mount path.
+    
+    C:\\Program Files\\...  -> /mnt/c/Program Files/...
+    
+    Paths without a drive letter are returned unchanged.
+    """
+    match = _WIN_DRIVE_RE.match(win_path)
+    if not match:
+        return win_path
+    drive, rest = match.groups()
+    return f"/mnt/{drive.lower()}/{rest.replace(_BACKSLASH, '/')}"
+
+
+@lru_cache(maxsize=None)
+def _is_wsl() -> bool:
+    """Check if running in Windows Subsystem for Linux (read once per process)."""
+    if os.name == 'nt':
+        return False
+    try:
+        with open('/proc/version', 'r') as f:
+            version = f.read().lower()
+            return 'microsoft' in version or 'wsl' in version
+    except OSError:
+        return False
+
+
+def _ps_quote(arg: str) -> str:
+    """Quote an argument as a literal PowerShell string."""
+    if re.fullmatch(r'[\w.:-]+', arg):
+        return arg
+    return "'" + arg.replace("'", "''") + "'"
+
+
+class _PowerShellSession:
+    """
+    A long-lived powershell.exe that runs commands fed through stdin.
+    
+    Each command is followed by a sentinel line carrying $LASTEXITCODE, and
+    output is read until the sentinel shows up. PowerShell (and WSL
+    interop) start once for the session instead of once per batch.
+    """
+    
+    def __init__(self, logger, tail_lines: int = 50):
+        self.logger = logger
+        self.tail_lines = tail_lines
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        _live_sessions.add(self)
+    
+    def _start(self):
+        self._process = subprocess.Popen(
+            ['powershell.exe', '-NoProfile', '-NonInteractive', '-NoExit', '-Command', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors='replace',
+            bufsize=1
+        )
+        self._lines = queue.Queue()
+        
+        def drain(stream, lines):
+            for line in stream:
+                lines.put(line.rstrip('\r\n'))
+            lines.put(None)
+        
+        threading.Thread(
+            target=drain, args=(self._process.stdout, self._lines), daemon=True
+        ).start()
+    
+    def run(self, command: str, timeout: float) -> Tuple[int, str]:
+        """
+        Run one PowerShell command line and wait for it to finish.
+        
+        Returns:
+            Tuple of (exit code, tail of the output)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command outlived the timeout
+                (the session is killed and restarted on next use)
+            RuntimeError: If PowerShell exited unexpectedly
+        """
+        if self._process is None or self._process.poll() is not None:
+            self._start()
+        
+        sentinel = f"==DONE=={uuid.uuid4().hex}"
+        self._process.stdin.write(f'{command}; Write-Output "{sentinel} $LASTEXITCODE"\n')
+        self._process.stdin.flush()
+        
+        tail = deque(maxlen=self.tail_lines)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.close(force=True)
+                raise subprocess.TimeoutExpired(command, timeout)
+            if line is None:
+                self._process = None
+                raise RuntimeError(f"PowerShell exited unexpectedly: {' | '.join(tail)}")
+            if line.startswith(sentinel):
+                code = line[len(sentinel):].strip()
+                return (int(code) if code.lstrip('-').isdigit() else 1), "\n".join(tail)
+            self.logger.debug(line)
+            tail.append(line[-4096:])
+    
+    def close(self, force: bool = False):
+        """Ask PowerShell to exit (or kill it)."""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            if force:
+                process.kill()
+            else:
+                process.stdin.write("exit\n")
+                process.stdin.flush()
+            process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+# Every PowerShell session still referenced somewhere, closed at exit. Weak
+# so that exiting doesn't keep discarded stages and their sessions alive.
+_live_sessions: "weakref.WeakSet[_PowerShellSession]" = weakref.WeakSet()
+
+
+def _close_live_sessions():
+    """Shut down PowerShell sessions left open at interpreter exit."""
+    for session in list(_live_sessions):
+        session.close()
+
+
+atexit.register(_close_live_sessions)
+
+
 class SonyRawConversionStage(PipelineStage):
     """
     Convert Sony Venice 2 MXF raw footage to DPX sequence.
@@ -23,7 +229,20 @@ class SonyRawConversionStage(PipelineStage):
     # Default Windows path to Sony tool
     DEFAULT_TOOL_PATH = r"C:\Program Files\Sony\RAW Viewer\rawexporter.exe"
     
-    def __init__(self, sony_tool_path: Optional[str] = None, bake_colorspace: str = "SGAMUT3_LINEAR", **kwargs):
+    # Sidecar recording a completed conversion (see _is_converted)
+    MANIFEST_NAME = ".ded_manifest.json"
+    
+    # Lines of tool output kept for error messages
+    OUTPUT_TAIL_LINES = 50
+    
+    def __init__(
+        self,
+        sony_tool_path: Optional[str] = None,
+        bake_colorspace: str = "SGAMUT3_LINEAR",
+        max_parallel: int = 2,
+        persistent_shell: bool = False,
+        **kwargs
+    ):
         """
         Initialize the Sony conversion stage.
         
@@ -32,25 +251,31 @@ class SonyRawConversionStage(PipelineStage):
             bake_colorspace: Output colorspace for bake mode. Options:
                 - ALL, INPUT, SGAMUT_LINEAR, SGAMUT_SLOG2
                 - ACES_LINEAR, SGAMUT3_LINEAR, SGAMUT3_SLOG3, SGAMUT3CINE_SLOG3
+            max_parallel: Conversions run at once in batch mode (kept low,
+                the tool shares one GPU decoder)
+            persistent_shell: Under WSL, keep PowerShell sessions alive and
+                reuse them for every batch (closed by close() or at exit)
         """
         super().__init__(**kwargs)
         self.sony_tool_path = sony_tool_path or self.DEFAULT_TOOL_PATH
         self.bake_colorspace = bake_colorspace
-        self.is_wsl = self._detect_wsl()
+        self.max_parallel = max(1, max_parallel)
+        self._batch_script: Optional[str] = None
+        self._batch_script_lock = threading.Lock()
+        self.persistent_shell = persistent_shell
+        self._shells: "queue.Queue[_PowerShellSession]" = queue.Queue()
+        self._all_shells: List[_PowerShellSession] = []
+        self.is_wsl = _is_wsl()
+        self._to_win = _to_win_for_distro(_WSL_DISTRO)
+        self._tool_verified: Optional[bool] = None
         
         if self.is_wsl:
             self.logger.info("Running in WSL - will use interop to call Windows tool")
-    
-    def _detect_wsl(self) -> bool:
-        """Check if running in Windows Subsystem for Linux."""
-        if os.name == 'nt':
-            return False
-        try:
-            with open('/proc/version', 'r') as f:
-                version = f.read().lower()
-                return 'microsoft' in version or 'wsl' in version
-        except:
-            return False
+            # The tool path is fixed, so check it once here rather than per shot
+            self._tool_wsl_path = _windows_to_wsl_path(self.sony_tool_path)
+            self._tool_verified = os.path.exists(self._tool_wsl_path)
+            if not self._tool_verified:
+                self.logger.warning(f"Sony RAW Converter not found at: {self.sony_tool_path}")
     
     def _to_windows_path(self, linux_path: Path) -> str:
         """
@@ -59,18 +284,9 @@ class SonyRawConversionStage(PipelineStage):
         /mnt/c/Users/... -> C:\\Users\\...
         /home/user/...   -> \\\\wsl$\\Ubuntu\\home\\user\\...
         """
-        path_str = str(linux_path.resolve())
-        
-        if path_str.startswith('/mnt/'):
-            # /mnt/c/... -> C:\...
-            parts = path_str.split('/')
-            drive = parts[2].upper()
-            rest = '\\'.join(parts[3:])
-            return f"{drive}:\\{rest}"
-        else:
-            # WSL internal path -> \\wsl$\<distro>\...
-            distro = os.environ.get('WSL_DISTRO_NAME', 'Ubuntu')
-            return f"\\\\wsl$\\{distro}{path_str.replace('/', '\\')}"
+        # Resolve symlinks even for absolute paths: ~/footage -> /mnt/d/footage
+        # must map to D:\footage, not to the much slower \\wsl$ share
+        return self._to_win(str(linux_path.resolve()))
     
     def process(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs):
         """
@@ -83,13 +299,88 @@ class SonyRawConversionStage(PipelineStage):
                 - output_dir: Override output directory
                 - dpx_bit_depth: Bit depth for DPX (default: 16)
         """
-        if not self.validate_inputs(shot_info, result):
+        job = self._prepare_job(shot_info, result, **kwargs)
+        if job is None:
             return
         
+        if job['cached']:
+            self._finalize_job(shot_info, job, result)
+            return
+        
+        # Run conversion with start_index to match pipeline frame numbering
+        success = self._run_sony_conversion(
+            source_file=job['source_file'],
+            output_pattern=job['output_pattern'],
+            in_frame=job['in_frame'],
+            out_frame=job['out_frame'],
+            bit_depth=job['bit_depth'],
+            result=result,
+            start_index=job['start_index']
+        )
+        
+        if success:
+            self._finalize_job(shot_info, job, result)
+    
+    def process_batch(
+        self,
+        shot_infos: List[ShotInfo],
+        results: List[ProcessingResult],
+        kwargs_list: List[Dict[str, Any]]
+    ):
+        """
+        Convert several shots with a single tool session (see run_batch).
+        
+        Args:
+            shot_infos: Shot information objects
+            results: ProcessingResult objects to populate (one per shot)
+            kwargs_list: Per-shot arguments, as for process()
+        """
+        prepared = []
+        for shot_info, result, shot_kwargs in zip(shot_infos, results, kwargs_list):
+            job = self._prepare_job(shot_info, result, **shot_kwargs)
+            if job is None:
+                continue
+            if job['cached']:
+                self._finalize_job(shot_info, job, result)
+            else:
+                prepared.append((shot_info, job, result))
+        
+        if not prepared:
+            return
+        
+        # run_batch takes one bit depth; group jobs in the rare case they differ
+        by_depth = {}
+        for entry in prepared:
+            by_depth.setdefault(entry[1]['bit_depth'], []).append(entry)
+        
+        for bit_depth, entries in by_depth.items():
+            successes = self.run_batch(
+                [
+                    (job['source_file'], job['output_pattern'],
+                     job['in_frame'], job['out_frame'], job['start_index'])
+                    for _, job, _ in entries
+                ],
+                [result for _, _, result in entries],
+                bit_depth=bit_depth
+            )
+            for (shot_info, job, result), success in zip(entries, successes):
+                if success:
+                    self._finalize_job(shot_info, job, result)
+    
+    def _prepare_job(self, shot_info: ShotInfo, result: ProcessingResult, **kwargs) -> Optional[dict]:
+        """
+        Validate inputs, create the output directory and work out frame ranges.
+        
+        Returns:
+            Job dict for _run_sony_conversion()/run_batch(), or None on error
+        """
+        if not self.validate_inputs(shot_info, result):
+            return None
+        
         # Verify source file exists
         source_file = shot_info.source_raw_path
         if not self.verify_file_exists(source_file, result):
-            return
+            return None
         
         # Setup output directory
         output_dir = kwargs.get('output_dir')
@@ -98,7 +389,7 @@ class SonyRawConversionStage(PipelineStage):
         
         output_dir = Path(output_dir)
         if not self.create_directory(output_dir, result):
-            return
+            return None
         
         # Calculate frame range with handles
         in_frame = shot_info.editorial_info.in_point - PipelineConfig.HEAD_HANDLE_FRAMES
@@ -112,51 +403,115 @@ class SonyRawConversionStage(PipelineStage):
         # Build output pattern
         output_pattern = output_dir / f"{shot_info.shot_name}.%04d.dpx"
         
+        bit_depth = kwargs.get('dpx_bit_depth', 16)
+        
+        # Create ImageSequence object matching the output
+        dpx_sequence = ImageSequence(
+            directory=output_dir,
+            base_name=shot_info.shot_name,
+            extension="dpx",
+            first_frame=output_first_frame,
+            last_frame=output_last_frame,
+            frame_padding=4  # We specified --digits 4
+        )
+        
+        job = {
+            'source_file': source_file,
+            'output_dir': output_dir,
+            'output_pattern': output_pattern,
+            'in_frame': in_frame,
+            'out_frame': out_frame,
+            'start_index': output_first_frame,
+            'last_frame': output_last_frame,
+            'frame_count': frame_count,
+            'bit_depth': bit_depth,
+            'dpx_sequence': dpx_sequence,
+        }
+        job['signature'] = self._job_signature(job)
+        job['cached'] = self._is_converted(job)
+        
+        if job['cached']:
+            self.logger.info(f"DPX frames already converted for {shot_info.shot_name}, skipping conversion")
+            return job
+        
         self.logger.info(f"Converting {source_file} to DPX")
         self.logger.info(f"Source frame range: {in_frame}-{out_frame} ({frame_count} frames)")
         self.logger.info(f"Output frame range: {output_first_frame}-{output_last_frame}")
         self.logger.info(f"Output pattern: {output_pattern}")
         
-        # Run conversion with start_index to match pipeline frame numbering
-        success = self._run_sony_conversion(
-            source_file=source_file,
-            output_pattern=output_pattern,
-            in_frame=in_frame,
-            out_frame=out_frame,
-            bit_depth=kwargs.get('dpx_bit_depth', 16),
-            result=result,
-            start_index=output_first_frame
+        return job
+    
+    def _job_signature(self, job: dict) -> str:
+        """
+        Hash everything that determines a conversion's output.
+        
+        Covers the tool, its arguments and the source file's size and
+        modification time, so a changed flag or a replaced clip invalidates
+        earlier output.
+        """
+        stat = job['source_file'].stat()
+        output_base = job['output_pattern'].stem.replace('.%04d', '').replace('.%d', '')
+        args = self._tool_args(
+            str(job['source_file']), str(job['output_dir']), output_base,
+            job['in_frame'], job['out_frame'], job['bit_depth'], job['start_index']
         )
+        key = json.dumps([self.sony_tool_path, stat.st_size, stat.st_mtime_ns] + args)
+        return hashlib.sha256(key.encode()).hexdigest()
+    
+    def _is_converted(self, job: dict) -> bool:
+        """Check whether a previous run already produced this job's output."""
+        try:
+            with open(job['output_dir'] / self.MANIFEST_NAME) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
         
-        if success:
-            # Create ImageSequence object matching the output
-            dpx_sequence = ImageSequence(
-                directory=output_dir,
-                base_name=shot_info.shot_name,
-                extension="dpx",
-                first_frame=output_first_frame,
-                last_frame=output_last_frame,
-                frame_padding=4  # We specified --digits 4
-            )
-            
-            # Verify frames were created
-            existing_frames = dpx_sequence.verify_exists()
-            expected_frames = frame_count
+        if manifest.get('signature') != job['signature']:
+            return False
+        return not job['dpx_sequence'].missing_frames()
+    
+    def _finalize_job(self, shot_info: ShotInfo, job: dict, result: ProcessingResult):
+        """Verify the converted frames and record the DPX sequence in the result."""
+        dpx_sequence = job['dpx_sequence']
+        expected_frames = job['frame_count']
+        
+        if job['cached']:
+            frames_created = expected_frames
+        else:
+            # Verify frames were created (one directory read, names known up front)
+            missing = dpx_sequence.missing_frames()
+            frames_created = expected_frames - len(missing)
             
-            if len(existing_frames) != expected_frames:
+            if missing:
                 result.add_warning(
-                    f"Only {len(existing_frames)} of {expected_frames} frames were created"
+                    f"Only {frames_created} of {expected_frames} frames were created"
                 )
-            
-            result.data['dpx_sequence'] = dpx_sequence.to_dict()
-            result.data['output_dir'] = str(output_dir)
-            result.data['frames_created'] = len(existing_frames)
-            result.data['frame_mapping'] = {
-                'source_in': in_frame,
-                'source_out': out_frame,
-                'output_first': output_first_frame,
-                'output_last': output_last_frame
-            }
+            else:
+                self._write_manifest(job)
+        
+        result.data['dpx_sequence'] = dpx_sequence.to_dict()
+        result.data['output_dir'] = str(job['output_dir'])
+        result.data['frames_created'] = frames_created
+        result.data['conversion_cached'] = job['cached']
+        result.data['frame_mapping'] = {
+            'source_in': job['in_frame'],
+            'source_out': job['out_frame'],
+            'output_first': job['start_index'],
+            'output_last': job['last_frame']
+        }
+    
+    def _write_manifest(self, job: dict):
+        """Record a complete conversion so later runs can skip it."""
+        manifest = {
+            'signature': job['signature'],
+            'frames': job['frame_count'],
+            'converted_at': datetime.now().isoformat()
+        }
+        try:
+            with open(job['output_dir'] / self.MANIFEST_NAME, 'w') as f:
+                json.dump(manifest, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not write conversion manifest: {e}")
     
     def _run_sony_conversion(
         self,
@@ -195,33 +550,18 @@ class SonyRawConversionStage(PipelineStage):
         """Run Sony tool directly (Windows native)."""
         # --output expects base name only (e.g., "sht100"), tool adds frame numbers
         output_base = output_pattern.stem.replace('.%04d', '').replace('.%d', '')
-        cmd = [
-            self.sony_tool_path,
-            '--input', str(source_file),
-            '--dir', str(output_pattern.parent),
-            '--output', output_base,
-            '--in', str(in_frame),
-            '--out', str(out_frame),
-            '--start', str(start_index),
-            '--digits', '4',
-            '--video', 'DPX',
-            '--depth', str(bit_depth),
-            '--bake', self.bake_colorspace,
-            '--display', '1'
-        ]
+        cmd = [self.sony_tool_path] + self._tool_args(
+            str(source_file), str(output_pattern.parent), output_base,
+            in_frame, out_frame, bit_depth, start_index
+        )
         
         self.logger.debug(f"Running: {' '.join(cmd)}")
         
         try:
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600
-            )
+            returncode, output = self._run_tool(cmd, timeout=3600)
             
-            if process.returncode != 0:
-                result.add_error(f"Sony conversion failed: {process.stderr}")
+            if returncode != 0:
+                result.add_error(f"Sony conversion failed: {output}")
                 return False
             
             return True
@@ -246,75 +586,33 @@ class SonyRawConversionStage(PipelineStage):
         result: ProcessingResult,
         start_index: int = 0
     ) -> bool:
-        """Run Sony tool via WSL interop (calling Windows exe from WSL)."""
-        
-        # Convert paths to Windows format
-        win_source = self._to_windows_path(source_file)
-        win_output = self._to_windows_path(output_pattern)
-        
-        # First check if the Sony tool exists
-        check_cmd = [
-            'powershell.exe',
-            '-NoProfile',
-            '-NonInteractive',
-            '-Command',
-            f'Test-Path "{self.sony_tool_path}"'
-        ]
+        """
+        Run Sony tool via WSL interop (calling Windows exe from WSL).
         
-        try:
-            check_result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=10)
-            if 'False' in check_result.stdout:
-                result.add_error(
-                    f"Sony RAW Converter not found at: {self.sony_tool_path}\n"
-                    f"Please install Sony RAW Viewer or set the correct path.\n"
-                    f"Download from: https://www.sony.com/electronics/support/software/raw-viewer"
-                )
-                return False
-        except Exception as e:
-            self.logger.warning(f"Could not verify tool path: {e}")
+        WSL executes Windows binaries straight from their /mnt path, so the
+        tool is exec'd directly rather than through a powershell.exe wrapper.
+        """
+        if not self._tool_verified:
+            self._add_tool_missing_error(result)
+            return False
         
-        # Build PowerShell command
         # rawexporter.exe options from --help
         # --output expects base name only (e.g., "sht100"), tool adds frame numbers
         # --start controls the starting frame number in output filenames
         output_base = output_pattern.stem.replace('.%04d', '').replace('.%d', '')
-        
-        ps_command = (
-            f'& "{self.sony_tool_path}" '
-            f'--input "{win_source}" '
-            f'--dir "{self._to_windows_path(output_pattern.parent)}" '
-            f'--output "{output_base}" '
-            f'--in {in_frame} '
-            f'--out {out_frame} '
-            f'--start {start_index} '
-            f'--digits 4 '
-            f'--video DPX '
-            f'--depth {bit_depth} '
-            f'--bake {self.bake_colorspace} '
-            f'--display 1'
+        cmd = [self._tool_wsl_path] + self._tool_args(
+            self._to_windows_path(source_file),
+            self._to_windows_path(output_pattern.parent),
+            output_base, in_frame, out_frame, bit_depth, start_index
         )
         
-        cmd = [
-            'powershell.exe',
-            '-NoProfile',
-            '-NonInteractive', 
-            '-Command',
-            ps_command
-        ]
-        
-        self.logger.debug(f"WSL interop (PowerShell): {ps_command}")
+        self.logger.debug(f"WSL interop: {' '.join(cmd)}")
         
         try:
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600
-            )
+            returncode, output = self._run_tool(cmd, timeout=3600)
             
-            if process.returncode != 0:
-                error_msg = process.stderr.strip() if process.stderr else process.stdout.strip()
-                result.add_error(f"Sony conversion failed: {error_msg}")
+            if returncode != 0:
+                result.add_error(f"Sony conversion failed: {output.strip()}")
                 return False
             
             return True
@@ -326,6 +624,328 @@ class SonyRawConversionStage(PipelineStage):
             result.add_error(f"WSL interop error: {str(e)}")
             return False
     
+    def _run_tool(
+        self,
+        cmd: List[str],
+        timeout: float,
+        on_line: Optional[Callable[[str], None]] = None
+    ) -> Tuple[int, str]:
+        """
+        Run a command, streaming its output instead of buffering all of it.
+        
+        stdout and stderr are merged and drained line by line on a
+        background thread: each line is logged at debug level (live
+        progress), passed to on_line, and only the last
+        OUTPUT_TAIL_LINES are kept for error messages.
+        
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds to wait before killing the process
+            on_line: Optional callback for every output line
+            
+        Returns:
+            Tuple of (exit code, tail of the output)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the process outlived the timeout
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors='replace'
+        )
+        tail = deque(maxlen=self.OUTPUT_TAIL_LINES)
+        
+        def drain():
+            for line in process.stdout:
+                line = line.rstrip('\r\n')
+                self.logger.debug(line)
+                tail.append(line[-4096:])
+                if on_line:
+                    on_line(line)
+        
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            reader.join()
+            process.stdout.close()
+        
+        return process.returncode, "\n".join(tail)
+    
+    def _get_batch_script(self) -> str:
+        """
+        Write the PowerShell batch runner on first use.
+        
+        Returns:
+            Windows path of the .ps1 script
+        """
+        # Parallel batch groups may get here together
+        with self._batch_script_lock:
+            if self._batch_script is None:
+                script_path = PipelineConfig.get_temp_root() / "sony_convert.ps1"
+                script_path.write_text(_BATCH_SCRIPT)
+                self._batch_script = self._to_windows_path(script_path)
+        return self._batch_script
+    
+    def _add_tool_missing_error(self, result: ProcessingResult):
+        """Report that the Sony tool isn't installed where expected."""
+        result.add_error(
+            f"Sony RAW Converter not found at: {self.sony_tool_path}\n"
+            f"Please install Sony RAW Viewer or set the correct path.\n"
+            f"Download from: https://www.sony.com/electronics/support/software/raw-viewer"
+        )
+    
+    def _tool_args(
+        self,
+        source: str,
+        output_dir: str,
+        output_base: str,
+        in_frame: int,
+        out_frame: int,
+        bit_depth: int,
+        start_index: int
+    ) -> List[str]:
+        """
+        Build rawexporter arguments for one conversion.
+        
+        Args:
+            source: Source clip path (in the tool's path format)
+            output_dir: Output directory (in the tool's path format)
+            output_base: Output base name; the tool adds frame numbers
+            in_frame: First source frame
+            out_frame: Last source frame
+            bit_depth: DPX bit depth
+            start_index: First output frame number
+            
+        Returns:
+            Argument list (without the tool path)
+        """
+        return [
+            '--input', source,
+            '--dir', output_dir,
+            '--output', output_base,
+            '--in', str(in_frame),
+            '--out', str(out_frame),
+            '--start', str(start_index),
+            '--digits', '4',
+            '--video', 'DPX',
+            '--depth', str(bit_depth),
+            '--bake', self.bake_colorspace,
+            '--display', '1'
+        ]
+    
+    def run_batch(
+        self,
+        jobs: List[Tuple[Path, Path, int, int, int]],
+        results: List[ProcessingResult],
+        bit_depth: int = 16
+    ) -> List[bool]:
+        """
+        Run several conversions with as few tool launches as possible.
+        
+        rawexporter takes a single clip per call, so under WSL jobs are
+        chained in one PowerShell script: PowerShell and interop start once
+        per session instead of once per shot. Up to max_parallel sessions
+        run concurrently, each working through its share of the jobs.
+        
+        Args:
+            jobs: (source_file, output_pattern, in_frame, out_frame, start_index)
+                per conversion
+            results: Result object per job, for errors
+            bit_depth: DPX bit depth
+            
+        Returns:
+            Success flag per job
+        """
+        if not jobs:
+            return []
+        
+        workers = min(self.max_parallel, len(jobs))
+        if workers == 1:
+            return self._run_job_group(jobs, results, bit_depth)
+        
+        # Deal jobs round-robin into one group per worker; each group is one
+        # sequential tool session, and the sessions run side by side
+        groups = [list(range(w, len(jobs), workers)) for w in range(workers)]
+        successes = [False] * len(jobs)
+        
+        self.logger.info(f"Running {len(jobs)} Sony conversions, {workers} at a time")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self._run_job_group,
+                    [jobs[i] for i in group],
+                    [results[i] for i in group],
+                    bit_depth
+                ): group
+                for group in groups
+            }
+            for future, group in futures.items():
+                for i, success in zip(group, future.result()):
+                    successes[i] = success
+        
+        return successes
+    
+    def _run_job_group(
+        self,
+        jobs: List[Tuple[Path, Path, int, int, int]],
+        results: List[ProcessingResult],
+        bit_depth: int
+    ) -> List[bool]:
+        """Run jobs one after another in a single tool session where possible."""
+        if not self.is_wsl:
+            return [
+                self._run_native(source, pattern, in_frame, out_frame, bit_depth, result, start)
+                for (source, pattern, in_frame, out_frame, start), result in zip(jobs, results)
+            ]
+        
+        if self.persistent_shell:
+            return self._run_batch_via_shell(jobs, results, bit_depth)
+        
+        return self._run_batch_via_wsl_interop(jobs, results, bit_depth)
+    
+    def _run_batch_via_shell(
+        self,
+        jobs: List[Tuple[Path, Path, int, int, int]],
+        results: List[ProcessingResult],
+        bit_depth: int
+    ) -> List[bool]:
+        """Run jobs through a reused PowerShell session, one command per job."""
+        if not self._tool_verified:
+            for result in results:
+                self._add_tool_missing_error(result)
+            return [False] * len(jobs)
+        
+        # One session per concurrent group; sessions go back to the pool after
+        try:
+            shell = self._shells.get_nowait()
+        except queue.Empty:
+            shell = _PowerShellSession(self.logger, self.OUTPUT_TAIL_LINES)
+            self._all_shells.append(shell)
+        
+        successes = []
+        try:
+            for (source, pattern, in_frame, out_frame, start), result in zip(jobs, results):
+                output_base = pattern.stem.replace('.%04d', '').replace('.%d', '')
+                args = self._tool_args(
+                    self._to_windows_path(source),
+                    self._to_windows_path(pattern.parent),
+                    output_base, in_frame, out_frame, bit_depth, start
+                )
+                command = "& " + " ".join(_ps_quote(a) for a in [self.sony_tool_path] + args)
+                try:
+                    code, output = shell.run(command, timeout=3600)
+                except subprocess.TimeoutExpired:
+                    result.add_error("Sony conversion timed out")
+                    successes.append(False)
+                    continue
+                except Exception as e:
+                    result.add_error(f"WSL interop error: {str(e)}")
+                    successes.append(False)
+                    continue
+                if code != 0:
+                    result.add_error(f"Sony conversion failed (exit code {code}): {output.strip()[-2000:]}")
+                successes.append(code == 0)
+        finally:
+            self._shells.put(shell)
+        
+        return successes
+    
+    def close(self):
+        """Shut down any persistent PowerShell sessions."""
+        for shell in self._all_shells:
+            shell.close()
+        self._all_shells = []
+        self._shells = queue.Queue()
+    
+    def _run_batch_via_wsl_interop(
+        self,
+        jobs: List[Tuple[Path, Path, int, int, int]],
+        results: List[ProcessingResult],
+        bit_depth: int
+    ) -> List[bool]:
+        """Run all jobs from a single PowerShell invocation, reporting per job."""
+        if not self._tool_verified:
+            for result in results:
+                self._add_tool_missing_error(result)
+            return [False] * len(jobs)
+        
+        manifest = {'jobs': []}
+        for source, pattern, in_frame, out_frame, start in jobs:
+            output_base = pattern.stem.replace('.%04d', '').replace('.%d', '')
+            manifest['jobs'].append(self._tool_args(
+                self._to_windows_path(source),
+                self._to_windows_path(pattern.parent),
+                output_base, in_frame, out_frame, bit_depth, start
+            ))
+        
+        try:
+            script_path = self._get_batch_script()
+            fd, manifest_path = tempfile.mkstemp(
+                prefix='sony_jobs_', suffix='.json', dir=PipelineConfig.get_temp_root()
+            )
+            with os.fdopen(fd, 'w') as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            for result in results:
+                result.add_error(f"Could not write Sony batch files: {str(e)}")
+            return [False] * len(jobs)
+        
+        cmd = [
+            'powershell.exe', '-NoProfile', '-NonInteractive',
+            '-ExecutionPolicy', 'Bypass',
+            '-File', script_path,
+            '-Tool', self.sony_tool_path,
+            '-Manifest', self._to_windows_path(Path(manifest_path))
+        ]
+        
+        self.logger.info(f"Running {len(jobs)} Sony conversions in one PowerShell session")
+        self.logger.debug(f"WSL interop (PowerShell batch): {' '.join(cmd)}")
+        
+        # Job markers are picked up as they stream past, so jobs that finished
+        # before a timeout still count
+        exit_codes = {}
+        
+        def on_line(line: str):
+            match = _JOB_DONE_RE.match(line)
+            if match:
+                exit_codes[int(match.group(1))] = int(match.group(2))
+        
+        try:
+            _, output = self._run_tool(cmd, timeout=3600 * len(jobs), on_line=on_line)
+        except subprocess.TimeoutExpired:
+            output = "Sony conversion timed out"
+        except Exception as e:
+            for result in results:
+                result.add_error(f"WSL interop error: {str(e)}")
+            return [False] * len(jobs)
+        finally:
+            os.unlink(manifest_path)
+        
+        error_detail = output.strip()[-2000:]
+        
+        successes = []
+        for index, result in enumerate(results):
+            code = exit_codes.get(index)
+            if code == 0:
+                successes.append(True)
+                continue
+            if code is None:
+                result.add_error(f"Sony conversion did not complete: {error_detail}")
+            else:
+                result.add_error(f"Sony conversion failed (exit code {code}): {error_detail}")
+            successes.append(False)
+        return successes
+    
     def validate_inputs(self, shot_info: ShotInfo, result: ProcessingResult) -> bool:
         """Validate that we have the necessary input data."""
         if not super().validate_inputs(shot_info, result):
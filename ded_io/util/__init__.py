@@ -0,0 +1,3 @@
+"""
+Low-level helpers shared by the pipeline stages.
+"""
@@ -0,0 +1,223 @@
+"""
+Optional io_uring helpers for batched file-system checks and copies.
+
+Uses the liburing Python bindings when they are installed and the kernel
+supports the needed operations (statx needs Linux 5.6+). Every helper
+returns None when io_uring can't be used, so callers fall back to their
+regular code path.
+"""
+import logging
+import os
+from typing import List, Optional, Sequence, Tuple
+
+# Optional: io_uring bindings
+try:
+    import liburing
+    HAS_LIBURING = True
+except ImportError:
+    HAS_LIBURING = False
+
+
+logger = logging.getLogger("pipeline.uring")
+
+# Submission queue size; larger batches are submitted in chunks of this
+QUEUE_DEPTH = 256
+
+# First kernel with IORING_OP_STATX (and IORING_OP_READ/WRITE)
+MIN_KERNEL = (5, 6)
+
+# Most file data held in read buffers per copy submission
+COPY_BATCH_BYTES = 256 * 1024 * 1024
+
+
+def _kernel_version() -> tuple:
+    """Kernel (major, minor) version, or (0, 0) if it can't be read."""
+    try:
+        release = os.uname().release
+        major, minor = release.split('.')[:2]
+        return int(major), int(''.join(c for c in minor if c.isdigit()) or 0)
+    except (AttributeError, ValueError):
+        return 0, 0
+
+
+def is_available() -> bool:
+    """Check whether io_uring can be used in this process."""
+    return HAS_LIBURING and _kernel_version() >= MIN_KERNEL
+
+
+def stat_exists(paths: Sequence[str]) -> Optional[List[bool]]:
+    """
+    Check which paths exist, with batched statx submissions.
+    
+    Submits up to QUEUE_DEPTH statx requests at a time and reaps their
+    completions together, instead of one stat() system call per path.
+    
+    Args:
+        paths: Paths to check
+        
+    Returns:
+        Existence flag per path (in input order), or None if io_uring
+        isn't available or failed
+    """
+    if not is_available():
+        return None
+    
+    exists = [False] * len(paths)
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    try:
+        liburing.io_uring_queue_init(QUEUE_DEPTH, ring, 0)
+    except Exception as e:
+        logger.debug("io_uring setup failed: %s", e)
+        return None
+    
+    try:
+        for start in range(0, len(paths), QUEUE_DEPTH):
+            chunk = paths[start:start + QUEUE_DEPTH]
+            # Buffers must stay alive until their completions are reaped
+            buffers = []
+            for offset, path in enumerate(chunk):
+                sqe = liburing.io_uring_get_sqe(ring)
+                buffer = liburing.statx()
+                buffers.append(buffer)
+                liburing.io_uring_prep_statx(
+                    sqe, liburing.AT_FDCWD, os.fsencode(path), 0,
+                    liburing.STATX_INO, buffer
+                )
+                liburing.io_uring_sqe_set_data64(sqe, start + offset)
+            
+            liburing.io_uring_submit_and_wait(ring, len(chunk))
+            for _ in chunk:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                exists[cqe.user_data] = cqe.res == 0
+                liburing.io_uring_cqe_seen(ring, cqe)
+    except Exception as e:
+        logger.debug("io_uring statx batch failed: %s", e)
+        return None
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    
+    return exists
+
+
+def copy_files(pairs: Sequence[Tuple[str, str]]) -> Optional[List[int]]:
+    """
+    Copy files with batched io_uring read and write submissions.
+    
+    Each file is read into a buffer and written out by a read/write SQE
+    pair, linked so the write only starts once the read has completed. Up
+    to QUEUE_DEPTH / 2 files (and COPY_BATCH_BYTES of data) go to the
+    kernel per submission, instead of several system calls per file.
+    
+    Args:
+        pairs: (source, destination) paths
+        
+    Returns:
+        Bytes written per pair (in input order; -1 where the file wasn't
+        copied and should be retried another way), or None if io_uring
+        isn't available or failed
+    """
+    if not is_available():
+        return None
+    
+    written = [-1] * len(pairs)
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    try:
+        liburing.io_uring_queue_init(QUEUE_DEPTH, ring, 0)
+    except Exception as e:
+        logger.debug("io_uring setup failed: %s", e)
+        return None
+    
+    index = 0
+    try:
+        while index < len(pairs):
+            # (pair index, source fd, dest fd, size, buffer)
+            batch = []
+            batch_bytes = 0
+            try:
+                while index < len(pairs) and len(batch) < QUEUE_DEPTH // 2:
+                    source, dest = pairs[index]
+                    try:
+                        src_fd = os.open(source, os.O_RDONLY)
+                    except OSError:
+                        index += 1
+                        continue
+                    
+                    st = os.fstat(src_fd)
+                    if st.st_size > COPY_BATCH_BYTES:
+                        # Too big to buffer; left to the caller
+                        os.close(src_fd)
+                        index += 1
+                        continue
+                    if batch and batch_bytes + st.st_size > COPY_BATCH_BYTES:
+                        os.close(src_fd)
+                        break
+                    
+                    try:
+                        dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT, 0o666)
+                    except OSError:
+                        os.close(src_fd)
+                        index += 1
+                        continue
+                    
+                    dst_st = os.fstat(dst_fd)
+                    if (dst_st.st_dev, dst_st.st_ino) == (st.st_dev, st.st_ino):
+                        # Destination is a hard link to the source; truncating
+                        # it would wipe the source, so leave it to the caller
+                        os.close(src_fd)
+                        os.close(dst_fd)
+                        index += 1
+                        continue
+                    os.ftruncate(dst_fd, 0)
+                    os.fchmod(dst_fd, st.st_mode & 0o7777)
+                    
+                    batch.append((index, src_fd, dst_fd, st.st_size, bytearray(st.st_size)))
+                    batch_bytes += st.st_size
+                    index += 1
+                
+                _submit_copies(ring, cqe, batch, written)
+            finally:
+                for _, src_fd, dst_fd, _, _ in batch:
+                    os.close(src_fd)
+                    os.close(dst_fd)
+    except Exception as e:
+        logger.debug("io_uring copy batch failed: %s", e)
+        return None
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    
+    return written
+
+
+def _submit_copies(ring, cqe, batch: list, written: List[int]):
+    """Submit one batch of linked read/write pairs and record the bytes written."""
+    submitted = 0
+    for slot, (_, src_fd, dst_fd, size, buffer) in enumerate(batch):
+        if size == 0:
+            written[batch[slot][0]] = 0
+            continue
+        
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_read(sqe, src_fd, buffer, size, 0)
+        liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+        liburing.io_uring_sqe_set_data64(sqe, slot * 2)
+        
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_write(sqe, dst_fd, buffer, size, 0)
+        liburing.io_uring_sqe_set_data64(sqe, slot * 2 + 1)
+        submitted += 2
+    
+    if not submitted:
+        return
+    
+    liburing.io_uring_submit_and_wait(ring, submitted)
+    for _ in range(submitted):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        slot, is_write = divmod(cqe.user_data, 2)
+        pair_index, _, _, size, _ = batch[slot]
+        # A short read cancels its linked write (-ECANCELED), so only a
+        # full write counts as copied
+        if is_write and cqe.res == size:
+            written[pair_index] = size
+        liburing.io_uring_cqe_seen(ring, cqe)
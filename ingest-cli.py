@@ -11,9 +11,13 @@ Usage:
     ingest-cli --batch shots.json
 """
 import argparse
+import os
+import shlex
 import sys
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -25,9 +29,10 @@ try:
     from ded_io import (
         FootageIngestPipeline,
         ingest_shot,
+        ingest_batch,
         PipelineConfig
     )
-    from ded_io.models import EditorialCutInfo, ShotInfo
+    from ded_io.models import EditorialCutInfo, ShotInfo, _handle_consts
 except ImportError as e:
     print("Error: ded_io package not found.")
     print("Make sure you're running this script from the repository root directory.")
@@ -42,21 +47,78 @@ except ImportError as e:
     sys.exit(1)
 
 
-class IngestCLI:
-    """Command-line interface for footage ingest."""
+# Optional: faster JSON parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional: incremental parsing for large batch files
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+# Batch files larger than this are parsed incrementally when ijson is available
+STREAM_BATCH_THRESHOLD = 1024 * 1024
+
+# Shared by every handler _setup_logging installs
+_FMT = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+# Parsed JSON files keyed by (path, mtime_ns, size), so an unchanged file is
+# only parsed once per process
+_JSON_CACHE: Dict[tuple, Any] = {}
+
+
+def _cached_json(path: Path, st: Optional[os.stat_result] = None) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
     
-    def __init__(self):
-        """Initialize CLI."""
-        self.parser = self._create_parser()
-        self.logger = self._setup_logging()
-        self.config = {}
+    Args:
+        path: Path to the JSON file
+        st: Result of an os.stat() already done on path, if any
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file isn't valid JSON
+    """
+    if st is None:
+        st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if key not in _JSON_CACHE:
+        with open(path, 'rb') as f:
+            buf = f.read(st.st_size)
+        if HAS_ORJSON:
+            _JSON_CACHE[key] = orjson.loads(buf)
+        else:
+            _JSON_CACHE[key] = json.loads(buf)
+    return _JSON_CACHE[key]
+
+
+class _ArgFileParser(argparse.ArgumentParser):
+    """ArgumentParser whose @file lines may hold several shell-quoted arguments."""
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser."""
-        parser = argparse.ArgumentParser(
-            description='Footage Ingest Pipeline - Command Line Interface',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
+    def convert_arg_line_to_args(self, arg_line: str) -> List[str]:
+        return shlex.split(arg_line, comments=True)
+
+
+@lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """
+    Create the argument parser.
+    
+    Built once per process and shared; parsing state lives in the returned
+    Namespace, not the parser.
+    """
+    parser = _ArgFileParser(
+        description='Footage Ingest Pipeline - Command Line Interface',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        fromfile_prefix_chars='@',
+        epilog="""
 Examples:
   # Ingest a single shot (uses default naming: task=pla, element=rawPlate, version=1)
   %(prog)s --source /path/to/clip.mxf --sequence sht --shot 100 --in 100 --out 200
@@ -75,185 +137,218 @@ Examples:
   
   # Verbose output
   %(prog)s --source clip.mxf --sequence sht --shot 100 --in 100 --out 200 -v
-            """
-        )
-        
-        # Configuration
-        config_group = parser.add_argument_group('Configuration')
-        config_group.add_argument(
-            '--config', '-c',
-            type=str,
-            help='Path to JSON configuration file (overrides defaults)'
-        )
-        
-        # Shot data (for single shot processing)
-        shot_group = parser.add_argument_group('Shot Data (required for single shot)')
-        shot_group.add_argument(
-            '--source', '-s',
-            type=str,
-            help='Path to source raw footage file'
-        )
-        shot_group.add_argument(
-            '--sequence',
-            type=str,
-            help='Sequence name (e.g., "tst")'
-        )
-        shot_group.add_argument(
-            '--shot',
-            type=str,
-            help='Shot number/name (e.g., "100")'
-        )
-        shot_group.add_argument(
-            '--in', '-i',
-            dest='in_point',
-            type=int,
-            help='Editorial in point (frame number)'
-        )
-        shot_group.add_argument(
-            '--out', '-o',
-            dest='out_point',
-            type=int,
-            help='Editorial out point (frame number)'
-        )
-        
-        # Optional shot data
-        shot_group.add_argument(
-            '--fps',
-            type=float,
-            default=24.0,
-            help='Source frame rate (default: 24.0)'
-        )
-        shot_group.add_argument(
-            '--timecode',
-            type=str,
-            help='Source timecode start (optional)'
-        )
-        
-        # Naming convention options
-        naming_group = parser.add_argument_group('Naming Convention')
-        naming_group.add_argument(
-            '--task',
-            type=str,
-            default='pla',
-            help='Task type abbreviation: pla (plates), rnd (render), cmp (comp), etc. (default: pla)'
-        )
-        naming_group.add_argument(
-            '--element',
-            type=str,
-            default='rawPlate',
-            help='Element name: rawPlate, cleanPlate, bgPlate, etc. (default: rawPlate)'
-        )
-        naming_group.add_argument(
-            '--ver',
-            type=int,
-            default=1,
-            dest='version',
-            metavar='VERSION',
-            help='Version number (default: 1)'
-        )
-        
-        # Batch processing
-        batch_group = parser.add_argument_group('Batch Processing')
-        batch_group.add_argument(
-            '--batch', '-b',
-            type=str,
-            help='Path to JSON file with batch shot data'
-        )
-        
-        # Project settings
-        project_group = parser.add_argument_group('Project Settings')
-        project_group.add_argument(
-            '--project', '-p',
-            type=str,
-            help='Project name (default: from config or "default")'
-        )
-        project_group.add_argument(
-            '--project-id',
-            type=str,
-            help='Kitsu project ID (optional)'
-        )
-        
-        # Output options
-        output_group = parser.add_argument_group('Output Options')
-        output_group.add_argument(
-            '--output-root',
-            type=str,
-            help='Override shot tree root directory (default: /mnt/c/shottree_test)'
-        )
-        output_group.add_argument(
-            '--output-dir',
-            type=str,
-            help='Override output directory'
-        )
-        output_group.add_argument(
-            '--report',
-            type=str,
-            help='Save execution report to file'
-        )
-        
-        # Pipeline options
-        pipeline_group = parser.add_argument_group('Pipeline Options')
-        pipeline_group.add_argument(
-            '--skip-kitsu',
-            action='store_true',
-            help='Skip Kitsu integration stage'
-        )
-        pipeline_group.add_argument(
-            '--skip-cleanup',
-            action='store_true',
-            help='Skip cleanup stage (preserve temp files)'
-        )
-        pipeline_group.add_argument(
-            '--burn-in',
-            action='store_true',
-            help='Use burn-in proxy instead of regular proxy'
-        )
-        
-        # Execution options
-        exec_group = parser.add_argument_group('Execution Options')
-        exec_group.add_argument(
-            '--dry-run',
-            action='store_true',
-            help='Print what would be done without executing'
-        )
-        exec_group.add_argument(
-            '--stop-on-error',
-            action='store_true',
-            default=True,
-            help='Stop pipeline on first error (default: True)'
-        )
-        exec_group.add_argument(
-            '--continue-on-error',
-            action='store_true',
-            help='Continue pipeline even if stages fail'
-        )
-        
-        # Logging
-        log_group = parser.add_argument_group('Logging')
-        log_group.add_argument(
-            '-v', '--verbose',
-            action='store_true',
-            help='Verbose output (DEBUG level)'
-        )
-        log_group.add_argument(
-            '-q', '--quiet',
-            action='store_true',
-            help='Quiet output (ERROR level only)'
-        )
-        log_group.add_argument(
-            '--log-file',
-            type=str,
-            help='Write log to file'
-        )
-        
-        # Version
-        parser.add_argument(
-            '--version',
-            action='version',
-            version='%(prog)s 0.1.0'
-        )
-        
-        return parser
+  
+  # Read shared arguments from a file (shell-quoted, several per line, # comments)
+  %(prog)s @common.args --source clip.mxf --sequence sht --shot 100 --in 100 --out 200
+        """
+    )
+    
+    # Configuration
+    config_group = parser.add_argument_group('Configuration')
+    config_group.add_argument(
+        '--config', '-c',
+        type=str,
+        help='Path to JSON configuration file (overrides defaults)'
+    )
+    
+    # Shot data (for single shot processing)
+    shot_group = parser.add_argument_group('Shot Data (required for single shot)')
+    shot_group.add_argument(
+        '--source', '-s',
+        type=str,
+        help='Path to source raw footage file'
+    )
+    shot_group.add_argument(
+        '--sequence',
+        type=str,
+        help='Sequence name (e.g., "tst")'
+    )
+    shot_group.add_argument(
+        '--shot',
+        type=str,
+        help='Shot number/name (e.g., "100")'
+    )
+    shot_group.add_argument(
+        '--in', '-i',
+        dest='in_point',
+        type=int,
+        help='Editorial in point (frame number)'
+    )
+    shot_group.add_argument(
+        '--out', '-o',
+        dest='out_point',
+        type=int,
+        help='Editorial out point (frame number)'
+    )
+    
+    # Optional shot data
+    shot_group.add_argument(
+        '--fps',
+        type=float,
+        default=24.0,
+        help='Source frame rate (default: 24.0)'
+    )
+    shot_group.add_argument(
+        '--timecode',
+        type=str,
+        help='Source timecode start (optional)'
+    )
+    
+    # Naming convention options
+    naming_group = parser.add_argument_group('Naming Convention')
+    naming_group.add_argument(
+        '--task',
+        type=str,
+        default='pla',
+        help='Task type abbreviation: pla (plates), rnd (render), cmp (comp), etc. (default: pla)'
+    )
+    naming_group.add_argument(
+        '--element',
+        type=str,
+        default='rawPlate',
+        help='Element name: rawPlate, cleanPlate, bgPlate, etc. (default: rawPlate)'
+    )
+    naming_group.add_argument(
+        '--ver',
+        type=int,
+        default=1,
+        dest='version',
+        metavar='VERSION',
+        help='Version number (default: 1)'
+    )
+    
+    # Batch processing
+    batch_group = parser.add_argument_group('Batch Processing')
+    batch_group.add_argument(
+        '--batch', '-b',
+        type=str,
+        help='Path to JSON file with batch shot data'
+    )
+    batch_group.add_argument(
+        '--max-parallel',
+        type=int,
+        default=2,
+        metavar='N',
+        help='Sony conversions to run at once in batch mode (default: 2)'
+    )
+    batch_group.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Worker processes to split a batch across (default: 1, max: CPU count)'
+    )
+    
+    # Project settings
+    project_group = parser.add_argument_group('Project Settings')
+    project_group.add_argument(
+        '--project', '-p',
+        type=str,
+        help='Project name (default: from config or "default")'
+    )
+    project_group.add_argument(
+        '--project-id',
+        type=str,
+        help='Kitsu project ID (optional)'
+    )
+    
+    # Output options
+    output_group = parser.add_argument_group('Output Options')
+    output_group.add_argument(
+        '--output-root',
+        type=str,
+        help='Override shot tree root directory (default: /mnt/c/shottree_test)'
+    )
+    output_group.add_argument(
+        '--output-dir',
+        type=str,
+        help='Override output directory'
+    )
+    output_group.add_argument(
+        '--report',
+        type=str,
+        help='Save execution report to file'
+    )
+    
+    # Pipeline options
+    pipeline_group = parser.add_argument_group('Pipeline Options')
+    pipeline_group.add_argument(
+        '--skip-kitsu',
+        action='store_true',
+        help='Skip Kitsu integration stage'
+    )
+    pipeline_group.add_argument(
+        '--skip-cleanup',
+        action='store_true',
+        help='Skip cleanup stage (preserve temp files)'
+    )
+    pipeline_group.add_argument(
+        '--burn-in',
+        action='store_true',
+        help='Use burn-in proxy instead of regular proxy'
+    )
+    pipeline_group.add_argument(
+        '--use-uring',
+        action='store_true',
+        help='Check and copy frames with batched io_uring calls (needs liburing, Linux 5.6+)'
+    )
+    
+    # Execution options
+    exec_group = parser.add_argument_group('Execution Options')
+    exec_group.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Print what would be done without executing'
+    )
+    exec_group.add_argument(
+        '--stop-on-error',
+        action='store_true',
+        default=True,
+        help='Stop pipeline on first error (default: True)'
+    )
+    exec_group.add_argument(
+        '--continue-on-error',
+        action='store_true',
+        help='Continue pipeline even if stages fail'
+    )
+    
+    # Logging
+    log_group = parser.add_argument_group('Logging')
+    log_group.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Verbose output (DEBUG level)'
+    )
+    log_group.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Quiet output (ERROR level only)'
+    )
+    log_group.add_argument(
+        '--log-file',
+        type=str,
+        help='Write log to file'
+    )
+    
+    # Version
+    parser.add_argument(
+        '--version',
+        action='version',
+        version='%(prog)s 0.1.0'
+    )
+    
+    return parser
+
+
+class IngestCLI:
+    """Command-line interface for footage ingest."""
+    
+    def __init__(self):
+        """Initialize CLI."""
+        self.parser = _get_parser()
+        # Handlers are installed in run() once the logging flags are parsed
+        self.logger = logging.getLogger('ingest_cli')
+        self.config = {}
     
     def _setup_logging(self, verbose=False, quiet=False, log_file=None) -> logging.Logger:
         """Setup logging configuration."""
@@ -266,27 +361,36 @@ Examples:
         
         # Create logger
         logger = logging.getLogger('ingest_cli')
+        
+        # Already set up the same way
+        if (logger.handlers
+                and getattr(logger, '_ded_level', None) == level
+                and getattr(logger, '_ded_file', None) == log_file):
+            return logger
+        
         logger.setLevel(level)
         
         # Remove existing handlers
+        for handler in logger.handlers:
+            handler.close()
         logger.handlers = []
         
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FMT)
         logger.addHandler(console_handler)
         
         # File handler if specified
         if log_file:
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(logging.DEBUG)  # Always debug in file
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_FMT)
             logger.addHandler(file_handler)
         
+        logger._ded_level = level
+        logger._ded_file = log_file
+        
         return logger
     
     def load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
@@ -303,17 +407,16 @@ Examples:
             return {}
         
         config_file = Path(config_path)
-        if not config_file.exists():
-            self.logger.error(f"Config file not found: {config_path}")
-            sys.exit(1)
         
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = _cached_json(config_file)
             
             self.logger.info(f"Loaded configuration from: {config_path}")
             return config
             
+        except FileNotFoundError:
+            self.logger.error(f"Config file not found: {config_path}")
+            sys.exit(1)
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in config file: {str(e)}")
             sys.exit(1)
@@ -332,13 +435,13 @@ Examples:
             List of shot data dictionaries
         """
         batch_file = Path(batch_path)
-        if not batch_file.exists():
-            self.logger.error(f"Batch file not found: {batch_path}")
-            sys.exit(1)
         
         try:
-            with open(batch_file, 'r') as f:
-                batch_data = json.load(f)
+            st = os.stat(batch_file)
+            if HAS_IJSON and st.st_size > STREAM_BATCH_THRESHOLD:
+                batch_data = self._stream_batch_file(batch_file)
+            else:
+                batch_data = _cached_json(batch_file, st)
             
             # Validate format
             if not isinstance(batch_data, list):
@@ -348,6 +451,9 @@ Examples:
             self.logger.info(f"Loaded {len(batch_data)} shots from: {batch_path}")
             return batch_data
             
+        except FileNotFoundError:
+            self.logger.error(f"Batch file not found: {batch_path}")
+            sys.exit(1)
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in batch file: {str(e)}")
             sys.exit(1)
@@ -355,6 +461,27 @@ Examples:
             self.logger.error(f"Failed to load batch file: {str(e)}")
             sys.exit(1)
     
+    def _stream_batch_file(self, batch_file: Path) -> Any:
+        """
+        Parse a large batch file one shot at a time with ijson.
+        
+        Only the parsed shots are held in memory, never the raw file text
+        alongside the whole decoded document.
+        
+        Args:
+            batch_file: Path to batch file
+            
+        Returns:
+            List of shot data dictionaries, or None if the file isn't a JSON array
+        """
+        with open(batch_file, 'rb') as f:
+            # ijson's 'item' prefix silently matches nothing on a non-array
+            head = f.read(4096).lstrip()
+            if not head.startswith(b'['):
+                return None
+            f.seek(0)
+            return list(ijson.items(f, 'item', use_float=True))
+    
     def validate_shot_data(self, args: argparse.Namespace) -> bool:
         """
         Validate that required shot data is provided.
@@ -365,8 +492,14 @@ Examples:
         Returns:
             True if valid, False otherwise
         """
-        required = ['source', 'sequence', 'shot', 'in_point', 'out_point']
-        missing = [field for field in required if not getattr(args, field, None)]
+        required = (
+            ('source', args.source),
+            ('sequence', args.sequence),
+            ('shot', args.shot),
+            ('in_point', args.in_point),
+            ('out_point', args.out_point)
+        )
+        missing = [name for name, value in required if not value]
         
         if missing:
             self.logger.error(f"Missing required arguments: {', '.join(missing)}")
@@ -394,34 +527,37 @@ Examples:
         Args:
             shot_data: Shot data dictionary
         """
-        print("\n" + "="*80)
-        print("SHOT INFORMATION")
-        print("="*80)
-        print(f"Sequence:      {shot_data.get('sequence')}")
-        print(f"Shot:          {shot_data.get('shot')}")
-        print(f"Shot Name:     {shot_data.get('sequence')}{shot_data.get('shot')}")
-        print(f"Source:        {shot_data.get('source_file')}")
-        print(f"In Point:      {shot_data.get('in_point')}")
-        print(f"Out Point:     {shot_data.get('out_point')}")
-        print(f"Duration:      {shot_data.get('out_point') - shot_data.get('in_point') + 1} frames")
-        print(f"FPS:           {shot_data.get('source_fps', 24.0)}")
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append("SHOT INFORMATION")
+        lines.append("="*80)
+        lines.append(f"Sequence:      {shot_data.get('sequence')}")
+        lines.append(f"Shot:          {shot_data.get('shot')}")
+        lines.append(f"Shot Name:     {shot_data.get('sequence')}{shot_data.get('shot')}")
+        lines.append(f"Source:        {shot_data.get('source_file')}")
+        lines.append(f"In Point:      {shot_data.get('in_point')}")
+        lines.append(f"Out Point:     {shot_data.get('out_point')}")
+        lines.append(f"Duration:      {shot_data.get('out_point') - shot_data.get('in_point') + 1} frames")
+        lines.append(f"FPS:           {shot_data.get('source_fps', 24.0)}")
         
         # Naming convention
-        print("\nNaming Convention:")
-        print(f"Task Type:     {shot_data.get('task_type', 'pla')}")
-        print(f"Element:       {shot_data.get('element_name', 'rawPlate')}")
-        print(f"Version:       v{shot_data.get('version', 1):03d}")
+        lines.append("\nNaming Convention:")
+        lines.append(f"Task Type:     {shot_data.get('task_type', 'pla')}")
+        lines.append(f"Element:       {shot_data.get('element_name', 'rawPlate')}")
+        lines.append(f"Version:       v{shot_data.get('version', 1):03d}")
         
         # Calculate digital frame range
         duration = shot_data.get('out_point') - shot_data.get('in_point') + 1
-        first_frame = PipelineConfig.DIGITAL_START_FRAME - PipelineConfig.HEAD_HANDLE_FRAMES
-        last_frame = first_frame + duration + PipelineConfig.HEAD_HANDLE_FRAMES + PipelineConfig.TAIL_HANDLE_FRAMES - 1
-        
-        print(f"\nDigital Frames:")
-        print(f"  First Frame: {first_frame}")
-        print(f"  Last Frame:  {last_frame}")
-        print(f"  Total:       {last_frame - first_frame + 1} frames")
-        print("="*80 + "\n")
+        digital_start, head, tail = _handle_consts()
+        first_frame = digital_start - head
+        last_frame = first_frame + duration + head + tail - 1
+        
+        lines.append(f"\nDigital Frames:")
+        lines.append(f"  First Frame: {first_frame}")
+        lines.append(f"  Last Frame:  {last_frame}")
+        lines.append(f"  Total:       {last_frame - first_frame + 1} frames")
+        lines.append("="*80 + "\n")
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def process_single_shot(self, args: argparse.Namespace) -> Dict[str, Any]:
         """
@@ -514,20 +650,133 @@ Examples:
         if args.dry_run:
             print("DRY RUN - No processing will occur")
             print(f"\nWould process {len(batch_data)} shots:")
-            for i, shot_data in enumerate(batch_data, 1):
-                print(f"  {i}. {shot_data.get('sequence')}{shot_data.get('shot')}")
+            if not args.quiet:
+                sys.stdout.write(''.join(
+                    f"  {i}. {shot_data.get('sequence')}{shot_data.get('shot')}\n"
+                    for i, shot_data in enumerate(batch_data, 1)
+                ))
             return [{'dry_run': True}]
         
-        # Create pipeline
-        pipeline = FootageIngestPipeline(
-            project=project,
-            project_id=project_id,
-            logger=self.logger
-        )
+        # Check every source file up front so shots whose clip is missing
+        # fail here instead of partway through the pipeline
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch_data)
+        indices = []
+        for i, found in enumerate(self._check_batch_sources(batch_data)):
+            if found:
+                indices.append(i)
+            else:
+                source = batch_data[i].get('source_file')
+                self.logger.error(f"Source file not found: {source}")
+                results[i] = {
+                    'shot': batch_data[i].get('shot'),
+                    'success': False,
+                    'error': f"Source file not found: {source}"
+                }
+        
+        if indices:
+            summaries = self._dispatch_batch(
+                [batch_data[i] for i in indices], project, project_id, args
+            )
+            for i, summary in zip(indices, summaries):
+                results[i] = summary
+        
+        return results
+    
+    def _check_batch_sources(self, batch_data: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Check that each shot's source file exists, with the stat calls in parallel.
+        
+        With io_uring enabled the stats go out as one batched statx
+        submission instead of a thread pool. Shots without a source_file
+        entry count as found; the pipeline reports those itself.
+        
+        Args:
+            batch_data: List of shot data dictionaries
+            
+        Returns:
+            Whether each shot's source exists, in input order
+        """
+        def exists(shot_data):
+            source = shot_data.get('source_file')
+            return not source or os.path.exists(source)
+        
+        if len(batch_data) < 2:
+            return [exists(shot_data) for shot_data in batch_data]
+        
+        if PipelineConfig.USE_IO_URING:
+            from ded_io.util import uring
+            sources = [shot_data.get('source_file') for shot_data in batch_data]
+            found = uring.stat_exists([source for source in sources if source])
+            if found is not None:
+                flags = iter(found)
+                return [not source or next(flags) for source in sources]
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(batch_data))) as executor:
+            return list(executor.map(exists, batch_data))
+    
+    def _dispatch_batch(
+        self,
+        batch_data: List[Dict[str, Any]],
+        project: str,
+        project_id: Optional[str],
+        args: argparse.Namespace
+    ) -> List[Dict[str, Any]]:
+        """
+        Run shots through the pipeline, in this process or across --jobs workers.
         
-        # Process batch
-        self.logger.info(f"Processing {len(batch_data)} shots in batch mode")
-        results = pipeline.ingest_batch(batch_data)
+        Args:
+            batch_data: List of shot data dictionaries
+            project: Project name
+            project_id: Kitsu project ID
+            args: Parsed arguments
+            
+        Returns:
+            List of pipeline execution summaries, in input order
+        """
+        jobs = max(1, min(args.jobs, len(batch_data), os.cpu_count() or 1))
+        
+        if jobs == 1:
+            # Create pipeline
+            pipeline = FootageIngestPipeline(
+                project=project,
+                project_id=project_id,
+                logger=self.logger,
+                max_parallel=args.max_parallel
+            )
+            
+            # Process batch
+            self.logger.info(f"Processing {len(batch_data)} shots in batch mode")
+            return pipeline.ingest_batch(batch_data)
+        
+        # Deal shots round-robin to worker processes; each worker still runs
+        # its share as a batch
+        self.logger.info(f"Processing {len(batch_data)} shots in batch mode across {jobs} processes")
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch_data)
+        
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(
+                    ingest_batch,
+                    project,
+                    batch_data[worker::jobs],
+                    project_id,
+                    args.max_parallel
+                ): worker
+                for worker in range(jobs)
+            }
+            for future in as_completed(futures):
+                worker = futures[future]
+                indices = range(worker, len(batch_data), jobs)
+                try:
+                    summaries = future.result()
+                except Exception as e:
+                    self.logger.error(f"Batch worker {worker} failed: {e}")
+                    summaries = [
+                        {'shot': batch_data[i].get('shot'), 'success': False, 'error': str(e)}
+                        for i in indices
+                    ]
+                for i, summary in zip(indices, summaries):
+                    results[i] = summary
         
         return results
     
@@ -541,33 +790,40 @@ Examples:
         if summary.get('dry_run'):
             return
         
-        print("\n" + "="*80)
-        print("EXECUTION SUMMARY")
-        print("="*80)
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append("EXECUTION SUMMARY")
+        lines.append("="*80)
         
         success = summary.get('overall_success', False)
         status = "SUCCESS ✓" if success else "FAILED ✗"
-        print(f"\nStatus: {status}")
-        print(f"Duration: {summary.get('duration_seconds', 0):.2f} seconds")
-        print(f"Stages: {summary.get('successful_stages', 0)}/{summary.get('total_stages', 0)} completed")
+        lines.append(f"\nStatus: {status}")
+        lines.append(f"Duration: {summary.get('duration_seconds', 0):.2f} seconds")
+        lines.append(f"Stages: {summary.get('successful_stages', 0)}/{summary.get('total_stages', 0)} completed")
+        
+        # Shots that never reached the pipeline (missing source, crashed worker)
+        if summary.get('error'):
+            lines.append(f"Shot: {summary.get('shot')}")
+            lines.append(f"Error: {summary['error']}")
         
         # Stage details
-        print("\nStage Results:")
+        lines.append("\nStage Results:")
         for result in summary.get('stage_results', []):
             status_icon = "✓" if result['success'] else "✗"
-            print(f"  {status_icon} {result['stage_name']}: {result['message']}")
+            lines.append(f"  {status_icon} {result['stage_name']}: {result['message']}")
             
             # Errors
             if result.get('errors'):
                 for error in result['errors']:
-                    print(f"      ERROR: {error}")
+                    lines.append(f"      ERROR: {error}")
             
             # Warnings
             if result.get('warnings'):
                 for warning in result['warnings']:
-                    print(f"      WARNING: {warning}")
+                    lines.append(f"      WARNING: {warning}")
         
-        print("="*80 + "\n")
+        lines.append("="*80 + "\n")
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def save_report(self, summary: Dict[str, Any], report_path: str):
         """
@@ -578,8 +834,16 @@ Examples:
             report_path: Path to save report
         """
         try:
-            with open(report_path, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            # Serialize fully first, then write the report in one call
+            if HAS_ORJSON:
+                data = orjson.dumps(
+                    summary,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                )
+            else:
+                data = json.dumps(summary, indent=2, default=str).encode('utf-8')
+            Path(report_path).write_bytes(data)
             
             self.logger.info(f"Report saved to: {report_path}")
             
@@ -595,7 +859,7 @@ Examples:
         """
         args = self.parser.parse_args(argv)
         
-        # Update logging
+        # Setup logging
         self.logger = self._setup_logging(
             verbose=args.verbose,
             quiet=args.quiet,
@@ -608,8 +872,15 @@ Examples:
         # Override SHOT_TREE_ROOT if specified
         if args.output_root:
             PipelineConfig.SHOT_TREE_ROOT = Path(args.output_root)
+            # Also seen by --jobs worker processes
+            os.environ['DED_PIPE_SHOT_TREE_ROOT'] = args.output_root
             self.logger.info(f"Shot tree root overridden to: {args.output_root}")
         
+        if args.use_uring:
+            PipelineConfig.USE_IO_URING = True
+            # Also seen by --jobs worker processes
+            os.environ['DED_PIPE_USE_IO_URING'] = '1'
+        
         # Determine mode
         if args.batch:
             # Batch mode